@@ -0,0 +1,80 @@
+# Request coalescing harness.
+#
+# Fires bursts of simultaneous requests for one stop at a cold cache, like a room full of boards polling on the same
+# cadence, and counts how many feed downloads reach the stub MTA endpoint. With single-flight coalescing in
+# feeds.refresh_feed that count should stay at one per feed however many clients there are:
+#   python bench/bench_coalescing.py [--clients 1,4,16,64] [--stop D19] [--latency 0.05]
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feeds  # noqa: E402
+import fixtures  # noqa: E402
+import handler  # noqa: E402
+import metrics  # noqa: E402
+import stub_server  # noqa: E402
+
+
+# Start clients requests at the same instant and wait for them all. Returns each one's latency in seconds
+def burst(stop_id, clients):
+    barrier = threading.Barrier(clients)
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        barrier.wait()
+        start = time.perf_counter()
+        response = handler.get_departures({'resource': '/{stop_id}', 'path': '/' + stop_id}, None)
+        elapsed = time.perf_counter() - start
+        if response['statusCode'] != 200:
+            raise RuntimeError('{} from get_departures: {}'.format(response['statusCode'], response.get('body')))
+        with lock:
+            latencies.append(elapsed)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count upstream feed fetches as concurrent clients grow')
+    parser.add_argument('--clients', default='1,2,4,8,16,32,64', help='Comma separated burst sizes')
+    parser.add_argument('--size', choices=fixtures.SIZES, default='typical')
+    parser.add_argument('--stop', default='D19')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds of simulated upstream latency per feed')
+    args = parser.parse_args()
+
+    os.environ.setdefault('MTA_API_KEY', 'bench')
+    metrics.ENABLED = False
+    fixtures.ensure_fixtures()
+
+    server, urls = stub_server.start(fixtures.load_fixtures(args.size, int(time.time())), args.latency)
+    mta_urls = list(feeds.FEED_URLS)
+    feeds.FEED_URLS[:] = urls
+    try:
+        stop_feeds = len(feeds.feed_urls_for_stop(args.stop))
+        columns = ['clients', 'feeds', 'fetches', 'per feed', 'p50 ms', 'max ms']
+        print(('{:<8}' + '{:>10}' * (len(columns) - 1)).format(*columns))
+        for clients in [int(clients) for clients in args.clients.split(',')]:
+            feeds.clear_cache()
+            server.requests = 0
+            latencies = burst(args.stop, clients)
+            row = [clients, stop_feeds, server.requests, '{:.1f}'.format(server.requests / stop_feeds)]
+            row += ['{:.2f}'.format(statistics.median(latencies) * 1000), '{:.2f}'.format(max(latencies) * 1000)]
+            print(('{:<8}' + '{:>10}' * (len(columns) - 1)).format(*row))
+    finally:
+        feeds.FEED_URLS[:] = mta_urls
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# Time gtfs_fast.decode against gtfs_realtime_pb2, each building the departure index the handler uses.
+#
+# Runs on whichever protobuf backend is installed - feeds.parse_feed only switches to gtfs_fast on the pure-Python one:
+#   python bench/bench_decoder.py [path/to/feed.pb ...] [--stop D19]
+#   PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python python bench/bench_decoder.py
+# With no feeds given it times the rush hour fixtures. Parity is checked by tests/test_gtfs_fast.py
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import departures  # noqa: E402
+import fixtures  # noqa: E402
+import gtfs_fast  # noqa: E402
+import gtfs_realtime_pb2  # noqa: E402
+from google.protobuf.internal import api_implementation  # noqa: E402
+
+
+def parse_with_protobuf(data):
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.ParseFromString(data)
+    return feed
+
+
+def best_of(fn, repeat, number):
+    return min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark gtfs_fast against gtfs_realtime_pb2')
+    parser.add_argument('feeds', nargs='*', help='Serialized FeedMessage files (default: the rush hour fixtures)')
+    parser.add_argument('--stop', action='append', dest='stops', help='Also bench filtering to this stop id')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=10)
+    args = parser.parse_args()
+
+    paths = args.feeds
+    if not paths:
+        fixtures.ensure_fixtures()
+        paths = [fixtures.fixture_path('rush', name) for name in fixtures.FEED_NAMES]
+    stop_ids = set(args.stops) if args.stops else None
+
+    print('protobuf backend: {}'.format(api_implementation.Type()))
+    print('{:<32} {:>9} {:>12} {:>12} {:>12} {:>8}'.format(
+        'feed', 'bytes', 'protobuf ms', 'fast ms', 'fast+stop ms', 'speedup'))
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        protobuf_s = best_of(lambda: departures.build_index(parse_with_protobuf(data)), args.repeat, args.number)
+        fast_s = best_of(lambda: departures.build_index(gtfs_fast.decode(data)), args.repeat, args.number)
+        stop_s = fast_s
+        if stop_ids is not None:
+            stop_s = best_of(
+                lambda: departures.build_index(gtfs_fast.decode(data, stop_ids)), args.repeat, args.number)
+
+        print('{:<32} {:>9} {:>12.2f} {:>12.2f} {:>12.2f} {:>7.1f}x'.format(
+            os.path.basename(path), len(data), protobuf_s * 1000, fast_s * 1000, stop_s * 1000,
+            protobuf_s / min(fast_s, stop_s)))
+
+
+if __name__ == '__main__':
+    main()
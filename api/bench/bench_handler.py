@@ -0,0 +1,151 @@
+# Offline benchmark for the API handler.
+#
+# Serves the fixtures in bench/fixtures from a local stub of the MTA endpoint and reports, for each fixture size,
+# where a request spends its time and memory:
+#   python bench/bench_handler.py [--size rush] [--stop D19] [--latency 0.05]
+# Missing fixtures are synthesized first, see bench/fixtures.py
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import departures  # noqa: E402
+import feeds  # noqa: E402
+import fixtures  # noqa: E402
+import handler  # noqa: E402
+import metrics  # noqa: E402
+import stub_server  # noqa: E402
+
+STAGES = ['download', 'parse', 'index', 'lookup', 'serialize']
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Serves one cold request in a fresh interpreter, like a new Lambda container, and reports the process's peak RSS.
+# tracemalloc can't see upb's native arenas, where nearly all of a parse's memory goes. argv[1] is the stub's stand-in
+# for feeds.FEED_URLS
+_PEAK_CHILD = '''
+import json, resource, sys
+import feeds, handler
+feeds.FEED_URLS[:] = json.loads(sys.argv[1])
+handler.get_departures({'resource': '/{stop_id}', 'path': '/' + sys.argv[2]}, None)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+
+def _timed(timings, stage, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    timings[stage] += time.perf_counter() - start
+    return result
+
+
+# Run every stage of a request serially across the stop's feeds so each one can be timed on its own
+def run_stages(urls, stop_id):
+    timings = dict.fromkeys(STAGES, 0.0)
+    downloaded = 0
+    indexes = []
+    for url in urls:
+        data = _timed(timings, 'download', feeds.download_feed, url, 'bench')
+        downloaded += len(data)
+        feed = _timed(timings, 'parse', feeds.parse_feed, data)
+        indexes.append(_timed(timings, 'index', departures.build_index, feed))
+
+    now = int(time.time())
+    body = _timed(timings, 'lookup', handler.build_body, indexes, stop_id, now)
+    _timed(timings, 'serialize', json.dumps, body)
+    return timings, downloaded
+
+
+def _request(stop_id):
+    return handler.get_departures({'resource': '/{stop_id}', 'path': '/' + stop_id}, None)
+
+
+# Peak RSS in bytes of a process that imported the handler and served one cold request
+def request_peak(urls, stop_id):
+    env = dict(os.environ, MTA_API_KEY='bench', DEPARTURES_METRICS='off')
+    result = subprocess.run(
+        [sys.executable, '-c', _PEAK_CHILD, json.dumps(urls), stop_id],
+        cwd=API_DIR, env=env, check=True, capture_output=True, text=True)
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return int(result.stdout.strip().splitlines()[-1]) * scale
+
+
+def bench_size(size, stop_id, iterations, latency):
+    server, urls = stub_server.start(fixtures.load_fixtures(size, int(time.time())), latency)
+    mta_urls = list(feeds.FEED_URLS)
+    feeds.FEED_URLS[:] = urls
+    try:
+        stop_urls = feeds.feed_urls_for_stop(stop_id)
+
+        samples = {stage: [] for stage in STAGES}
+        for _ in range(iterations):
+            timings, downloaded = run_stages(stop_urls, stop_id)
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+
+        cold = []
+        warm = []
+        for _ in range(iterations):
+            feeds.clear_cache()
+            start = time.perf_counter()
+            _request(stop_id)
+            cold.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            _request(stop_id)
+            warm.append(time.perf_counter() - start)
+
+        peak = request_peak(urls, stop_id)
+    finally:
+        feeds.FEED_URLS[:] = mta_urls
+        server.shutdown()
+        server.server_close()
+
+    return {
+        'feeds': len(stop_urls),
+        'bytes': downloaded,
+        'stages': {stage: statistics.median(values) for stage, values in samples.items()},
+        'cold': statistics.median(cold),
+        'warm': statistics.median(warm),
+        'peak': peak,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark get_departures against recorded feed fixtures')
+    parser.add_argument('--size', choices=fixtures.SIZES, action='append', dest='sizes')
+    parser.add_argument('--stop', default='D19')
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0, help='Seconds of simulated upstream latency per feed')
+    args = parser.parse_args()
+
+    os.environ.setdefault('MTA_API_KEY', 'bench')
+    # Keep per-request metric lines out of the results table
+    metrics.ENABLED = False
+    fixtures.ensure_fixtures()
+
+    columns = ['size', 'feeds', 'KB'] + STAGES + ['cold', 'warm', 'RSS MB']
+    print(('{:<8}' + '{:>10}' * (len(columns) - 1)).format(*columns))
+    for size in args.sizes or fixtures.SIZES:
+        result = bench_size(size, args.stop, args.iterations, args.latency)
+        row = [size, result['feeds'], result['bytes'] // 1024]
+        row += ['{:.2f}'.format(result['stages'][stage] * 1000) for stage in STAGES]
+        row += ['{:.2f}'.format(result['cold'] * 1000), '{:.2f}'.format(result['warm'] * 1000)]
+        row += ['{:.1f}'.format(result['peak'] / 1024 / 1024)]
+        print(('{:<8}' + '{:>10}' * (len(columns) - 1)).format(*row))
+    print('Stage, cold and warm columns are median milliseconds per request. RSS is the peak of a fresh process '
+          'serving one cold request')
+
+    stats = feeds.connection_stats()
+    print('{requests} feed requests over {connections_opened} connections ({connections_reused} reused), '
+          '{bytes_received} bytes on the wire for {bytes_decoded} bytes of feed'.format(**stats))
+
+
+if __name__ == '__main__':
+    main()
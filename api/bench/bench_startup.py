@@ -0,0 +1,93 @@
+# Cold start benchmark for the API handler.
+#
+# Every run starts a fresh interpreter, like a new Lambda container, and measures how long `import handler` takes and
+# how long the first and a second (warm) request take against the local stub of the MTA endpoint:
+#   python bench/bench_startup.py [--runs 10] [--size typical] [--importtime]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fixtures  # noqa: E402
+import stub_server  # noqa: E402
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the fresh interpreter. argv[1] is the stub's stand-in for feeds.FEED_URLS
+_CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+import handler
+imported = time.perf_counter()
+
+import feeds
+feeds.FEED_URLS[:] = json.loads(sys.argv[1])
+event = {'resource': '/{stop_id}', 'path': '/' + sys.argv[2]}
+handler.get_departures(event, None)
+first = time.perf_counter()
+handler.get_departures(event, None)
+warm = time.perf_counter()
+
+print(json.dumps({'import': imported - start, 'first': first - imported, 'warm': warm - first}))
+'''
+
+
+def run_once(urls, stop_id):
+    env = dict(os.environ, MTA_API_KEY='bench', DEPARTURES_METRICS='off')
+    result = subprocess.run(
+        [sys.executable, '-c', _CHILD, json.dumps(urls), stop_id],
+        cwd=API_DIR, env=env, check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+# The slowest modules to import, from python -X importtime
+def import_profile(top):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import handler'],
+        cwd=API_DIR, check=True, capture_output=True, text=True)
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line.split(':', 1)[1].split('|'))
+        modules.append((int(self_us), int(cumulative_us), name))
+
+    return sorted(modules, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure handler import time and first request latency')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--size', choices=fixtures.SIZES, default='typical')
+    parser.add_argument('--stop', default='D19')
+    parser.add_argument('--importtime', action='store_true', help='Also list the slowest imports')
+    args = parser.parse_args()
+
+    fixtures.ensure_fixtures()
+    server, urls = stub_server.start(fixtures.load_fixtures(args.size, int(time.time())))
+    try:
+        results = [run_once(urls, args.stop) for _ in range(args.runs)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print('{} fresh interpreters, {} fixtures'.format(args.runs, args.size))
+    for stage in ('import', 'first', 'warm'):
+        samples = [result[stage] * 1000 for result in results]
+        print('{:<8} median {:>8.2f} ms   min {:>8.2f} ms   max {:>8.2f} ms'.format(
+            stage, statistics.median(samples), min(samples), max(samples)))
+
+    if args.importtime:
+        print('\n{:>10} {:>12}  module'.format('self ms', 'cumulative'))
+        for self_us, cumulative_us, name in import_profile(15):
+            print('{:>10.2f} {:>12.2f}  {}'.format(self_us / 1000, cumulative_us / 1000, name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+# GTFS-RT snapshot fixtures for the offline benchmarks.
+#
+# Fixtures live in bench/fixtures/<size>/<feed>.pb, one file per entry in feeds.FEED_URLS. Either record the live feeds
+# at a given time of day (needs MTA_API_KEY):
+#   python bench/fixtures.py record rush
+# or synthesize deterministic stand-ins shaped like the real feeds for every size:
+#   python bench/fixtures.py synthesize
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feeds  # noqa: E402
+import gtfs_realtime_pb2  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Trips running per route - roughly overnight, midday and peak service
+SIZES = {
+    'small': 6,
+    'typical': 20,
+    'rush': 45,
+}
+
+# Routes and station id prefixes carried by each feed, in feeds.FEED_URLS order
+_FEED_LAYOUTS = [
+    ('123456', '1234569'),
+    ('L', 'L'),
+    ('NQRW', 'NQR'),
+    ('BDFM', 'BDFM'),
+    ('ACE', 'ACEH'),
+    ('7', '7'),
+    ('JZ', 'JM'),
+    ('G', 'G'),
+]
+
+# Synthetic feeds are stamped with a fixed time so regenerating them reproduces the checked-in files byte for byte
+SYNTHETIC_TIMESTAMP = 1700000000
+
+# How many stations each route's synthetic line has
+_STATIONS_PER_ROUTE = 36
+# Seconds between consecutive stops
+_STOP_SPACING = 90
+
+
+def feed_name(url):
+    return url.rsplit('%2F', 1)[-1]
+
+
+# Captured at import since the benchmarks repoint feeds.FEED_URLS at the stub server
+FEED_NAMES = [feed_name(url) for url in feeds.FEED_URLS]
+
+
+def fixture_path(size, name):
+    return os.path.join(FIXTURE_DIR, size, name + '.pb')
+
+
+def _route_stations(rng, prefixes, route_number):
+    prefix = prefixes[route_number % len(prefixes)]
+    first = rng.randrange(1, 10)
+    return ['{}{:02d}'.format(prefix, first + i) for i in range(_STATIONS_PER_ROUTE)]
+
+
+def synthesize(feed_number, trips_per_route, now, seed=0):
+    rng = random.Random(seed * 100 + feed_number)
+    routes, prefixes = _FEED_LAYOUTS[feed_number]
+
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.header.gtfs_realtime_version = '1.0'
+    feed.header.timestamp = now
+
+    for route_number, route_id in enumerate(routes):
+        stations = _route_stations(rng, prefixes, route_number)
+        for trip_number in range(trips_per_route):
+            direction = 'N' if trip_number % 2 else 'S'
+            trip_id = '{:06d}_{}..{}'.format(rng.randrange(1000000), route_id, direction)
+            route_stations = stations if direction == 'N' else stations[::-1]
+            # Trips are strung out along the line, so each one only has its remaining stops left
+            remaining = route_stations[rng.randrange(len(route_stations) // 2):]
+            first_departure = now - 60 + rng.randrange(_STOP_SPACING * 4)
+
+            trip_update = feed.entity.add()
+            trip_update.id = '{}T'.format(trip_id)
+            trip_update.trip_update.trip.trip_id = trip_id
+            trip_update.trip_update.trip.route_id = route_id
+            trip_update.trip_update.trip.start_date = time.strftime('%Y%m%d', time.gmtime(now))
+            for i, station in enumerate(remaining):
+                stop_time_update = trip_update.trip_update.stop_time_update.add()
+                stop_time_update.stop_id = station + direction
+                stop_time_update.arrival.time = first_departure + i * _STOP_SPACING
+                if i < len(remaining) - 1:
+                    stop_time_update.departure.time = first_departure + i * _STOP_SPACING + 30
+
+            vehicle = feed.entity.add()
+            vehicle.id = '{}V'.format(trip_id)
+            vehicle.vehicle.trip.CopyFrom(trip_update.trip_update.trip)
+            vehicle.vehicle.current_stop_sequence = _STATIONS_PER_ROUTE - len(remaining)
+            vehicle.vehicle.stop_id = remaining[0] + direction
+            vehicle.vehicle.timestamp = now - rng.randrange(60)
+
+    # A couple of alerts, which the handler never reads but still has to get through
+    for i in range(len(routes)):
+        alert = feed.entity.add()
+        alert.id = 'alert{}'.format(i)
+        alert.alert.informed_entity.add().route_id = routes[i]
+        alert.alert.header_text.translation.add().text = 'Trains are running with delays'
+
+    return feed.SerializeToString()
+
+
+def _write(size, name, data):
+    path = fixture_path(size, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    print('{} {:>9} bytes'.format(path, len(data)))
+
+
+# Make sure every fixture exists, synthesizing any that are missing. Recorded fixtures are left alone
+def ensure_fixtures():
+    for size, trips_per_route in SIZES.items():
+        for feed_number, name in enumerate(FEED_NAMES):
+            if not os.path.exists(fixture_path(size, name)):
+                _write(size, name, synthesize(feed_number, trips_per_route, SYNTHETIC_TIMESTAMP))
+
+
+# Shift every time in a snapshot so it looks like it was published at now. Without this a recorded feed has no
+# upcoming departures by the time the benchmark runs
+def rebase(data, now):
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.ParseFromString(data)
+    delta = now - feed.header.timestamp
+
+    feed.header.timestamp = now
+    for entity in feed.entity:
+        if entity.HasField('trip_update'):
+            for stop_time_update in entity.trip_update.stop_time_update:
+                if stop_time_update.arrival.time:
+                    stop_time_update.arrival.time += delta
+                if stop_time_update.departure.time:
+                    stop_time_update.departure.time += delta
+        if entity.HasField('vehicle') and entity.vehicle.timestamp:
+            entity.vehicle.timestamp += delta
+
+    return feed.SerializeToString()
+
+
+# {feed name: bytes} for one size, optionally rebased to now
+def load_fixtures(size, now=None):
+    fixtures = {}
+    for name in FEED_NAMES:
+        with open(fixture_path(size, name), 'rb') as f:
+            data = f.read()
+        fixtures[name] = data if now is None else rebase(data, now)
+    return fixtures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record or synthesize GTFS-RT benchmark fixtures')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record = subparsers.add_parser('record', help='Save the live feeds as fixtures')
+    record.add_argument('size', choices=SIZES)
+
+    synth = subparsers.add_parser('synthesize', help='Generate synthetic fixtures')
+    synth.add_argument('--size', choices=SIZES, action='append', dest='sizes')
+    synth.add_argument('--seed', type=int, default=0)
+    synth.add_argument('--timestamp', type=int, default=SYNTHETIC_TIMESTAMP)
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        api_key = os.getenv('MTA_API_KEY')
+        if not api_key:
+            sys.exit("Error couldn't get API key from env")
+        for name, url in zip(FEED_NAMES, feeds.FEED_URLS):
+            _write(args.size, name, feeds.download_feed(url, api_key))
+    else:
+        for size in args.sizes or SIZES:
+            for feed_number, name in enumerate(FEED_NAMES):
+                _write(size, name, synthesize(feed_number, SIZES[size], args.timestamp, args.seed))
+
+
+if __name__ == '__main__':
+    main()
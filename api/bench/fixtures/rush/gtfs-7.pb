@@ -0,0 +1,278 @@
+
+
+1.0Ϫ
+777820_7..ST
+
+777820_7..S20231114*7ϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+777820_7..SV"*
+
+777820_7..S20231114*7(Ϫ:729S
+775839_7..NT
+
+775839_7..N20231114*7ϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+775839_7..NV"*
+
+775839_7..N20231114*7(Ϫ:721N
+488240_7..ST
+
+488240_7..S20231114*7ϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+488240_7..SV"*
+
+488240_7..S20231114*7(Ϫ:733S
+944662_7..NT
+
+944662_7..N20231114*7ϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+944662_7..NV"*
+
+944662_7..N20231114*7(Ϫ:710N
+491854_7..ST
+
+491854_7..S20231114*7ϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+491854_7..SV"*
+
+491854_7..S20231114*7(Ϫ:733S
+106927_7..NT
+
+106927_7..N20231114*7ϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+106927_7..NV"*
+
+106927_7..N20231114*7(Ϫ:712N
+227257_7..ST
+
+227257_7..S20231114*7ϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+227257_7..SV"*
+
+227257_7..S20231114*7(Ϫ:727S
+960857_7..NT
+
+960857_7..N20231114*7ϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+960857_7..NV"*
+
+960857_7..N20231114*7(Ϫ:717N
+835869_7..ST
+
+835869_7..S20231114*7ϪϪ"738SϪϪ"737SϪϪ"736SϪϪ"735SϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+835869_7..SV"*
+
+835869_7..S20231114*7(Ϫ:738S
+647445_7..NT
+
+647445_7..N20231114*7ϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+647445_7..NV"*
+
+647445_7..N20231114*7(Ϫ:719N
+001861_7..ST
+
+001861_7..S20231114*7ϪϪ"740SϪϪ"739SϪϪ"738SϪϪ"737SϪϪ"736SϪϪ"735SϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+001861_7..SV"*
+
+001861_7..S20231114*7 (Ϫ:740S
+225948_7..NT
+
+225948_7..N20231114*7ϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+225948_7..NV"*
+
+225948_7..N20231114*7(Ϫ:710N
+328887_7..ST
+
+328887_7..S20231114*7ϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+328887_7..SV"*
+
+328887_7..S20231114*7(Ϫ:734S
+710756_7..NT
+
+710756_7..N20231114*7ϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+710756_7..NV"*
+
+710756_7..N20231114*7(Ϫ:711N
+206442_7..ST
+
+206442_7..S20231114*7ϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+206442_7..SV"*
+
+206442_7..S20231114*7(Ϫ:728S
+378735_7..NT
+
+378735_7..N20231114*7ϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+378735_7..NV"*
+
+378735_7..N20231114*7(Ϫ:718N
+152779_7..ST
+
+152779_7..S20231114*7ϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+152779_7..SV"*
+
+152779_7..S20231114*7(Ϫ:732S
+315997_7..NT
+
+315997_7..N20231114*7ϪϪ"705NϪϪ"706NϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+315997_7..NV"*
+
+315997_7..N20231114*7 (Ϫ:705N
+742052_7..ST
+
+742052_7..S20231114*7ϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+742052_7..SV"*
+
+742052_7..S20231114*7
+(Ϫ:730S
+372612_7..NT
+
+372612_7..N20231114*7ϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+372612_7..NV"*
+
+372612_7..N20231114*7	(Ϫ:714N
+331133_7..ST
+
+331133_7..S20231114*7ϪϪ"735SϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+331133_7..SV"*
+
+331133_7..S20231114*7(Ϫ:735S
+738899_7..NT
+
+738899_7..N20231114*7ϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+738899_7..NV"*
+
+738899_7..N20231114*7(Ϫ:710N
+984625_7..ST
+
+984625_7..S20231114*7ϪϪ"740SϪϪ"739SϪϪ"738SϪϪ"737SϪϪ"736SϪϪ"735SϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+984625_7..SV"*
+
+984625_7..S20231114*7 (Ϫ:740S
+423933_7..NT
+
+423933_7..N20231114*7ϪϪ"705NϪϪ"706NϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+423933_7..NV"*
+
+423933_7..N20231114*7 (Ϫ:705N
+439172_7..ST
+
+439172_7..S20231114*7ϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+439172_7..SV"*
+
+439172_7..S20231114*7(Ϫ:729S
+882097_7..NT
+
+882097_7..N20231114*7ϪϪ"705NϪϪ"706NϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+882097_7..NV"*
+
+882097_7..N20231114*7 (Ϫ:705N
+742138_7..ST
+
+742138_7..S20231114*7ϪϪ"735SϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+742138_7..SV"*
+
+742138_7..S20231114*7(Ϫ:735S
+124802_7..NT
+
+124802_7..N20231114*7ϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+124802_7..NV"*
+
+124802_7..N20231114*7(Ϫ:712N
+537391_7..ST
+
+537391_7..S20231114*7ϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+537391_7..SV"*
+
+537391_7..S20231114*7(Ϫ:729S
+813278_7..NT
+
+813278_7..N20231114*7ϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+813278_7..NV"*
+
+813278_7..N20231114*7(Ϫ:719N
+784752_7..ST
+
+784752_7..S20231114*7ϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+784752_7..SV"*
+
+784752_7..S20231114*7(Ϫ:729S
+454008_7..NT
+
+454008_7..N20231114*7ϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+454008_7..NV"*
+
+454008_7..N20231114*7(Ϫ:707N
+537793_7..ST
+
+537793_7..S20231114*7ϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+537793_7..SV"*
+
+537793_7..S20231114*7(Ϫ:729S
+289067_7..NT
+
+289067_7..N20231114*7ϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+289067_7..NV"*
+
+289067_7..N20231114*7(Ϫ:722N
+719287_7..ST
+
+719287_7..S20231114*7ϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+719287_7..SV"*
+
+719287_7..S20231114*7
+(Ϫ:730S
+837574_7..NT
+
+837574_7..N20231114*7ϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+837574_7..NV"*
+
+837574_7..N20231114*7(Ϫ:707N
+756164_7..ST
+
+756164_7..S20231114*7ϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+756164_7..SV"*
+
+756164_7..S20231114*7	(Ϫ:731S
+755109_7..NT
+
+755109_7..N20231114*7ϪϪ"706NϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+755109_7..NV"*
+
+755109_7..N20231114*7(Ϫ:706N
+559447_7..ST
+
+559447_7..S20231114*7ϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+559447_7..SV"*
+
+559447_7..S20231114*7(Ϫ:728S
+776531_7..NT
+
+776531_7..N20231114*7ϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+776531_7..NV"*
+
+776531_7..N20231114*7(Ϫ:716N
+682587_7..ST
+
+682587_7..S20231114*7ϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+682587_7..SV"*
+
+682587_7..S20231114*7(Ϫ:727S
+960568_7..NT
+
+960568_7..N20231114*7ϪϪ"706NϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+960568_7..NV"*
+
+960568_7..N20231114*7(Ϫ:706N
+879156_7..ST
+
+879156_7..S20231114*7ϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+879156_7..SV"*
+
+879156_7..S20231114*7(Ϫ:734S
+591446_7..NT
+
+591446_7..N20231114*7ϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+591446_7..NV"*
+
+591446_7..N20231114*7(Ϫ:709N
+826287_7..ST
+
+826287_7..S20231114*7ϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+826287_7..SV"*
+
+826287_7..S20231114*7(Ϫ:727S3
+alert0*)*7R"
+ 
+Trains are running with delays
\ No newline at end of file
@@ -0,0 +1,279 @@
+
+
+1.0Ϫ
+993908_G..ST
+
+993908_G..S20231114*GϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+993908_G..SV"*
+
+993908_G..S20231114*G(Ϫ:G37S
+050631_G..NT
+
+050631_G..N20231114*GϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+050631_G..NV"*
+
+050631_G..N20231114*G(Ϫ:G08N
+383452_G..ST
+
+383452_G..S20231114*GϪϪ"G40SϪϪ"G39SϪϪ"G38SϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+383452_G..SV"*
+
+383452_G..S20231114*G(Ϫ:G40S
+039317_G..NT
+
+039317_G..N20231114*GϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+039317_G..NV"*
+
+039317_G..N20231114*G(Ϫ:G08N
+073248_G..ST
+
+073248_G..S20231114*GϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+073248_G..SV"*
+
+073248_G..S20231114*G(Ϫ:G34S
+445140_G..NT
+
+445140_G..N20231114*GϪϪ"G07NϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+445140_G..NV"*
+
+445140_G..N20231114*G(Ϫ:G07N
+993473_G..ST
+
+993473_G..S20231114*GϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+993473_G..SV"*
+
+993473_G..S20231114*G(Ϫ:G34S
+611316_G..NT
+
+611316_G..N20231114*GϪϪ"G07NϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+611316_G..NV"*
+
+611316_G..N20231114*G(Ϫ:G07N
+415949_G..ST
+
+415949_G..S20231114*GϪϪ"G40SϪϪ"G39SϪϪ"G38SϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+415949_G..SV"*
+
+415949_G..S20231114*G(Ϫ:G40S
+583705_G..NT
+
+583705_G..N20231114*GϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+583705_G..NV"*
+
+583705_G..N20231114*G(Ϫ:G10N
+151262_G..ST
+
+151262_G..S20231114*GϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+151262_G..SV"*
+
+151262_G..S20231114*G(Ϫ:G24S
+323466_G..NT
+
+323466_G..N20231114*GϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+323466_G..NV"*
+
+323466_G..N20231114*G(Ϫ:G23N
+108061_G..ST
+
+108061_G..S20231114*GϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+108061_G..SV"*
+
+108061_G..S20231114*G(Ϫ:G35S
+574351_G..NT
+
+574351_G..N20231114*GϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+574351_G..NV"*
+
+574351_G..N20231114*G(Ϫ:G08N
+649078_G..ST
+
+649078_G..S20231114*GϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+649078_G..SV"*
+
+649078_G..S20231114*G(Ϫ:G35S
+557549_G..NT
+
+557549_G..N20231114*GϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+557549_G..NV"*
+
+557549_G..N20231114*G(Ϫ:G19N
+614006_G..ST
+
+614006_G..S20231114*GϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+614006_G..SV"*
+
+614006_G..S20231114*G(Ϫ:G27S
+260494_G..NT
+
+260494_G..N20231114*GϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+260494_G..NV"*
+
+260494_G..N20231114*G(Ϫ:G11N
+255953_G..ST
+
+255953_G..S20231114*GϪϪ"G39SϪϪ"G38SϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+255953_G..SV"*
+
+255953_G..S20231114*G(Ϫ:G39S
+550708_G..NT
+
+550708_G..N20231114*GϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+550708_G..NV"*
+
+550708_G..N20231114*G(Ϫ:G21N
+470636_G..ST
+
+470636_G..S20231114*GϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+470636_G..SV"*
+
+470636_G..S20231114*G	(Ϫ:G32S
+123800_G..NT
+
+123800_G..N20231114*GϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+123800_G..NV"*
+
+123800_G..N20231114*G(Ϫ:G22N
+793919_G..ST
+
+793919_G..S20231114*GϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+793919_G..SV"*
+
+793919_G..S20231114*G
+(Ϫ:G31S
+512714_G..NT
+
+512714_G..N20231114*GϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+512714_G..NV"*
+
+512714_G..N20231114*G(Ϫ:G19N
+081390_G..ST
+
+081390_G..S20231114*GϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+081390_G..SV"*
+
+081390_G..S20231114*G(Ϫ:G24S
+918005_G..NT
+
+918005_G..N20231114*GϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+918005_G..NV"*
+
+918005_G..N20231114*G
+(Ϫ:G16N
+367188_G..ST
+
+367188_G..S20231114*GϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+367188_G..SV"*
+
+367188_G..S20231114*G(Ϫ:G26S
+478365_G..NT
+
+478365_G..N20231114*GϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+478365_G..NV"*
+
+478365_G..N20231114*G(Ϫ:G08N
+497128_G..ST
+
+497128_G..S20231114*GϪϪ"G39SϪϪ"G38SϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+497128_G..SV"*
+
+497128_G..S20231114*G(Ϫ:G39S
+735567_G..NT
+
+735567_G..N20231114*GϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+735567_G..NV"*
+
+735567_G..N20231114*G	(Ϫ:G15N
+714328_G..ST
+
+714328_G..S20231114*GϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+714328_G..SV"*
+
+714328_G..S20231114*G(Ϫ:G27S
+404531_G..NT
+
+404531_G..N20231114*GϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+404531_G..NV"*
+
+404531_G..N20231114*G(Ϫ:G17N
+372731_G..ST
+
+372731_G..S20231114*GϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+372731_G..SV"*
+
+372731_G..S20231114*G(Ϫ:G36S
+517674_G..NT
+
+517674_G..N20231114*GϪϪ"G07NϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+517674_G..NV"*
+
+517674_G..N20231114*G(Ϫ:G07N
+301394_G..ST
+
+301394_G..S20231114*GϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+301394_G..SV"*
+
+301394_G..S20231114*G(Ϫ:G37S
+409940_G..NT
+
+409940_G..N20231114*GϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+409940_G..NV"*
+
+409940_G..N20231114*G(Ϫ:G21N
+471007_G..ST
+
+471007_G..S20231114*GϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+471007_G..SV"*
+
+471007_G..S20231114*G(Ϫ:G29S
+926295_G..NT
+
+926295_G..N20231114*GϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+926295_G..NV"*
+
+926295_G..N20231114*G(Ϫ:G10N
+576947_G..ST
+
+576947_G..S20231114*GϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+576947_G..SV"*
+
+576947_G..S20231114*G(Ϫ:G33S
+715887_G..NT
+
+715887_G..N20231114*GϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+715887_G..NV"*
+
+715887_G..N20231114*G(Ϫ:G18N
+087015_G..ST
+
+087015_G..S20231114*GϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+087015_G..SV"*
+
+087015_G..S20231114*G(Ϫ:G36S
+690504_G..NT
+
+690504_G..N20231114*GϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+690504_G..NV"*
+
+690504_G..N20231114*G(Ϫ:G13N
+871464_G..ST
+
+871464_G..S20231114*GϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+871464_G..SV"*
+
+871464_G..S20231114*G(Ϫ:G36S
+004292_G..NT
+
+004292_G..N20231114*GϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+004292_G..NV"*
+
+004292_G..N20231114*G(Ϫ:G10N
+387190_G..ST
+
+387190_G..S20231114*GϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+387190_G..SV"*
+
+387190_G..S20231114*G
+(Ϫ:G31S3
+alert0*)*GR"
+ 
+Trains are running with delays
\ No newline at end of file
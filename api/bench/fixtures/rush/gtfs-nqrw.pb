@@ -0,0 +1,1106 @@
+
+
+1.0Ϫ
+096033_N..ST
+
+096033_N..S20231114*NϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+096033_N..SV"*
+
+096033_N..S20231114*N(Ϫ:N34S
+177297_N..NT
+
+177297_N..N20231114*NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+177297_N..NV"*
+
+177297_N..N20231114*N	(Ϫ:N10N
+222527_N..ST
+
+222527_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+222527_N..SV"*
+
+222527_N..S20231114*N(Ϫ:N35S
+166076_N..NT
+
+166076_N..N20231114*NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+166076_N..NV"*
+
+166076_N..N20231114*N(Ϫ:N14N
+842708_N..ST
+
+842708_N..S20231114*NϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+842708_N..SV"*
+
+842708_N..S20231114*N(Ϫ:N20S
+981164_N..NT
+
+981164_N..N20231114*NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+981164_N..NV"*
+
+981164_N..N20231114*N(Ϫ:N15N
+944984_N..ST
+
+944984_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+944984_N..SV"*
+
+944984_N..S20231114*N(Ϫ:N35S
+487476_N..NT
+
+487476_N..N20231114*NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+487476_N..NV"*
+
+487476_N..N20231114*N
+(Ϫ:N11N
+935109_N..ST
+
+935109_N..S20231114*NϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+935109_N..SV"*
+
+935109_N..S20231114*N(Ϫ:N20S
+186055_N..NT
+
+186055_N..N20231114*NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+186055_N..NV"*
+
+186055_N..N20231114*N(Ϫ:N08N
+185304_N..ST
+
+185304_N..S20231114*NϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+185304_N..SV"*
+
+185304_N..S20231114*N
+(Ϫ:N26S
+534948_N..NT
+
+534948_N..N20231114*NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+534948_N..NV"*
+
+534948_N..N20231114*N(Ϫ:N17N
+707243_N..ST
+
+707243_N..S20231114*NϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+707243_N..SV"*
+
+707243_N..S20231114*N(Ϫ:N19S
+467284_N..NT
+
+467284_N..N20231114*NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+467284_N..NV"*
+
+467284_N..N20231114*N(Ϫ:N14N
+952608_N..ST
+
+952608_N..S20231114*NϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+952608_N..SV"*
+
+952608_N..S20231114*N(Ϫ:N25S
+379465_N..NT
+
+379465_N..N20231114*NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+379465_N..NV"*
+
+379465_N..N20231114*N(Ϫ:N15N
+419287_N..ST
+
+419287_N..S20231114*NϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+419287_N..SV"*
+
+419287_N..S20231114*N(Ϫ:N22S
+262040_N..NT
+
+262040_N..N20231114*NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+262040_N..NV"*
+
+262040_N..N20231114*N(Ϫ:N16N
+522259_N..ST
+
+522259_N..S20231114*NϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+522259_N..SV"*
+
+522259_N..S20231114*N(Ϫ:N20S
+834893_N..NT
+
+834893_N..N20231114*NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+834893_N..NV"*
+
+834893_N..N20231114*N(Ϫ:N12N
+476775_N..ST
+
+476775_N..S20231114*NϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+476775_N..SV"*
+
+476775_N..S20231114*N(Ϫ:N22S
+761145_N..NT
+
+761145_N..N20231114*NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+761145_N..NV"*
+
+761145_N..N20231114*N(Ϫ:N18N
+690891_N..ST
+
+690891_N..S20231114*NϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+690891_N..SV"*
+
+690891_N..S20231114*N(Ϫ:N29S
+733554_N..NT
+
+733554_N..N20231114*NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+733554_N..NV"*
+
+733554_N..N20231114*N(Ϫ:N06N
+810532_N..ST
+
+810532_N..S20231114*NϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+810532_N..SV"*
+
+810532_N..S20231114*N(Ϫ:N21S
+838083_N..NT
+
+838083_N..N20231114*NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+838083_N..NV"*
+
+838083_N..N20231114*N(Ϫ:N17N
+532002_N..ST
+
+532002_N..S20231114*NϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+532002_N..SV"*
+
+532002_N..S20231114*N(Ϫ:N23S
+217913_N..NT
+
+217913_N..N20231114*NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+217913_N..NV"*
+
+217913_N..N20231114*N(Ϫ:N16N
+979531_N..ST
+
+979531_N..S20231114*NϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+979531_N..SV"*
+
+979531_N..S20231114*N(Ϫ:N34S
+008830_N..NT
+
+008830_N..N20231114*NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+008830_N..NV"*
+
+008830_N..N20231114*N(Ϫ:N07N
+602317_N..ST
+
+602317_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+602317_N..SV"*
+
+602317_N..S20231114*N(Ϫ:N35S
+237624_N..NT
+
+237624_N..N20231114*NϪϪ"N04NϪϪ"N05NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+237624_N..NV"*
+
+237624_N..N20231114*N(Ϫ:N04N
+895424_N..ST
+
+895424_N..S20231114*NϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+895424_N..SV"*
+
+895424_N..S20231114*N(Ϫ:N28S
+220703_N..NT
+
+220703_N..N20231114*NϪϪ"N02NϪϪ"N03NϪϪ"N04NϪϪ"N05NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+220703_N..NV"*
+
+220703_N..N20231114*N(Ϫ:N02N
+751788_N..ST
+
+751788_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+751788_N..SV"*
+
+751788_N..S20231114*N(Ϫ:N35S
+377716_N..NT
+
+377716_N..N20231114*NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+377716_N..NV"*
+
+377716_N..N20231114*N(Ϫ:N06N
+024581_N..ST
+
+024581_N..S20231114*NϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+024581_N..SV"*
+
+024581_N..S20231114*N(Ϫ:N34S
+026575_N..NT
+
+026575_N..N20231114*NϪϪ"N02NϪϪ"N03NϪϪ"N04NϪϪ"N05NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+026575_N..NV"*
+
+026575_N..N20231114*N(Ϫ:N02N
+268110_N..ST
+
+268110_N..S20231114*NϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+268110_N..SV"*
+
+268110_N..S20231114*N(Ϫ:N32S
+192664_N..NT
+
+192664_N..N20231114*NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+192664_N..NV"*
+
+192664_N..N20231114*N(Ϫ:N17N
+404295_N..ST
+
+404295_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+404295_N..SV"*
+
+404295_N..S20231114*N(Ϫ:N35S
+038030_N..NT
+
+038030_N..N20231114*NϪϪ"N01NϪϪ"N02NϪϪ"N03NϪϪ"N04NϪϪ"N05NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+038030_N..NV"*
+
+038030_N..N20231114*N (Ϫ:N01N
+658250_N..ST
+
+658250_N..S20231114*NϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+658250_N..SV"*
+
+658250_N..S20231114*N(Ϫ:N33S
+512503_N..NT
+
+512503_N..N20231114*NϪϪ"N01NϪϪ"N02NϪϪ"N03NϪϪ"N04NϪϪ"N05NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+512503_N..NV"*
+
+512503_N..N20231114*N (Ϫ:N01N
+578293_N..ST
+
+578293_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+578293_N..SV"*
+
+578293_N..S20231114*N(Ϫ:N35S
+904339_Q..ST
+
+904339_Q..S20231114*QϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+904339_Q..SV"*
+
+904339_Q..S20231114*Q(Ϫ:Q38S
+097993_Q..NT
+
+097993_Q..N20231114*QϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+097993_Q..NV"*
+
+097993_Q..N20231114*Q
+(Ϫ:Q17N
+469575_Q..ST
+
+469575_Q..S20231114*QϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+469575_Q..SV"*
+
+469575_Q..S20231114*Q(Ϫ:Q38S
+819000_Q..NT
+
+819000_Q..N20231114*QϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+819000_Q..NV"*
+
+819000_Q..N20231114*Q(Ϫ:Q19N
+343891_Q..ST
+
+343891_Q..S20231114*QϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+343891_Q..SV"*
+
+343891_Q..S20231114*Q(Ϫ:Q38S
+274556_Q..NT
+
+274556_Q..N20231114*QϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+274556_Q..NV"*
+
+274556_Q..N20231114*Q(Ϫ:Q20N
+733451_Q..ST
+
+733451_Q..S20231114*QϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+733451_Q..SV"*
+
+733451_Q..S20231114*Q(Ϫ:Q25S
+059539_Q..NT
+
+059539_Q..N20231114*QϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+059539_Q..NV"*
+
+059539_Q..N20231114*Q(Ϫ:Q15N
+168993_Q..ST
+
+168993_Q..S20231114*QϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+168993_Q..SV"*
+
+168993_Q..S20231114*Q(Ϫ:Q37S
+665925_Q..NT
+
+665925_Q..N20231114*QϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+665925_Q..NV"*
+
+665925_Q..N20231114*Q(Ϫ:Q14N
+742489_Q..ST
+
+742489_Q..S20231114*QϪϪ"Q41SϪϪ"Q40SϪϪ"Q39SϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+742489_Q..SV"*
+
+742489_Q..S20231114*Q(Ϫ:Q41S
+748544_Q..NT
+
+748544_Q..N20231114*QϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+748544_Q..NV"*
+
+748544_Q..N20231114*Q(Ϫ:Q21N
+084336_Q..ST
+
+084336_Q..S20231114*QϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+084336_Q..SV"*
+
+084336_Q..S20231114*Q(Ϫ:Q35S
+839078_Q..NT
+
+839078_Q..N20231114*QϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+839078_Q..NV"*
+
+839078_Q..N20231114*Q(Ϫ:Q18N
+443565_Q..ST
+
+443565_Q..S20231114*QϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+443565_Q..SV"*
+
+443565_Q..S20231114*Q(Ϫ:Q34S
+005059_Q..NT
+
+005059_Q..N20231114*QϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+005059_Q..NV"*
+
+005059_Q..N20231114*Q(Ϫ:Q11N
+428580_Q..ST
+
+428580_Q..S20231114*QϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+428580_Q..SV"*
+
+428580_Q..S20231114*Q(Ϫ:Q37S
+758927_Q..NT
+
+758927_Q..N20231114*QϪϪ"Q09NϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+758927_Q..NV"*
+
+758927_Q..N20231114*Q(Ϫ:Q09N
+104619_Q..ST
+
+104619_Q..S20231114*QϪϪ"Q42SϪϪ"Q41SϪϪ"Q40SϪϪ"Q39SϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+104619_Q..SV"*
+
+104619_Q..S20231114*Q (Ϫ:Q42S
+242772_Q..NT
+
+242772_Q..N20231114*QϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+242772_Q..NV"*
+
+242772_Q..N20231114*Q(Ϫ:Q10N
+546031_Q..ST
+
+546031_Q..S20231114*QϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+546031_Q..SV"*
+
+546031_Q..S20231114*Q(Ϫ:Q28S
+561547_Q..NT
+
+561547_Q..N20231114*QϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+561547_Q..NV"*
+
+561547_Q..N20231114*Q(Ϫ:Q19N
+950599_Q..ST
+
+950599_Q..S20231114*QϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+950599_Q..SV"*
+
+950599_Q..S20231114*Q(Ϫ:Q36S
+536348_Q..NT
+
+536348_Q..N20231114*QϪϪ"Q07NϪϪ"Q08NϪϪ"Q09NϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+536348_Q..NV"*
+
+536348_Q..N20231114*Q (Ϫ:Q07N
+053723_Q..ST
+
+053723_Q..S20231114*QϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+053723_Q..SV"*
+
+053723_Q..S20231114*Q(Ϫ:Q29S
+190028_Q..NT
+
+190028_Q..N20231114*QϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+190028_Q..NV"*
+
+190028_Q..N20231114*Q(Ϫ:Q10N
+503109_Q..ST
+
+503109_Q..S20231114*QϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+503109_Q..SV"*
+
+503109_Q..S20231114*Q(Ϫ:Q31S
+966210_Q..NT
+
+966210_Q..N20231114*QϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+966210_Q..NV"*
+
+966210_Q..N20231114*Q(Ϫ:Q10N
+303647_Q..ST
+
+303647_Q..S20231114*QϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+303647_Q..SV"*
+
+303647_Q..S20231114*Q(Ϫ:Q31S
+916819_Q..NT
+
+916819_Q..N20231114*QϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+916819_Q..NV"*
+
+916819_Q..N20231114*Q(Ϫ:Q20N
+320782_Q..ST
+
+320782_Q..S20231114*QϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+320782_Q..SV"*
+
+320782_Q..S20231114*Q(Ϫ:Q36S
+016485_Q..NT
+
+016485_Q..N20231114*QϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+016485_Q..NV"*
+
+016485_Q..N20231114*Q(Ϫ:Q21N
+668252_Q..ST
+
+668252_Q..S20231114*QϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+668252_Q..SV"*
+
+668252_Q..S20231114*Q(Ϫ:Q27S
+932752_Q..NT
+
+932752_Q..N20231114*QϪϪ"Q09NϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+932752_Q..NV"*
+
+932752_Q..N20231114*Q(Ϫ:Q09N
+025314_Q..ST
+
+025314_Q..S20231114*QϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+025314_Q..SV"*
+
+025314_Q..S20231114*Q(Ϫ:Q31S
+758712_Q..NT
+
+758712_Q..N20231114*QϪϪ"Q09NϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+758712_Q..NV"*
+
+758712_Q..N20231114*Q(Ϫ:Q09N
+514269_Q..ST
+
+514269_Q..S20231114*QϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+514269_Q..SV"*
+
+514269_Q..S20231114*Q(Ϫ:Q36S
+391532_Q..NT
+
+391532_Q..N20231114*QϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+391532_Q..NV"*
+
+391532_Q..N20231114*Q(Ϫ:Q19N
+790186_Q..ST
+
+790186_Q..S20231114*QϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+790186_Q..SV"*
+
+790186_Q..S20231114*Q(Ϫ:Q31S
+127642_Q..NT
+
+127642_Q..N20231114*QϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+127642_Q..NV"*
+
+127642_Q..N20231114*Q(Ϫ:Q15N
+084421_Q..ST
+
+084421_Q..S20231114*QϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+084421_Q..SV"*
+
+084421_Q..S20231114*Q
+(Ϫ:Q32S
+222308_Q..NT
+
+222308_Q..N20231114*QϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+222308_Q..NV"*
+
+222308_Q..N20231114*Q(Ϫ:Q10N
+691179_Q..ST
+
+691179_Q..S20231114*QϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+691179_Q..SV"*
+
+691179_Q..S20231114*Q(Ϫ:Q27S
+740088_Q..NT
+
+740088_Q..N20231114*QϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪ"Q42N:
+740088_Q..NV"*
+
+740088_Q..N20231114*Q(Ϫ:Q22N
+479236_Q..ST
+
+479236_Q..S20231114*QϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪϪ"Q08SϪ"Q07S:
+479236_Q..SV"*
+
+479236_Q..S20231114*Q(Ϫ:Q38S
+551869_R..ST
+
+551869_R..S20231114*RϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+551869_R..SV"*
+
+551869_R..S20231114*R(Ϫ:R28S
+516026_R..NT
+
+516026_R..N20231114*RϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+516026_R..NV"*
+
+516026_R..N20231114*R	(Ϫ:R17N
+163996_R..ST
+
+163996_R..S20231114*RϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+163996_R..SV"*
+
+163996_R..S20231114*R(Ϫ:R28S
+575208_R..NT
+
+575208_R..N20231114*RϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+575208_R..NV"*
+
+575208_R..N20231114*R(Ϫ:R21N
+733168_R..ST
+
+733168_R..S20231114*RϪϪ"R41SϪϪ"R40SϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+733168_R..SV"*
+
+733168_R..S20231114*R(Ϫ:R41S
+857581_R..NT
+
+857581_R..N20231114*RϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+857581_R..NV"*
+
+857581_R..N20231114*R(Ϫ:R11N
+184690_R..ST
+
+184690_R..S20231114*RϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+184690_R..SV"*
+
+184690_R..S20231114*R(Ϫ:R26S
+437012_R..NT
+
+437012_R..N20231114*RϪϪ"R10NϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+437012_R..NV"*
+
+437012_R..N20231114*R(Ϫ:R10N
+939000_R..ST
+
+939000_R..S20231114*RϪϪ"R42SϪϪ"R41SϪϪ"R40SϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+939000_R..SV"*
+
+939000_R..S20231114*R(Ϫ:R42S
+409567_R..NT
+
+409567_R..N20231114*RϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+409567_R..NV"*
+
+409567_R..N20231114*R(Ϫ:R15N
+714184_R..ST
+
+714184_R..S20231114*RϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+714184_R..SV"*
+
+714184_R..S20231114*R
+(Ϫ:R33S
+549448_R..NT
+
+549448_R..N20231114*RϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+549448_R..NV"*
+
+549448_R..N20231114*R	(Ϫ:R17N
+567167_R..ST
+
+567167_R..S20231114*RϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+567167_R..SV"*
+
+567167_R..S20231114*R(Ϫ:R30S
+541590_R..NT
+
+541590_R..N20231114*RϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+541590_R..NV"*
+
+541590_R..N20231114*R(Ϫ:R15N
+177802_R..ST
+
+177802_R..S20231114*RϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+177802_R..SV"*
+
+177802_R..S20231114*R(Ϫ:R38S
+245835_R..NT
+
+245835_R..N20231114*RϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+245835_R..NV"*
+
+245835_R..N20231114*R(Ϫ:R20N
+801466_R..ST
+
+801466_R..S20231114*RϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+801466_R..SV"*
+
+801466_R..S20231114*R(Ϫ:R39S
+753788_R..NT
+
+753788_R..N20231114*RϪϪ"R08NϪϪ"R09NϪϪ"R10NϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+753788_R..NV"*
+
+753788_R..N20231114*R (Ϫ:R08N
+924652_R..ST
+
+924652_R..S20231114*RϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+924652_R..SV"*
+
+924652_R..S20231114*R(Ϫ:R38S
+056174_R..NT
+
+056174_R..N20231114*RϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+056174_R..NV"*
+
+056174_R..N20231114*R(Ϫ:R23N
+266046_R..ST
+
+266046_R..S20231114*RϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+266046_R..SV"*
+
+266046_R..S20231114*R(Ϫ:R30S
+377599_R..NT
+
+377599_R..N20231114*RϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+377599_R..NV"*
+
+377599_R..N20231114*R(Ϫ:R25N
+781831_R..ST
+
+781831_R..S20231114*RϪϪ"R41SϪϪ"R40SϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+781831_R..SV"*
+
+781831_R..S20231114*R(Ϫ:R41S
+651426_R..NT
+
+651426_R..N20231114*RϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+651426_R..NV"*
+
+651426_R..N20231114*R(Ϫ:R14N
+699370_R..ST
+
+699370_R..S20231114*RϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+699370_R..SV"*
+
+699370_R..S20231114*R(Ϫ:R31S
+012169_R..NT
+
+012169_R..N20231114*RϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+012169_R..NV"*
+
+012169_R..N20231114*R
+(Ϫ:R18N
+746142_R..ST
+
+746142_R..S20231114*RϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+746142_R..SV"*
+
+746142_R..S20231114*R(Ϫ:R29S
+855711_R..NT
+
+855711_R..N20231114*RϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+855711_R..NV"*
+
+855711_R..N20231114*R(Ϫ:R11N
+989047_R..ST
+
+989047_R..S20231114*RϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+989047_R..SV"*
+
+989047_R..S20231114*R(Ϫ:R37S
+404525_R..NT
+
+404525_R..N20231114*RϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+404525_R..NV"*
+
+404525_R..N20231114*R(Ϫ:R14N
+855240_R..ST
+
+855240_R..S20231114*RϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+855240_R..SV"*
+
+855240_R..S20231114*R(Ϫ:R26S
+780398_R..NT
+
+780398_R..N20231114*RϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+780398_R..NV"*
+
+780398_R..N20231114*R(Ϫ:R14N
+641650_R..ST
+
+641650_R..S20231114*RϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+641650_R..SV"*
+
+641650_R..S20231114*R(Ϫ:R39S
+711664_R..NT
+
+711664_R..N20231114*RϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+711664_R..NV"*
+
+711664_R..N20231114*R(Ϫ:R21N
+538382_R..ST
+
+538382_R..S20231114*RϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+538382_R..SV"*
+
+538382_R..S20231114*R(Ϫ:R38S
+214955_R..NT
+
+214955_R..N20231114*RϪϪ"R10NϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+214955_R..NV"*
+
+214955_R..N20231114*R(Ϫ:R10N
+949671_R..ST
+
+949671_R..S20231114*RϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+949671_R..SV"*
+
+949671_R..S20231114*R(Ϫ:R28S
+701589_R..NT
+
+701589_R..N20231114*RϪϪ"R10NϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+701589_R..NV"*
+
+701589_R..N20231114*R(Ϫ:R10N
+969864_R..ST
+
+969864_R..S20231114*RϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+969864_R..SV"*
+
+969864_R..S20231114*R
+(Ϫ:R33S
+920148_R..NT
+
+920148_R..N20231114*RϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+920148_R..NV"*
+
+920148_R..N20231114*R(Ϫ:R24N
+083685_R..ST
+
+083685_R..S20231114*RϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+083685_R..SV"*
+
+083685_R..S20231114*R(Ϫ:R32S
+786700_R..NT
+
+786700_R..N20231114*RϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+786700_R..NV"*
+
+786700_R..N20231114*R(Ϫ:R20N
+655498_R..ST
+
+655498_R..S20231114*RϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+655498_R..SV"*
+
+655498_R..S20231114*R(Ϫ:R39S
+523745_R..NT
+
+523745_R..N20231114*RϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪϪ"R42NϪ"R43N:
+523745_R..NV"*
+
+523745_R..N20231114*R(Ϫ:R20N
+309139_R..ST
+
+309139_R..S20231114*RϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪ"R08S:
+309139_R..SV"*
+
+309139_R..S20231114*R(Ϫ:R39S
+490096_W..ST
+
+490096_W..S20231114*WϪϪ"N44SϪϪ"N43SϪϪ"N42SϪϪ"N41SϪϪ"N40SϪϪ"N39SϪϪ"N38SϪϪ"N37SϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+490096_W..SV"*
+
+490096_W..S20231114*W (Ϫ:N44S
+564133_W..NT
+
+564133_W..N20231114*WϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+564133_W..NV"*
+
+564133_W..N20231114*W(Ϫ:N21N
+214344_W..ST
+
+214344_W..S20231114*WϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+214344_W..SV"*
+
+214344_W..S20231114*W	(Ϫ:N35S
+139863_W..NT
+
+139863_W..N20231114*WϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+139863_W..NV"*
+
+139863_W..N20231114*W(Ϫ:N24N
+745650_W..ST
+
+745650_W..S20231114*WϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+745650_W..SV"*
+
+745650_W..S20231114*W	(Ϫ:N35S
+864415_W..NT
+
+864415_W..N20231114*WϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+864415_W..NV"*
+
+864415_W..N20231114*W
+(Ϫ:N19N
+677703_W..ST
+
+677703_W..S20231114*WϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+677703_W..SV"*
+
+677703_W..S20231114*W	(Ϫ:N35S
+412055_W..NT
+
+412055_W..N20231114*WϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+412055_W..NV"*
+
+412055_W..N20231114*W(Ϫ:N25N
+664078_W..ST
+
+664078_W..S20231114*WϪϪ"N38SϪϪ"N37SϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+664078_W..SV"*
+
+664078_W..S20231114*W(Ϫ:N38S
+556233_W..NT
+
+556233_W..N20231114*WϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+556233_W..NV"*
+
+556233_W..N20231114*W(Ϫ:N13N
+093467_W..ST
+
+093467_W..S20231114*WϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+093467_W..SV"*
+
+093467_W..S20231114*W	(Ϫ:N35S
+995708_W..NT
+
+995708_W..N20231114*WϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+995708_W..NV"*
+
+995708_W..N20231114*W(Ϫ:N23N
+548019_W..ST
+
+548019_W..S20231114*WϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+548019_W..SV"*
+
+548019_W..S20231114*W(Ϫ:N36S
+117404_W..NT
+
+117404_W..N20231114*WϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+117404_W..NV"*
+
+117404_W..N20231114*W(Ϫ:N21N
+333857_W..ST
+
+333857_W..S20231114*WϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+333857_W..SV"*
+
+333857_W..S20231114*W(Ϫ:N33S
+479597_W..NT
+
+479597_W..N20231114*WϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+479597_W..NV"*
+
+479597_W..N20231114*W(Ϫ:N20N
+463479_W..ST
+
+463479_W..S20231114*WϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+463479_W..SV"*
+
+463479_W..S20231114*W	(Ϫ:N35S
+140361_W..NT
+
+140361_W..N20231114*WϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+140361_W..NV"*
+
+140361_W..N20231114*W(Ϫ:N23N
+974800_W..ST
+
+974800_W..S20231114*WϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+974800_W..SV"*
+
+974800_W..S20231114*W(Ϫ:N36S
+104390_W..NT
+
+104390_W..N20231114*WϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+104390_W..NV"*
+
+104390_W..N20231114*W(Ϫ:N16N
+788872_W..ST
+
+788872_W..S20231114*WϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+788872_W..SV"*
+
+788872_W..S20231114*W(Ϫ:N33S
+147057_W..NT
+
+147057_W..N20231114*WϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+147057_W..NV"*
+
+147057_W..N20231114*W(Ϫ:N13N
+847811_W..ST
+
+847811_W..S20231114*WϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+847811_W..SV"*
+
+847811_W..S20231114*W(Ϫ:N27S
+419703_W..NT
+
+419703_W..N20231114*WϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+419703_W..NV"*
+
+419703_W..N20231114*W
+(Ϫ:N19N
+755047_W..ST
+
+755047_W..S20231114*WϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+755047_W..SV"*
+
+755047_W..S20231114*W(Ϫ:N28S
+767678_W..NT
+
+767678_W..N20231114*WϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+767678_W..NV"*
+
+767678_W..N20231114*W
+(Ϫ:N19N
+748495_W..ST
+
+748495_W..S20231114*WϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+748495_W..SV"*
+
+748495_W..S20231114*W	(Ϫ:N35S
+667935_W..NT
+
+667935_W..N20231114*WϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+667935_W..NV"*
+
+667935_W..N20231114*W(Ϫ:N11N
+414373_W..ST
+
+414373_W..S20231114*WϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+414373_W..SV"*
+
+414373_W..S20231114*W(Ϫ:N29S
+945117_W..NT
+
+945117_W..N20231114*WϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+945117_W..NV"*
+
+945117_W..N20231114*W(Ϫ:N20N
+091957_W..ST
+
+091957_W..S20231114*WϪϪ"N39SϪϪ"N38SϪϪ"N37SϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+091957_W..SV"*
+
+091957_W..S20231114*W(Ϫ:N39S
+133227_W..NT
+
+133227_W..N20231114*WϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+133227_W..NV"*
+
+133227_W..N20231114*W (Ϫ:N09N
+175201_W..ST
+
+175201_W..S20231114*WϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+175201_W..SV"*
+
+175201_W..S20231114*W(Ϫ:N33S
+921072_W..NT
+
+921072_W..N20231114*WϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+921072_W..NV"*
+
+921072_W..N20231114*W(Ϫ:N22N
+335955_W..ST
+
+335955_W..S20231114*WϪϪ"N37SϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+335955_W..SV"*
+
+335955_W..S20231114*W(Ϫ:N37S
+567434_W..NT
+
+567434_W..N20231114*WϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+567434_W..NV"*
+
+567434_W..N20231114*W	(Ϫ:N18N
+944452_W..ST
+
+944452_W..S20231114*WϪϪ"N40SϪϪ"N39SϪϪ"N38SϪϪ"N37SϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+944452_W..SV"*
+
+944452_W..S20231114*W(Ϫ:N40S
+211947_W..NT
+
+211947_W..N20231114*WϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+211947_W..NV"*
+
+211947_W..N20231114*W(Ϫ:N24N
+821957_W..ST
+
+821957_W..S20231114*WϪϪ"N38SϪϪ"N37SϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+821957_W..SV"*
+
+821957_W..S20231114*W(Ϫ:N38S
+148234_W..NT
+
+148234_W..N20231114*WϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+148234_W..NV"*
+
+148234_W..N20231114*W(Ϫ:N22N
+093471_W..ST
+
+093471_W..S20231114*WϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+093471_W..SV"*
+
+093471_W..S20231114*W
+(Ϫ:N34S
+741696_W..NT
+
+741696_W..N20231114*WϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+741696_W..NV"*
+
+741696_W..N20231114*W(Ϫ:N16N
+352801_W..ST
+
+352801_W..S20231114*WϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+352801_W..SV"*
+
+352801_W..S20231114*W(Ϫ:N33S
+641153_W..NT
+
+641153_W..N20231114*WϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪϪ"N36NϪϪ"N37NϪϪ"N38NϪϪ"N39NϪϪ"N40NϪϪ"N41NϪϪ"N42NϪϪ"N43NϪ"N44N:
+641153_W..NV"*
+
+641153_W..N20231114*W(Ϫ:N10N
+892153_W..ST
+
+892153_W..S20231114*WϪϪ"N42SϪϪ"N41SϪϪ"N40SϪϪ"N39SϪϪ"N38SϪϪ"N37SϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪ"N09S:
+892153_W..SV"*
+
+892153_W..S20231114*W(Ϫ:N42S3
+alert0*)*NR"
+ 
+Trains are running with delays3
+alert1*)*QR"
+ 
+Trains are running with delays3
+alert2*)*RR"
+ 
+Trains are running with delays3
+alert3*)*WR"
+ 
+Trains are running with delays
\ No newline at end of file
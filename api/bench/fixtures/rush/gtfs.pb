@@ -0,0 +1,1660 @@
+
+
+1.0Ϫ
+794772_1..ST
+
+794772_1..S20231114*1ϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+794772_1..SV"*
+
+794772_1..S20231114*1(Ϫ:129S
+536110_1..NT
+
+536110_1..N20231114*1ϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+536110_1..NV"*
+
+536110_1..N20231114*1(Ϫ:122N
+821872_1..ST
+
+821872_1..S20231114*1ϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+821872_1..SV"*
+
+821872_1..S20231114*1	(Ϫ:133S
+611720_1..NT
+
+611720_1..N20231114*1ϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+611720_1..NV"*
+
+611720_1..N20231114*1(Ϫ:113N
+295528_1..ST
+
+295528_1..S20231114*1ϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+295528_1..SV"*
+
+295528_1..S20231114*1(Ϫ:138S
+838234_1..NT
+
+838234_1..N20231114*1ϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+838234_1..NV"*
+
+838234_1..N20231114*1(Ϫ:115N
+849574_1..ST
+
+849574_1..S20231114*1ϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+849574_1..SV"*
+
+849574_1..S20231114*1(Ϫ:138S
+765284_1..NT
+
+765284_1..N20231114*1ϪϪ"109NϪϪ"110NϪϪ"111NϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+765284_1..NV"*
+
+765284_1..N20231114*1(Ϫ:109N
+495077_1..ST
+
+495077_1..S20231114*1ϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+495077_1..SV"*
+
+495077_1..S20231114*1(Ϫ:125S
+455262_1..NT
+
+455262_1..N20231114*1ϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+455262_1..NV"*
+
+455262_1..N20231114*1
+(Ϫ:117N
+957361_1..ST
+
+957361_1..S20231114*1ϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+957361_1..SV"*
+
+957361_1..S20231114*1(Ϫ:136S
+464197_1..NT
+
+464197_1..N20231114*1ϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+464197_1..NV"*
+
+464197_1..N20231114*1(Ϫ:123N
+844132_1..ST
+
+844132_1..S20231114*1ϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+844132_1..SV"*
+
+844132_1..S20231114*1(Ϫ:125S
+754665_1..NT
+
+754665_1..N20231114*1ϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+754665_1..NV"*
+
+754665_1..N20231114*1(Ϫ:119N
+001198_1..ST
+
+001198_1..S20231114*1ϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+001198_1..SV"*
+
+001198_1..S20231114*1(Ϫ:127S
+765752_1..NT
+
+765752_1..N20231114*1ϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+765752_1..NV"*
+
+765752_1..N20231114*1
+(Ϫ:117N
+961564_1..ST
+
+961564_1..S20231114*1ϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+961564_1..SV"*
+
+961564_1..S20231114*1(Ϫ:135S
+149416_1..NT
+
+149416_1..N20231114*1ϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+149416_1..NV"*
+
+149416_1..N20231114*1(Ϫ:124N
+084353_1..ST
+
+084353_1..S20231114*1ϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+084353_1..SV"*
+
+084353_1..S20231114*1
+(Ϫ:132S
+513054_1..NT
+
+513054_1..N20231114*1ϪϪ"110NϪϪ"111NϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+513054_1..NV"*
+
+513054_1..N20231114*1(Ϫ:110N
+305230_1..ST
+
+305230_1..S20231114*1ϪϪ"139SϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+305230_1..SV"*
+
+305230_1..S20231114*1(Ϫ:139S
+854030_1..NT
+
+854030_1..N20231114*1ϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+854030_1..NV"*
+
+854030_1..N20231114*1(Ϫ:124N
+632485_1..ST
+
+632485_1..S20231114*1ϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+632485_1..SV"*
+
+632485_1..S20231114*1(Ϫ:125S
+466604_1..NT
+
+466604_1..N20231114*1ϪϪ"109NϪϪ"110NϪϪ"111NϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+466604_1..NV"*
+
+466604_1..N20231114*1(Ϫ:109N
+403598_1..ST
+
+403598_1..S20231114*1ϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+403598_1..SV"*
+
+403598_1..S20231114*1
+(Ϫ:132S
+304432_1..NT
+
+304432_1..N20231114*1ϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+304432_1..NV"*
+
+304432_1..N20231114*1(Ϫ:112N
+195800_1..ST
+
+195800_1..S20231114*1ϪϪ"141SϪϪ"140SϪϪ"139SϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+195800_1..SV"*
+
+195800_1..S20231114*1(Ϫ:141S
+272688_1..NT
+
+272688_1..N20231114*1ϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+272688_1..NV"*
+
+272688_1..N20231114*1(Ϫ:122N
+711693_1..ST
+
+711693_1..S20231114*1ϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+711693_1..SV"*
+
+711693_1..S20231114*1(Ϫ:138S
+040518_1..NT
+
+040518_1..N20231114*1ϪϪ"109NϪϪ"110NϪϪ"111NϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+040518_1..NV"*
+
+040518_1..N20231114*1(Ϫ:109N
+869647_1..ST
+
+869647_1..S20231114*1ϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+869647_1..SV"*
+
+869647_1..S20231114*1(Ϫ:125S
+878565_1..NT
+
+878565_1..N20231114*1ϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+878565_1..NV"*
+
+878565_1..N20231114*1(Ϫ:123N
+851054_1..ST
+
+851054_1..S20231114*1ϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+851054_1..SV"*
+
+851054_1..S20231114*1(Ϫ:135S
+712480_1..NT
+
+712480_1..N20231114*1ϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+712480_1..NV"*
+
+712480_1..N20231114*1(Ϫ:120N
+472449_1..ST
+
+472449_1..S20231114*1ϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+472449_1..SV"*
+
+472449_1..S20231114*1(Ϫ:127S
+734239_1..NT
+
+734239_1..N20231114*1ϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+734239_1..NV"*
+
+734239_1..N20231114*1(Ϫ:118N
+642549_1..ST
+
+642549_1..S20231114*1ϪϪ"139SϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+642549_1..SV"*
+
+642549_1..S20231114*1(Ϫ:139S
+660757_1..NT
+
+660757_1..N20231114*1ϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+660757_1..NV"*
+
+660757_1..N20231114*1
+(Ϫ:117N
+016996_1..ST
+
+016996_1..S20231114*1ϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+016996_1..SV"*
+
+016996_1..S20231114*1(Ϫ:134S
+231169_1..NT
+
+231169_1..N20231114*1ϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+231169_1..NV"*
+
+231169_1..N20231114*1(Ϫ:118N
+446830_1..ST
+
+446830_1..S20231114*1ϪϪ"141SϪϪ"140SϪϪ"139SϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+446830_1..SV"*
+
+446830_1..S20231114*1(Ϫ:141S
+153467_1..NT
+
+153467_1..N20231114*1ϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+153467_1..NV"*
+
+153467_1..N20231114*1(Ϫ:114N
+601742_1..ST
+
+601742_1..S20231114*1ϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+601742_1..SV"*
+
+601742_1..S20231114*1(Ϫ:125S
+077591_1..NT
+
+077591_1..N20231114*1ϪϪ"107NϪϪ"108NϪϪ"109NϪϪ"110NϪϪ"111NϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+077591_1..NV"*
+
+077591_1..N20231114*1 (Ϫ:107N
+197678_1..ST
+
+197678_1..S20231114*1ϪϪ"139SϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+197678_1..SV"*
+
+197678_1..S20231114*1(Ϫ:139S
+874349_2..ST
+
+874349_2..S20231114*2ϪϪ"238SϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+874349_2..SV"*
+
+874349_2..S20231114*2(Ϫ:238S
+022687_2..NT
+
+022687_2..N20231114*2ϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+022687_2..NV"*
+
+022687_2..N20231114*2(Ϫ:212N
+129913_2..ST
+
+129913_2..S20231114*2ϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+129913_2..SV"*
+
+129913_2..S20231114*2(Ϫ:226S
+839643_2..NT
+
+839643_2..N20231114*2ϪϪ"207NϪϪ"208NϪϪ"209NϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+839643_2..NV"*
+
+839643_2..N20231114*2(Ϫ:207N
+570672_2..ST
+
+570672_2..S20231114*2ϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+570672_2..SV"*
+
+570672_2..S20231114*2(Ϫ:228S
+876507_2..NT
+
+876507_2..N20231114*2ϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+876507_2..NV"*
+
+876507_2..N20231114*2(Ϫ:214N
+075467_2..ST
+
+075467_2..S20231114*2ϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+075467_2..SV"*
+
+075467_2..S20231114*2	(Ϫ:232S
+189077_2..NT
+
+189077_2..N20231114*2ϪϪ"207NϪϪ"208NϪϪ"209NϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+189077_2..NV"*
+
+189077_2..N20231114*2(Ϫ:207N
+041291_2..ST
+
+041291_2..S20231114*2ϪϪ"238SϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+041291_2..SV"*
+
+041291_2..S20231114*2(Ϫ:238S
+209039_2..NT
+
+209039_2..N20231114*2ϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+209039_2..NV"*
+
+209039_2..N20231114*2(Ϫ:214N
+767136_2..ST
+
+767136_2..S20231114*2ϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+767136_2..SV"*
+
+767136_2..S20231114*2(Ϫ:226S
+731588_2..NT
+
+731588_2..N20231114*2ϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+731588_2..NV"*
+
+731588_2..N20231114*2(Ϫ:212N
+709048_2..ST
+
+709048_2..S20231114*2ϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+709048_2..SV"*
+
+709048_2..S20231114*2(Ϫ:236S
+555193_2..NT
+
+555193_2..N20231114*2ϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+555193_2..NV"*
+
+555193_2..N20231114*2(Ϫ:214N
+966177_2..ST
+
+966177_2..S20231114*2ϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+966177_2..SV"*
+
+966177_2..S20231114*2(Ϫ:227S
+013845_2..NT
+
+013845_2..N20231114*2ϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+013845_2..NV"*
+
+013845_2..N20231114*2(Ϫ:221N
+943821_2..ST
+
+943821_2..S20231114*2ϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+943821_2..SV"*
+
+943821_2..S20231114*2(Ϫ:225S
+374500_2..NT
+
+374500_2..N20231114*2ϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+374500_2..NV"*
+
+374500_2..N20231114*2(Ϫ:218N
+160864_2..ST
+
+160864_2..S20231114*2ϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+160864_2..SV"*
+
+160864_2..S20231114*2(Ϫ:224S
+480199_2..NT
+
+480199_2..N20231114*2ϪϪ"208NϪϪ"209NϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+480199_2..NV"*
+
+480199_2..N20231114*2(Ϫ:208N
+047916_2..ST
+
+047916_2..S20231114*2ϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+047916_2..SV"*
+
+047916_2..S20231114*2(Ϫ:224S
+251794_2..NT
+
+251794_2..N20231114*2ϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+251794_2..NV"*
+
+251794_2..N20231114*2(Ϫ:221N
+301861_2..ST
+
+301861_2..S20231114*2ϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+301861_2..SV"*
+
+301861_2..S20231114*2(Ϫ:230S
+664532_2..NT
+
+664532_2..N20231114*2ϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+664532_2..NV"*
+
+664532_2..N20231114*2(Ϫ:210N
+784844_2..ST
+
+784844_2..S20231114*2ϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+784844_2..SV"*
+
+784844_2..S20231114*2(Ϫ:228S
+001598_2..NT
+
+001598_2..N20231114*2ϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+001598_2..NV"*
+
+001598_2..N20231114*2(Ϫ:212N
+167855_2..ST
+
+167855_2..S20231114*2ϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+167855_2..SV"*
+
+167855_2..S20231114*2(Ϫ:234S
+469903_2..NT
+
+469903_2..N20231114*2ϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+469903_2..NV"*
+
+469903_2..N20231114*2(Ϫ:218N
+917019_2..ST
+
+917019_2..S20231114*2ϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+917019_2..SV"*
+
+917019_2..S20231114*2(Ϫ:228S
+914031_2..NT
+
+914031_2..N20231114*2ϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+914031_2..NV"*
+
+914031_2..N20231114*2(Ϫ:219N
+049052_2..ST
+
+049052_2..S20231114*2ϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+049052_2..SV"*
+
+049052_2..S20231114*2(Ϫ:236S
+271819_2..NT
+
+271819_2..N20231114*2ϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+271819_2..NV"*
+
+271819_2..N20231114*2(Ϫ:211N
+927932_2..ST
+
+927932_2..S20231114*2ϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+927932_2..SV"*
+
+927932_2..S20231114*2(Ϫ:226S
+792183_2..NT
+
+792183_2..N20231114*2ϪϪ"206NϪϪ"207NϪϪ"208NϪϪ"209NϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+792183_2..NV"*
+
+792183_2..N20231114*2 (Ϫ:206N
+341776_2..ST
+
+341776_2..S20231114*2ϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+341776_2..SV"*
+
+341776_2..S20231114*2	(Ϫ:232S
+848346_2..NT
+
+848346_2..N20231114*2ϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+848346_2..NV"*
+
+848346_2..N20231114*2(Ϫ:219N
+663841_2..ST
+
+663841_2..S20231114*2ϪϪ"239SϪϪ"238SϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+663841_2..SV"*
+
+663841_2..S20231114*2(Ϫ:239S
+421335_2..NT
+
+421335_2..N20231114*2ϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+421335_2..NV"*
+
+421335_2..N20231114*2(Ϫ:219N
+223896_2..ST
+
+223896_2..S20231114*2ϪϪ"241SϪϪ"240SϪϪ"239SϪϪ"238SϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+223896_2..SV"*
+
+223896_2..S20231114*2 (Ϫ:241S
+708587_2..NT
+
+708587_2..N20231114*2ϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+708587_2..NV"*
+
+708587_2..N20231114*2(Ϫ:222N
+199711_2..ST
+
+199711_2..S20231114*2ϪϪ"238SϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+199711_2..SV"*
+
+199711_2..S20231114*2(Ϫ:238S
+208159_2..NT
+
+208159_2..N20231114*2ϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+208159_2..NV"*
+
+208159_2..N20231114*2	(Ϫ:215N
+191072_2..ST
+
+191072_2..S20231114*2ϪϪ"238SϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+191072_2..SV"*
+
+191072_2..S20231114*2(Ϫ:238S
+967594_2..NT
+
+967594_2..N20231114*2ϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪϪ"240NϪ"241N:
+967594_2..NV"*
+
+967594_2..N20231114*2(Ϫ:218N
+022906_2..ST
+
+022906_2..S20231114*2ϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪ"206S:
+022906_2..SV"*
+
+022906_2..S20231114*2(Ϫ:233S
+903201_3..ST
+
+903201_3..S20231114*3ϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+903201_3..SV"*
+
+903201_3..S20231114*3(Ϫ:329S
+546167_3..NT
+
+546167_3..N20231114*3ϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+546167_3..NV"*
+
+546167_3..N20231114*3(Ϫ:313N
+161942_3..ST
+
+161942_3..S20231114*3ϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+161942_3..SV"*
+
+161942_3..S20231114*3(Ϫ:329S
+042638_3..NT
+
+042638_3..N20231114*3ϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+042638_3..NV"*
+
+042638_3..N20231114*3(Ϫ:308N
+585478_3..ST
+
+585478_3..S20231114*3ϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+585478_3..SV"*
+
+585478_3..S20231114*3
+(Ϫ:327S
+954048_3..NT
+
+954048_3..N20231114*3ϪϪ"303NϪϪ"304NϪϪ"305NϪϪ"306NϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+954048_3..NV"*
+
+954048_3..N20231114*3(Ϫ:303N
+687196_3..ST
+
+687196_3..S20231114*3ϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+687196_3..SV"*
+
+687196_3..S20231114*3(Ϫ:322S
+480944_3..NT
+
+480944_3..N20231114*3ϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+480944_3..NV"*
+
+480944_3..N20231114*3(Ϫ:315N
+564059_3..ST
+
+564059_3..S20231114*3ϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+564059_3..SV"*
+
+564059_3..S20231114*3(Ϫ:332S
+615645_3..NT
+
+615645_3..N20231114*3ϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+615645_3..NV"*
+
+615645_3..N20231114*3	(Ϫ:311N
+158359_3..ST
+
+158359_3..S20231114*3ϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+158359_3..SV"*
+
+158359_3..S20231114*3(Ϫ:329S
+827979_3..NT
+
+827979_3..N20231114*3ϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+827979_3..NV"*
+
+827979_3..N20231114*3(Ϫ:313N
+817277_3..ST
+
+817277_3..S20231114*3ϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+817277_3..SV"*
+
+817277_3..S20231114*3(Ϫ:336S
+171820_3..NT
+
+171820_3..N20231114*3ϪϪ"306NϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+171820_3..NV"*
+
+171820_3..N20231114*3(Ϫ:306N
+378438_3..ST
+
+378438_3..S20231114*3ϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+378438_3..SV"*
+
+378438_3..S20231114*3(Ϫ:325S
+307659_3..NT
+
+307659_3..N20231114*3ϪϪ"305NϪϪ"306NϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+307659_3..NV"*
+
+307659_3..N20231114*3(Ϫ:305N
+251350_3..ST
+
+251350_3..S20231114*3ϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+251350_3..SV"*
+
+251350_3..S20231114*3(Ϫ:336S
+898667_3..NT
+
+898667_3..N20231114*3ϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+898667_3..NV"*
+
+898667_3..N20231114*3(Ϫ:318N
+422753_3..ST
+
+422753_3..S20231114*3ϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+422753_3..SV"*
+
+422753_3..S20231114*3
+(Ϫ:327S
+113929_3..NT
+
+113929_3..N20231114*3ϪϪ"305NϪϪ"306NϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+113929_3..NV"*
+
+113929_3..N20231114*3(Ϫ:305N
+504545_3..ST
+
+504545_3..S20231114*3ϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+504545_3..SV"*
+
+504545_3..S20231114*3(Ϫ:322S
+836631_3..NT
+
+836631_3..N20231114*3ϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+836631_3..NV"*
+
+836631_3..N20231114*3
+(Ϫ:312N
+121643_3..ST
+
+121643_3..S20231114*3ϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+121643_3..SV"*
+
+121643_3..S20231114*3(Ϫ:322S
+316568_3..NT
+
+316568_3..N20231114*3ϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+316568_3..NV"*
+
+316568_3..N20231114*3
+(Ϫ:312N
+163225_3..ST
+
+163225_3..S20231114*3ϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+163225_3..SV"*
+
+163225_3..S20231114*3(Ϫ:332S
+393815_3..NT
+
+393815_3..N20231114*3ϪϪ"304NϪϪ"305NϪϪ"306NϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+393815_3..NV"*
+
+393815_3..N20231114*3(Ϫ:304N
+088782_3..ST
+
+088782_3..S20231114*3ϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+088782_3..SV"*
+
+088782_3..S20231114*3(Ϫ:331S
+403504_3..NT
+
+403504_3..N20231114*3ϪϪ"302NϪϪ"303NϪϪ"304NϪϪ"305NϪϪ"306NϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+403504_3..NV"*
+
+403504_3..N20231114*3 (Ϫ:302N
+583505_3..ST
+
+583505_3..S20231114*3ϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+583505_3..SV"*
+
+583505_3..S20231114*3(Ϫ:321S
+964850_3..NT
+
+964850_3..N20231114*3ϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+964850_3..NV"*
+
+964850_3..N20231114*3(Ϫ:317N
+712300_3..ST
+
+712300_3..S20231114*3ϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+712300_3..SV"*
+
+712300_3..S20231114*3(Ϫ:331S
+386223_3..NT
+
+386223_3..N20231114*3ϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+386223_3..NV"*
+
+386223_3..N20231114*3(Ϫ:309N
+814848_3..ST
+
+814848_3..S20231114*3ϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+814848_3..SV"*
+
+814848_3..S20231114*3(Ϫ:332S
+375935_3..NT
+
+375935_3..N20231114*3ϪϪ"305NϪϪ"306NϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+375935_3..NV"*
+
+375935_3..N20231114*3(Ϫ:305N
+905528_3..ST
+
+905528_3..S20231114*3ϪϪ"337SϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+905528_3..SV"*
+
+905528_3..S20231114*3 (Ϫ:337S
+788988_3..NT
+
+788988_3..N20231114*3ϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+788988_3..NV"*
+
+788988_3..N20231114*3(Ϫ:308N
+417284_3..ST
+
+417284_3..S20231114*3ϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+417284_3..SV"*
+
+417284_3..S20231114*3(Ϫ:329S
+044146_3..NT
+
+044146_3..N20231114*3ϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+044146_3..NV"*
+
+044146_3..N20231114*3(Ϫ:308N
+109712_3..ST
+
+109712_3..S20231114*3ϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+109712_3..SV"*
+
+109712_3..S20231114*3(Ϫ:331S
+379209_3..NT
+
+379209_3..N20231114*3ϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+379209_3..NV"*
+
+379209_3..N20231114*3(Ϫ:319N
+625203_3..ST
+
+625203_3..S20231114*3ϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+625203_3..SV"*
+
+625203_3..S20231114*3(Ϫ:322S
+425624_3..NT
+
+425624_3..N20231114*3ϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+425624_3..NV"*
+
+425624_3..N20231114*3(Ϫ:315N
+712316_3..ST
+
+712316_3..S20231114*3ϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+712316_3..SV"*
+
+712316_3..S20231114*3
+(Ϫ:327S
+665913_3..NT
+
+665913_3..N20231114*3ϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪ"337N:
+665913_3..NV"*
+
+665913_3..N20231114*3(Ϫ:308N
+976552_3..ST
+
+976552_3..S20231114*3ϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪϪ"307SϪϪ"306SϪϪ"305SϪϪ"304SϪϪ"303SϪ"302S:
+976552_3..SV"*
+
+976552_3..S20231114*3(Ϫ:330S
+857859_4..ST
+
+857859_4..S20231114*4ϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+857859_4..SV"*
+
+857859_4..S20231114*4
+(Ϫ:431S
+155573_4..NT
+
+155573_4..N20231114*4ϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+155573_4..NV"*
+
+155573_4..N20231114*4(Ϫ:414N
+163478_4..ST
+
+163478_4..S20231114*4ϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+163478_4..SV"*
+
+163478_4..S20231114*4(Ϫ:429S
+753015_4..NT
+
+753015_4..N20231114*4ϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+753015_4..NV"*
+
+753015_4..N20231114*4(Ϫ:421N
+088754_4..ST
+
+088754_4..S20231114*4ϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+088754_4..SV"*
+
+088754_4..S20231114*4(Ϫ:425S
+236024_4..NT
+
+236024_4..N20231114*4ϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+236024_4..NV"*
+
+236024_4..N20231114*4(Ϫ:410N
+016027_4..ST
+
+016027_4..S20231114*4ϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+016027_4..SV"*
+
+016027_4..S20231114*4(Ϫ:427S
+168495_4..NT
+
+168495_4..N20231114*4ϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+168495_4..NV"*
+
+168495_4..N20231114*4(Ϫ:410N
+389359_4..ST
+
+389359_4..S20231114*4ϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+389359_4..SV"*
+
+389359_4..S20231114*4(Ϫ:425S
+555543_4..NT
+
+555543_4..N20231114*4ϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+555543_4..NV"*
+
+555543_4..N20231114*4(Ϫ:422N
+095050_4..ST
+
+095050_4..S20231114*4ϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+095050_4..SV"*
+
+095050_4..S20231114*4(Ϫ:425S
+783249_4..NT
+
+783249_4..N20231114*4ϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+783249_4..NV"*
+
+783249_4..N20231114*4(Ϫ:419N
+561424_4..ST
+
+561424_4..S20231114*4ϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+561424_4..SV"*
+
+561424_4..S20231114*4(Ϫ:428S
+829465_4..NT
+
+829465_4..N20231114*4ϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+829465_4..NV"*
+
+829465_4..N20231114*4(Ϫ:418N
+244917_4..ST
+
+244917_4..S20231114*4ϪϪ"441SϪϪ"440SϪϪ"439SϪϪ"438SϪϪ"437SϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+244917_4..SV"*
+
+244917_4..S20231114*4 (Ϫ:441S
+000252_4..NT
+
+000252_4..N20231114*4ϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+000252_4..NV"*
+
+000252_4..N20231114*4(Ϫ:411N
+597967_4..ST
+
+597967_4..S20231114*4ϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+597967_4..SV"*
+
+597967_4..S20231114*4(Ϫ:433S
+517482_4..NT
+
+517482_4..N20231114*4ϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+517482_4..NV"*
+
+517482_4..N20231114*4(Ϫ:414N
+427895_4..ST
+
+427895_4..S20231114*4ϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+427895_4..SV"*
+
+427895_4..S20231114*4(Ϫ:429S
+171751_4..NT
+
+171751_4..N20231114*4ϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+171751_4..NV"*
+
+171751_4..N20231114*4(Ϫ:410N
+764884_4..ST
+
+764884_4..S20231114*4ϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+764884_4..SV"*
+
+764884_4..S20231114*4
+(Ϫ:431S
+504711_4..NT
+
+504711_4..N20231114*4ϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+504711_4..NV"*
+
+504711_4..N20231114*4(Ϫ:419N
+933192_4..ST
+
+933192_4..S20231114*4ϪϪ"439SϪϪ"438SϪϪ"437SϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+933192_4..SV"*
+
+933192_4..S20231114*4(Ϫ:439S
+158726_4..NT
+
+158726_4..N20231114*4ϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+158726_4..NV"*
+
+158726_4..N20231114*4(Ϫ:417N
+641488_4..ST
+
+641488_4..S20231114*4ϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+641488_4..SV"*
+
+641488_4..S20231114*4(Ϫ:427S
+049317_4..NT
+
+049317_4..N20231114*4ϪϪ"409NϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+049317_4..NV"*
+
+049317_4..N20231114*4(Ϫ:409N
+158720_4..ST
+
+158720_4..S20231114*4ϪϪ"441SϪϪ"440SϪϪ"439SϪϪ"438SϪϪ"437SϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+158720_4..SV"*
+
+158720_4..S20231114*4 (Ϫ:441S
+647391_4..NT
+
+647391_4..N20231114*4ϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+647391_4..NV"*
+
+647391_4..N20231114*4(Ϫ:410N
+110407_4..ST
+
+110407_4..S20231114*4ϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+110407_4..SV"*
+
+110407_4..S20231114*4(Ϫ:424S
+204444_4..NT
+
+204444_4..N20231114*4ϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+204444_4..NV"*
+
+204444_4..N20231114*4(Ϫ:418N
+924085_4..ST
+
+924085_4..S20231114*4ϪϪ"440SϪϪ"439SϪϪ"438SϪϪ"437SϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+924085_4..SV"*
+
+924085_4..S20231114*4(Ϫ:440S
+489882_4..NT
+
+489882_4..N20231114*4ϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+489882_4..NV"*
+
+489882_4..N20231114*4
+(Ϫ:416N
+715684_4..ST
+
+715684_4..S20231114*4ϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+715684_4..SV"*
+
+715684_4..S20231114*4	(Ϫ:432S
+406475_4..NT
+
+406475_4..N20231114*4ϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+406475_4..NV"*
+
+406475_4..N20231114*4	(Ϫ:415N
+127456_4..ST
+
+127456_4..S20231114*4ϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+127456_4..SV"*
+
+127456_4..S20231114*4(Ϫ:425S
+820106_4..NT
+
+820106_4..N20231114*4ϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+820106_4..NV"*
+
+820106_4..N20231114*4(Ϫ:418N
+793369_4..ST
+
+793369_4..S20231114*4ϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+793369_4..SV"*
+
+793369_4..S20231114*4(Ϫ:435S
+827912_4..NT
+
+827912_4..N20231114*4ϪϪ"408NϪϪ"409NϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+827912_4..NV"*
+
+827912_4..N20231114*4(Ϫ:408N
+979673_4..ST
+
+979673_4..S20231114*4ϪϪ"440SϪϪ"439SϪϪ"438SϪϪ"437SϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+979673_4..SV"*
+
+979673_4..S20231114*4(Ϫ:440S
+944841_4..NT
+
+944841_4..N20231114*4ϪϪ"406NϪϪ"407NϪϪ"408NϪϪ"409NϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+944841_4..NV"*
+
+944841_4..N20231114*4 (Ϫ:406N
+596908_4..ST
+
+596908_4..S20231114*4ϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+596908_4..SV"*
+
+596908_4..S20231114*4(Ϫ:435S
+814054_4..NT
+
+814054_4..N20231114*4ϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+814054_4..NV"*
+
+814054_4..N20231114*4(Ϫ:422N
+440518_4..ST
+
+440518_4..S20231114*4ϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+440518_4..SV"*
+
+440518_4..S20231114*4(Ϫ:425S
+152767_4..NT
+
+152767_4..N20231114*4ϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪ"441N:
+152767_4..NV"*
+
+152767_4..N20231114*4(Ϫ:419N
+967710_4..ST
+
+967710_4..S20231114*4ϪϪ"439SϪϪ"438SϪϪ"437SϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪ"406S:
+967710_4..SV"*
+
+967710_4..S20231114*4(Ϫ:439S
+104030_5..ST
+
+104030_5..S20231114*5ϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+104030_5..SV"*
+
+104030_5..S20231114*5(Ϫ:524S
+032192_5..NT
+
+032192_5..N20231114*5ϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+032192_5..NV"*
+
+032192_5..N20231114*5(Ϫ:516N
+437276_5..ST
+
+437276_5..S20231114*5ϪϪ"537SϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+437276_5..SV"*
+
+437276_5..S20231114*5 (Ϫ:537S
+906030_5..NT
+
+906030_5..N20231114*5ϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+906030_5..NV"*
+
+906030_5..N20231114*5
+(Ϫ:512N
+369626_5..ST
+
+369626_5..S20231114*5ϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+369626_5..SV"*
+
+369626_5..S20231114*5(Ϫ:535S
+725378_5..NT
+
+725378_5..N20231114*5ϪϪ"502NϪϪ"503NϪϪ"504NϪϪ"505NϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+725378_5..NV"*
+
+725378_5..N20231114*5 (Ϫ:502N
+186549_5..ST
+
+186549_5..S20231114*5ϪϪ"537SϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+186549_5..SV"*
+
+186549_5..S20231114*5 (Ϫ:537S
+383571_5..NT
+
+383571_5..N20231114*5ϪϪ"504NϪϪ"505NϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+383571_5..NV"*
+
+383571_5..N20231114*5(Ϫ:504N
+150251_5..ST
+
+150251_5..S20231114*5ϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+150251_5..SV"*
+
+150251_5..S20231114*5(Ϫ:531S
+691030_5..NT
+
+691030_5..N20231114*5ϪϪ"505NϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+691030_5..NV"*
+
+691030_5..N20231114*5(Ϫ:505N
+387061_5..ST
+
+387061_5..S20231114*5ϪϪ"537SϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+387061_5..SV"*
+
+387061_5..S20231114*5 (Ϫ:537S
+900910_5..NT
+
+900910_5..N20231114*5ϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+900910_5..NV"*
+
+900910_5..N20231114*5(Ϫ:506N
+117850_5..ST
+
+117850_5..S20231114*5ϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+117850_5..SV"*
+
+117850_5..S20231114*5(Ϫ:522S
+270762_5..NT
+
+270762_5..N20231114*5ϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+270762_5..NV"*
+
+270762_5..N20231114*5(Ϫ:506N
+379836_5..ST
+
+379836_5..S20231114*5ϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+379836_5..SV"*
+
+379836_5..S20231114*5
+(Ϫ:527S
+310741_5..NT
+
+310741_5..N20231114*5ϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+310741_5..NV"*
+
+310741_5..N20231114*5(Ϫ:519N
+192985_5..ST
+
+192985_5..S20231114*5ϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+192985_5..SV"*
+
+192985_5..S20231114*5(Ϫ:535S
+609064_5..NT
+
+609064_5..N20231114*5ϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+609064_5..NV"*
+
+609064_5..N20231114*5	(Ϫ:511N
+941280_5..ST
+
+941280_5..S20231114*5ϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+941280_5..SV"*
+
+941280_5..S20231114*5(Ϫ:533S
+233641_5..NT
+
+233641_5..N20231114*5ϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+233641_5..NV"*
+
+233641_5..N20231114*5
+(Ϫ:512N
+248153_5..ST
+
+248153_5..S20231114*5ϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+248153_5..SV"*
+
+248153_5..S20231114*5(Ϫ:532S
+440176_5..NT
+
+440176_5..N20231114*5ϪϪ"503NϪϪ"504NϪϪ"505NϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+440176_5..NV"*
+
+440176_5..N20231114*5(Ϫ:503N
+021547_5..ST
+
+021547_5..S20231114*5ϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+021547_5..SV"*
+
+021547_5..S20231114*5(Ϫ:525S
+076767_5..NT
+
+076767_5..N20231114*5ϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+076767_5..NV"*
+
+076767_5..N20231114*5(Ϫ:506N
+577531_5..ST
+
+577531_5..S20231114*5ϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+577531_5..SV"*
+
+577531_5..S20231114*5(Ϫ:524S
+442696_5..NT
+
+442696_5..N20231114*5ϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+442696_5..NV"*
+
+442696_5..N20231114*5	(Ϫ:511N
+088663_5..ST
+
+088663_5..S20231114*5ϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+088663_5..SV"*
+
+088663_5..S20231114*5(Ϫ:530S
+387193_5..NT
+
+387193_5..N20231114*5ϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+387193_5..NV"*
+
+387193_5..N20231114*5(Ϫ:518N
+428475_5..ST
+
+428475_5..S20231114*5ϪϪ"537SϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+428475_5..SV"*
+
+428475_5..S20231114*5 (Ϫ:537S
+945042_5..NT
+
+945042_5..N20231114*5ϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+945042_5..NV"*
+
+945042_5..N20231114*5
+(Ϫ:512N
+389647_5..ST
+
+389647_5..S20231114*5ϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+389647_5..SV"*
+
+389647_5..S20231114*5	(Ϫ:528S
+996428_5..NT
+
+996428_5..N20231114*5ϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+996428_5..NV"*
+
+996428_5..N20231114*5(Ϫ:507N
+117606_5..ST
+
+117606_5..S20231114*5ϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+117606_5..SV"*
+
+117606_5..S20231114*5(Ϫ:520S
+161353_5..NT
+
+161353_5..N20231114*5ϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+161353_5..NV"*
+
+161353_5..N20231114*5(Ϫ:516N
+804929_5..ST
+
+804929_5..S20231114*5ϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+804929_5..SV"*
+
+804929_5..S20231114*5(Ϫ:524S
+260002_5..NT
+
+260002_5..N20231114*5ϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+260002_5..NV"*
+
+260002_5..N20231114*5(Ϫ:516N
+548770_5..ST
+
+548770_5..S20231114*5ϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+548770_5..SV"*
+
+548770_5..S20231114*5(Ϫ:533S
+662193_5..NT
+
+662193_5..N20231114*5ϪϪ"504NϪϪ"505NϪϪ"506NϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+662193_5..NV"*
+
+662193_5..N20231114*5(Ϫ:504N
+213531_5..ST
+
+213531_5..S20231114*5ϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+213531_5..SV"*
+
+213531_5..S20231114*5	(Ϫ:528S
+732945_5..NT
+
+732945_5..N20231114*5ϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+732945_5..NV"*
+
+732945_5..N20231114*5(Ϫ:516N
+008154_5..ST
+
+008154_5..S20231114*5ϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+008154_5..SV"*
+
+008154_5..S20231114*5(Ϫ:531S
+805971_5..NT
+
+805971_5..N20231114*5ϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+805971_5..NV"*
+
+805971_5..N20231114*5	(Ϫ:511N
+163809_5..ST
+
+163809_5..S20231114*5ϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+163809_5..SV"*
+
+163809_5..S20231114*5(Ϫ:524S
+711121_5..NT
+
+711121_5..N20231114*5ϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪ"537N:
+711121_5..NV"*
+
+711121_5..N20231114*5(Ϫ:517N
+799009_5..ST
+
+799009_5..S20231114*5ϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪϪ"505SϪϪ"504SϪϪ"503SϪ"502S:
+799009_5..SV"*
+
+799009_5..S20231114*5(Ϫ:525S
+126701_6..ST
+
+126701_6..S20231114*6ϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+126701_6..SV"*
+
+126701_6..S20231114*6(Ϫ:628S
+000265_6..NT
+
+000265_6..N20231114*6ϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+000265_6..NV"*
+
+000265_6..N20231114*6(Ϫ:609N
+933821_6..ST
+
+933821_6..S20231114*6ϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+933821_6..SV"*
+
+933821_6..S20231114*6(Ϫ:624S
+782815_6..NT
+
+782815_6..N20231114*6ϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+782815_6..NV"*
+
+782815_6..N20231114*6(Ϫ:609N
+913622_6..ST
+
+913622_6..S20231114*6ϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+913622_6..SV"*
+
+913622_6..S20231114*6(Ϫ:630S
+037173_6..NT
+
+037173_6..N20231114*6ϪϪ"603NϪϪ"604NϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+037173_6..NV"*
+
+037173_6..N20231114*6(Ϫ:603N
+559560_6..ST
+
+559560_6..S20231114*6ϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+559560_6..SV"*
+
+559560_6..S20231114*6
+(Ϫ:626S
+901202_6..NT
+
+901202_6..N20231114*6ϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+901202_6..NV"*
+
+901202_6..N20231114*6(Ϫ:608N
+434981_6..ST
+
+434981_6..S20231114*6ϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+434981_6..SV"*
+
+434981_6..S20231114*6	(Ϫ:627S
+140950_6..NT
+
+140950_6..N20231114*6ϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+140950_6..NV"*
+
+140950_6..N20231114*6(Ϫ:617N
+557187_6..ST
+
+557187_6..S20231114*6ϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+557187_6..SV"*
+
+557187_6..S20231114*6(Ϫ:633S
+569977_6..NT
+
+569977_6..N20231114*6ϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+569977_6..NV"*
+
+569977_6..N20231114*6(Ϫ:613N
+463852_6..ST
+
+463852_6..S20231114*6ϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+463852_6..SV"*
+
+463852_6..S20231114*6(Ϫ:625S
+144507_6..NT
+
+144507_6..N20231114*6ϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+144507_6..NV"*
+
+144507_6..N20231114*6(Ϫ:606N
+126372_6..ST
+
+126372_6..S20231114*6ϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+126372_6..SV"*
+
+126372_6..S20231114*6(Ϫ:624S
+490673_6..NT
+
+490673_6..N20231114*6ϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+490673_6..NV"*
+
+490673_6..N20231114*6(Ϫ:605N
+313483_6..ST
+
+313483_6..S20231114*6ϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+313483_6..SV"*
+
+313483_6..S20231114*6(Ϫ:625S
+778405_6..NT
+
+778405_6..N20231114*6ϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+778405_6..NV"*
+
+778405_6..N20231114*6(Ϫ:614N
+512604_6..ST
+
+512604_6..S20231114*6ϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+512604_6..SV"*
+
+512604_6..S20231114*6(Ϫ:620S
+683728_6..NT
+
+683728_6..N20231114*6ϪϪ"602NϪϪ"603NϪϪ"604NϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+683728_6..NV"*
+
+683728_6..N20231114*6(Ϫ:602N
+149748_6..ST
+
+149748_6..S20231114*6ϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+149748_6..SV"*
+
+149748_6..S20231114*6(Ϫ:621S
+651314_6..NT
+
+651314_6..N20231114*6ϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+651314_6..NV"*
+
+651314_6..N20231114*6(Ϫ:607N
+494433_6..ST
+
+494433_6..S20231114*6ϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+494433_6..SV"*
+
+494433_6..S20231114*6(Ϫ:624S
+552419_6..NT
+
+552419_6..N20231114*6ϪϪ"603NϪϪ"604NϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+552419_6..NV"*
+
+552419_6..N20231114*6(Ϫ:603N
+085325_6..ST
+
+085325_6..S20231114*6ϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+085325_6..SV"*
+
+085325_6..S20231114*6(Ϫ:624S
+043178_6..NT
+
+043178_6..N20231114*6ϪϪ"604NϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+043178_6..NV"*
+
+043178_6..N20231114*6(Ϫ:604N
+283459_6..ST
+
+283459_6..S20231114*6ϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+283459_6..SV"*
+
+283459_6..S20231114*6	(Ϫ:627S
+788124_6..NT
+
+788124_6..N20231114*6ϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+788124_6..NV"*
+
+788124_6..N20231114*6	(Ϫ:610N
+455101_6..ST
+
+455101_6..S20231114*6ϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+455101_6..SV"*
+
+455101_6..S20231114*6(Ϫ:622S
+176428_6..NT
+
+176428_6..N20231114*6ϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+176428_6..NV"*
+
+176428_6..N20231114*6
+(Ϫ:611N
+940783_6..ST
+
+940783_6..S20231114*6ϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+940783_6..SV"*
+
+940783_6..S20231114*6(Ϫ:623S
+978564_6..NT
+
+978564_6..N20231114*6ϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+978564_6..NV"*
+
+978564_6..N20231114*6(Ϫ:605N
+135500_6..ST
+
+135500_6..S20231114*6ϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+135500_6..SV"*
+
+135500_6..S20231114*6(Ϫ:630S
+366128_6..NT
+
+366128_6..N20231114*6ϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+366128_6..NV"*
+
+366128_6..N20231114*6(Ϫ:613N
+515855_6..ST
+
+515855_6..S20231114*6ϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+515855_6..SV"*
+
+515855_6..S20231114*6(Ϫ:624S
+205725_6..NT
+
+205725_6..N20231114*6ϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+205725_6..NV"*
+
+205725_6..N20231114*6(Ϫ:615N
+744485_6..ST
+
+744485_6..S20231114*6ϪϪ"635SϪϪ"634SϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+744485_6..SV"*
+
+744485_6..S20231114*6(Ϫ:635S
+245397_6..NT
+
+245397_6..N20231114*6ϪϪ"603NϪϪ"604NϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+245397_6..NV"*
+
+245397_6..N20231114*6(Ϫ:603N
+059758_6..ST
+
+059758_6..S20231114*6ϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+059758_6..SV"*
+
+059758_6..S20231114*6(Ϫ:631S
+311979_6..NT
+
+311979_6..N20231114*6ϪϪ"603NϪϪ"604NϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+311979_6..NV"*
+
+311979_6..N20231114*6(Ϫ:603N
+298240_6..ST
+
+298240_6..S20231114*6ϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+298240_6..SV"*
+
+298240_6..S20231114*6(Ϫ:625S
+056560_6..NT
+
+056560_6..N20231114*6ϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+056560_6..NV"*
+
+056560_6..N20231114*6(Ϫ:617N
+573761_6..ST
+
+573761_6..S20231114*6ϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+573761_6..SV"*
+
+573761_6..S20231114*6(Ϫ:623S
+514014_6..NT
+
+514014_6..N20231114*6ϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪ"636N:
+514014_6..NV"*
+
+514014_6..N20231114*6(Ϫ:609N
+353573_6..ST
+
+353573_6..S20231114*6ϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪϪ"604SϪϪ"603SϪϪ"602SϪ"601S:
+353573_6..SV"*
+
+353573_6..S20231114*6(Ϫ:628S3
+alert0*)*1R"
+ 
+Trains are running with delays3
+alert1*)*2R"
+ 
+Trains are running with delays3
+alert2*)*3R"
+ 
+Trains are running with delays3
+alert3*)*4R"
+ 
+Trains are running with delays3
+alert4*)*5R"
+ 
+Trains are running with delays3
+alert5*)*6R"
+ 
+Trains are running with delays
\ No newline at end of file
@@ -0,0 +1,42 @@
+
+
+1.0Ϫ
+777820_7..ST
+
+777820_7..S20231114*7ϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+777820_7..SV"*
+
+777820_7..S20231114*7(Ϫ:729S
+775839_7..NT
+
+775839_7..N20231114*7ϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+775839_7..NV"*
+
+775839_7..N20231114*7(Ϫ:721N
+488240_7..ST
+
+488240_7..S20231114*7ϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+488240_7..SV"*
+
+488240_7..S20231114*7(Ϫ:733S
+944662_7..NT
+
+944662_7..N20231114*7ϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+944662_7..NV"*
+
+944662_7..N20231114*7(Ϫ:710N
+491854_7..ST
+
+491854_7..S20231114*7ϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+491854_7..SV"*
+
+491854_7..S20231114*7(Ϫ:733S
+106927_7..NT
+
+106927_7..N20231114*7ϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+106927_7..NV"*
+
+106927_7..N20231114*7(Ϫ:712N3
+alert0*)*7R"
+ 
+Trains are running with delays
\ No newline at end of file
@@ -0,0 +1,121 @@
+
+
+1.0Ϫ
+318031_A..ST
+
+318031_A..S20231114*AϪϪ"A36SϪϪ"A35SϪϪ"A34SϪϪ"A33SϪϪ"A32SϪϪ"A31SϪϪ"A30SϪϪ"A29SϪϪ"A28SϪϪ"A27SϪϪ"A26SϪϪ"A25SϪϪ"A24SϪϪ"A23SϪϪ"A22SϪϪ"A21SϪϪ"A20SϪϪ"A19SϪϪ"A18SϪϪ"A17SϪϪ"A16SϪϪ"A15SϪϪ"A14SϪϪ"A13SϪϪ"A12SϪϪ"A11SϪϪ"A10SϪϪ"A09SϪϪ"A08SϪϪ"A07SϪϪ"A06SϪϪ"A05SϪ"A04S:
+318031_A..SV"*
+
+318031_A..S20231114*A(Ϫ:A36S
+162500_A..NT
+
+162500_A..N20231114*AϪϪ"A06NϪϪ"A07NϪϪ"A08NϪϪ"A09NϪϪ"A10NϪϪ"A11NϪϪ"A12NϪϪ"A13NϪϪ"A14NϪϪ"A15NϪϪ"A16NϪϪ"A17NϪϪ"A18NϪϪ"A19NϪϪ"A20NϪϪ"A21NϪϪ"A22NϪϪ"A23NϪϪ"A24NϪϪ"A25NϪϪ"A26NϪϪ"A27NϪϪ"A28NϪϪ"A29NϪϪ"A30NϪϪ"A31NϪϪ"A32NϪϪ"A33NϪϪ"A34NϪϪ"A35NϪϪ"A36NϪϪ"A37NϪϪ"A38NϪ"A39N:
+162500_A..NV"*
+
+162500_A..N20231114*A(Ϫ:A06N
+421098_A..ST
+
+421098_A..S20231114*AϪϪ"A22SϪϪ"A21SϪϪ"A20SϪϪ"A19SϪϪ"A18SϪϪ"A17SϪϪ"A16SϪϪ"A15SϪϪ"A14SϪϪ"A13SϪϪ"A12SϪϪ"A11SϪϪ"A10SϪϪ"A09SϪϪ"A08SϪϪ"A07SϪϪ"A06SϪϪ"A05SϪ"A04S:
+421098_A..SV"*
+
+421098_A..S20231114*A(Ϫ:A22S
+802331_A..NT
+
+802331_A..N20231114*AϪϪ"A05NϪϪ"A06NϪϪ"A07NϪϪ"A08NϪϪ"A09NϪϪ"A10NϪϪ"A11NϪϪ"A12NϪϪ"A13NϪϪ"A14NϪϪ"A15NϪϪ"A16NϪϪ"A17NϪϪ"A18NϪϪ"A19NϪϪ"A20NϪϪ"A21NϪϪ"A22NϪϪ"A23NϪϪ"A24NϪϪ"A25NϪϪ"A26NϪϪ"A27NϪϪ"A28NϪϪ"A29NϪϪ"A30NϪϪ"A31NϪϪ"A32NϪϪ"A33NϪϪ"A34NϪϪ"A35NϪϪ"A36NϪϪ"A37NϪϪ"A38NϪ"A39N:
+802331_A..NV"*
+
+802331_A..N20231114*A(Ϫ:A05N
+562749_A..ST
+
+562749_A..S20231114*AϪϪ"A28SϪϪ"A27SϪϪ"A26SϪϪ"A25SϪϪ"A24SϪϪ"A23SϪϪ"A22SϪϪ"A21SϪϪ"A20SϪϪ"A19SϪϪ"A18SϪϪ"A17SϪϪ"A16SϪϪ"A15SϪϪ"A14SϪϪ"A13SϪϪ"A12SϪϪ"A11SϪϪ"A10SϪϪ"A09SϪϪ"A08SϪϪ"A07SϪϪ"A06SϪϪ"A05SϪ"A04S:
+562749_A..SV"*
+
+562749_A..S20231114*A(Ϫ:A28S
+181051_A..NT
+
+181051_A..N20231114*AϪϪ"A07NϪϪ"A08NϪϪ"A09NϪϪ"A10NϪϪ"A11NϪϪ"A12NϪϪ"A13NϪϪ"A14NϪϪ"A15NϪϪ"A16NϪϪ"A17NϪϪ"A18NϪϪ"A19NϪϪ"A20NϪϪ"A21NϪϪ"A22NϪϪ"A23NϪϪ"A24NϪϪ"A25NϪϪ"A26NϪϪ"A27NϪϪ"A28NϪϪ"A29NϪϪ"A30NϪϪ"A31NϪϪ"A32NϪϪ"A33NϪϪ"A34NϪϪ"A35NϪϪ"A36NϪϪ"A37NϪϪ"A38NϪ"A39N:
+181051_A..NV"*
+
+181051_A..N20231114*A(Ϫ:A07N
+869185_C..ST
+
+869185_C..S20231114*CϪϪ"C28SϪϪ"C27SϪϪ"C26SϪϪ"C25SϪϪ"C24SϪϪ"C23SϪϪ"C22SϪϪ"C21SϪϪ"C20SϪϪ"C19SϪϪ"C18SϪϪ"C17SϪϪ"C16SϪϪ"C15SϪϪ"C14SϪϪ"C13SϪϪ"C12SϪϪ"C11SϪϪ"C10SϪϪ"C09SϪϪ"C08SϪϪ"C07SϪϪ"C06SϪϪ"C05SϪϪ"C04SϪϪ"C03SϪϪ"C02SϪ"C01S:
+869185_C..SV"*
+
+869185_C..S20231114*C(Ϫ:C28S
+172824_C..NT
+
+172824_C..N20231114*CϪϪ"C10NϪϪ"C11NϪϪ"C12NϪϪ"C13NϪϪ"C14NϪϪ"C15NϪϪ"C16NϪϪ"C17NϪϪ"C18NϪϪ"C19NϪϪ"C20NϪϪ"C21NϪϪ"C22NϪϪ"C23NϪϪ"C24NϪϪ"C25NϪϪ"C26NϪϪ"C27NϪϪ"C28NϪϪ"C29NϪϪ"C30NϪϪ"C31NϪϪ"C32NϪϪ"C33NϪϪ"C34NϪϪ"C35NϪ"C36N:
+172824_C..NV"*
+
+172824_C..N20231114*C	(Ϫ:C10N
+909452_C..ST
+
+909452_C..S20231114*CϪϪ"C25SϪϪ"C24SϪϪ"C23SϪϪ"C22SϪϪ"C21SϪϪ"C20SϪϪ"C19SϪϪ"C18SϪϪ"C17SϪϪ"C16SϪϪ"C15SϪϪ"C14SϪϪ"C13SϪϪ"C12SϪϪ"C11SϪϪ"C10SϪϪ"C09SϪϪ"C08SϪϪ"C07SϪϪ"C06SϪϪ"C05SϪϪ"C04SϪϪ"C03SϪϪ"C02SϪ"C01S:
+909452_C..SV"*
+
+909452_C..S20231114*C(Ϫ:C25S
+635281_C..NT
+
+635281_C..N20231114*CϪϪ"C11NϪϪ"C12NϪϪ"C13NϪϪ"C14NϪϪ"C15NϪϪ"C16NϪϪ"C17NϪϪ"C18NϪϪ"C19NϪϪ"C20NϪϪ"C21NϪϪ"C22NϪϪ"C23NϪϪ"C24NϪϪ"C25NϪϪ"C26NϪϪ"C27NϪϪ"C28NϪϪ"C29NϪϪ"C30NϪϪ"C31NϪϪ"C32NϪϪ"C33NϪϪ"C34NϪϪ"C35NϪ"C36N:
+635281_C..NV"*
+
+635281_C..N20231114*C
+(Ϫ:C11N
+530530_C..ST
+
+530530_C..S20231114*CϪϪ"C29SϪϪ"C28SϪϪ"C27SϪϪ"C26SϪϪ"C25SϪϪ"C24SϪϪ"C23SϪϪ"C22SϪϪ"C21SϪϪ"C20SϪϪ"C19SϪϪ"C18SϪϪ"C17SϪϪ"C16SϪϪ"C15SϪϪ"C14SϪϪ"C13SϪϪ"C12SϪϪ"C11SϪϪ"C10SϪϪ"C09SϪϪ"C08SϪϪ"C07SϪϪ"C06SϪϪ"C05SϪϪ"C04SϪϪ"C03SϪϪ"C02SϪ"C01S:
+530530_C..SV"*
+
+530530_C..S20231114*C(Ϫ:C29S
+496592_C..NT
+
+496592_C..N20231114*CϪϪ"C09NϪϪ"C10NϪϪ"C11NϪϪ"C12NϪϪ"C13NϪϪ"C14NϪϪ"C15NϪϪ"C16NϪϪ"C17NϪϪ"C18NϪϪ"C19NϪϪ"C20NϪϪ"C21NϪϪ"C22NϪϪ"C23NϪϪ"C24NϪϪ"C25NϪϪ"C26NϪϪ"C27NϪϪ"C28NϪϪ"C29NϪϪ"C30NϪϪ"C31NϪϪ"C32NϪϪ"C33NϪϪ"C34NϪϪ"C35NϪ"C36N:
+496592_C..NV"*
+
+496592_C..N20231114*C(Ϫ:C09N
+881288_E..ST
+
+881288_E..S20231114*EϪϪ"E35SϪϪ"E34SϪϪ"E33SϪϪ"E32SϪϪ"E31SϪϪ"E30SϪϪ"E29SϪϪ"E28SϪϪ"E27SϪϪ"E26SϪϪ"E25SϪϪ"E24SϪϪ"E23SϪϪ"E22SϪϪ"E21SϪϪ"E20SϪϪ"E19SϪϪ"E18SϪϪ"E17SϪϪ"E16SϪϪ"E15SϪϪ"E14SϪϪ"E13SϪϪ"E12SϪϪ"E11SϪϪ"E10SϪ"E09S:
+881288_E..SV"*
+
+881288_E..S20231114*E	(Ϫ:E35S
+306123_E..NT
+
+306123_E..N20231114*EϪϪ"E18NϪϪ"E19NϪϪ"E20NϪϪ"E21NϪϪ"E22NϪϪ"E23NϪϪ"E24NϪϪ"E25NϪϪ"E26NϪϪ"E27NϪϪ"E28NϪϪ"E29NϪϪ"E30NϪϪ"E31NϪϪ"E32NϪϪ"E33NϪϪ"E34NϪϪ"E35NϪϪ"E36NϪϪ"E37NϪϪ"E38NϪϪ"E39NϪϪ"E40NϪϪ"E41NϪϪ"E42NϪϪ"E43NϪ"E44N:
+306123_E..NV"*
+
+306123_E..N20231114*E	(Ϫ:E18N
+434053_E..ST
+
+434053_E..S20231114*EϪϪ"E31SϪϪ"E30SϪϪ"E29SϪϪ"E28SϪϪ"E27SϪϪ"E26SϪϪ"E25SϪϪ"E24SϪϪ"E23SϪϪ"E22SϪϪ"E21SϪϪ"E20SϪϪ"E19SϪϪ"E18SϪϪ"E17SϪϪ"E16SϪϪ"E15SϪϪ"E14SϪϪ"E13SϪϪ"E12SϪϪ"E11SϪϪ"E10SϪ"E09S:
+434053_E..SV"*
+
+434053_E..S20231114*E(Ϫ:E31S
+451981_E..NT
+
+451981_E..N20231114*EϪϪ"E23NϪϪ"E24NϪϪ"E25NϪϪ"E26NϪϪ"E27NϪϪ"E28NϪϪ"E29NϪϪ"E30NϪϪ"E31NϪϪ"E32NϪϪ"E33NϪϪ"E34NϪϪ"E35NϪϪ"E36NϪϪ"E37NϪϪ"E38NϪϪ"E39NϪϪ"E40NϪϪ"E41NϪϪ"E42NϪϪ"E43NϪ"E44N:
+451981_E..NV"*
+
+451981_E..N20231114*E(Ϫ:E23N
+319932_E..ST
+
+319932_E..S20231114*EϪϪ"E36SϪϪ"E35SϪϪ"E34SϪϪ"E33SϪϪ"E32SϪϪ"E31SϪϪ"E30SϪϪ"E29SϪϪ"E28SϪϪ"E27SϪϪ"E26SϪϪ"E25SϪϪ"E24SϪϪ"E23SϪϪ"E22SϪϪ"E21SϪϪ"E20SϪϪ"E19SϪϪ"E18SϪϪ"E17SϪϪ"E16SϪϪ"E15SϪϪ"E14SϪϪ"E13SϪϪ"E12SϪϪ"E11SϪϪ"E10SϪ"E09S:
+319932_E..SV"*
+
+319932_E..S20231114*E(Ϫ:E36S
+048572_E..NT
+
+048572_E..N20231114*EϪϪ"E23NϪϪ"E24NϪϪ"E25NϪϪ"E26NϪϪ"E27NϪϪ"E28NϪϪ"E29NϪϪ"E30NϪϪ"E31NϪϪ"E32NϪϪ"E33NϪϪ"E34NϪϪ"E35NϪϪ"E36NϪϪ"E37NϪϪ"E38NϪϪ"E39NϪϪ"E40NϪϪ"E41NϪϪ"E42NϪϪ"E43NϪ"E44N:
+048572_E..NV"*
+
+048572_E..N20231114*E(Ϫ:E23N3
+alert0*)*AR"
+ 
+Trains are running with delays3
+alert1*)*CR"
+ 
+Trains are running with delays3
+alert2*)*ER"
+ 
+Trains are running with delays
\ No newline at end of file
@@ -0,0 +1,42 @@
+
+
+1.0Ϫ
+993908_G..ST
+
+993908_G..S20231114*GϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+993908_G..SV"*
+
+993908_G..S20231114*G(Ϫ:G37S
+050631_G..NT
+
+050631_G..N20231114*GϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+050631_G..NV"*
+
+050631_G..N20231114*G(Ϫ:G08N
+383452_G..ST
+
+383452_G..S20231114*GϪϪ"G40SϪϪ"G39SϪϪ"G38SϪϪ"G37SϪϪ"G36SϪϪ"G35SϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+383452_G..SV"*
+
+383452_G..S20231114*G(Ϫ:G40S
+039317_G..NT
+
+039317_G..N20231114*GϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+039317_G..NV"*
+
+039317_G..N20231114*G(Ϫ:G08N
+073248_G..ST
+
+073248_G..S20231114*GϪϪ"G34SϪϪ"G33SϪϪ"G32SϪϪ"G31SϪϪ"G30SϪϪ"G29SϪϪ"G28SϪϪ"G27SϪϪ"G26SϪϪ"G25SϪϪ"G24SϪϪ"G23SϪϪ"G22SϪϪ"G21SϪϪ"G20SϪϪ"G19SϪϪ"G18SϪϪ"G17SϪϪ"G16SϪϪ"G15SϪϪ"G14SϪϪ"G13SϪϪ"G12SϪϪ"G11SϪϪ"G10SϪϪ"G09SϪϪ"G08SϪϪ"G07SϪ"G06S:
+073248_G..SV"*
+
+073248_G..S20231114*G(Ϫ:G34S
+445140_G..NT
+
+445140_G..N20231114*GϪϪ"G07NϪϪ"G08NϪϪ"G09NϪϪ"G10NϪϪ"G11NϪϪ"G12NϪϪ"G13NϪϪ"G14NϪϪ"G15NϪϪ"G16NϪϪ"G17NϪϪ"G18NϪϪ"G19NϪϪ"G20NϪϪ"G21NϪϪ"G22NϪϪ"G23NϪϪ"G24NϪϪ"G25NϪϪ"G26NϪϪ"G27NϪϪ"G28NϪϪ"G29NϪϪ"G30NϪϪ"G31NϪϪ"G32NϪϪ"G33NϪϪ"G34NϪϪ"G35NϪϪ"G36NϪϪ"G37NϪϪ"G38NϪϪ"G39NϪϪ"G40NϪ"G41N:
+445140_G..NV"*
+
+445140_G..N20231114*G(Ϫ:G07N3
+alert0*)*GR"
+ 
+Trains are running with delays
\ No newline at end of file
@@ -0,0 +1,242 @@
+
+
+1.0Ϫ
+794772_1..ST
+
+794772_1..S20231114*1ϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+794772_1..SV"*
+
+794772_1..S20231114*1(Ϫ:129S
+536110_1..NT
+
+536110_1..N20231114*1ϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+536110_1..NV"*
+
+536110_1..N20231114*1(Ϫ:122N
+821872_1..ST
+
+821872_1..S20231114*1ϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+821872_1..SV"*
+
+821872_1..S20231114*1	(Ϫ:133S
+611720_1..NT
+
+611720_1..N20231114*1ϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+611720_1..NV"*
+
+611720_1..N20231114*1(Ϫ:113N
+295528_1..ST
+
+295528_1..S20231114*1ϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+295528_1..SV"*
+
+295528_1..S20231114*1(Ϫ:138S
+838234_1..NT
+
+838234_1..N20231114*1ϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+838234_1..NV"*
+
+838234_1..N20231114*1(Ϫ:115N
+325213_2..ST
+
+325213_2..S20231114*2ϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪϪ"205SϪϪ"204SϪ"203S:
+325213_2..SV"*
+
+325213_2..S20231114*2(Ϫ:235S
+891786_2..NT
+
+891786_2..N20231114*2ϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪ"238N:
+891786_2..NV"*
+
+891786_2..N20231114*2
+(Ϫ:213N
+105592_2..ST
+
+105592_2..S20231114*2ϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪϪ"205SϪϪ"204SϪ"203S:
+105592_2..SV"*
+
+105592_2..S20231114*2(Ϫ:227S
+640561_2..NT
+
+640561_2..N20231114*2ϪϪ"209NϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪ"238N:
+640561_2..NV"*
+
+640561_2..N20231114*2(Ϫ:209N
+464197_2..ST
+
+464197_2..S20231114*2ϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪϪ"205SϪϪ"204SϪ"203S:
+464197_2..SV"*
+
+464197_2..S20231114*2(Ϫ:222S
+844132_2..NT
+
+844132_2..N20231114*2ϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪ"238N:
+844132_2..NV"*
+
+844132_2..N20231114*2(Ϫ:220N
+744754_3..ST
+
+744754_3..S20231114*3ϪϪ"342SϪϪ"341SϪϪ"340SϪϪ"339SϪϪ"338SϪϪ"337SϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+744754_3..SV"*
+
+744754_3..S20231114*3 (Ϫ:342S
+868287_3..NT
+
+868287_3..N20231114*3ϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+868287_3..NV"*
+
+868287_3..N20231114*3
+(Ϫ:317N
+341001_3..ST
+
+341001_3..S20231114*3ϪϪ"340SϪϪ"339SϪϪ"338SϪϪ"337SϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+341001_3..SV"*
+
+341001_3..S20231114*3(Ϫ:340S
+595078_3..NT
+
+595078_3..N20231114*3ϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+595078_3..NV"*
+
+595078_3..N20231114*3(Ϫ:314N
+149416_3..ST
+
+149416_3..S20231114*3ϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+149416_3..SV"*
+
+149416_3..S20231114*3(Ϫ:325S
+084353_3..NT
+
+084353_3..N20231114*3ϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+084353_3..NV"*
+
+084353_3..N20231114*3
+(Ϫ:317N
+114355_4..ST
+
+114355_4..S20231114*4ϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪ"408S:
+114355_4..SV"*
+
+114355_4..S20231114*4	(Ϫ:434S
+740883_4..NT
+
+740883_4..N20231114*4ϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪϪ"441NϪϪ"442NϪ"443N:
+740883_4..NV"*
+
+740883_4..N20231114*4(Ϫ:411N
+854030_4..ST
+
+854030_4..S20231114*4ϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪ"408S:
+854030_4..SV"*
+
+854030_4..S20231114*4(Ϫ:426S
+632485_4..NT
+
+632485_4..N20231114*4ϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪϪ"441NϪϪ"442NϪ"443N:
+632485_4..NV"*
+
+632485_4..N20231114*4(Ϫ:425N
+466604_4..ST
+
+466604_4..S20231114*4ϪϪ"441SϪϪ"440SϪϪ"439SϪϪ"438SϪϪ"437SϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪ"408S:
+466604_4..SV"*
+
+466604_4..S20231114*4(Ϫ:441S
+403598_4..NT
+
+403598_4..N20231114*4ϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪϪ"436NϪϪ"437NϪϪ"438NϪϪ"439NϪϪ"440NϪϪ"441NϪϪ"442NϪ"443N:
+403598_4..NV"*
+
+403598_4..N20231114*4
+(Ϫ:418N
+192800_5..ST
+
+192800_5..S20231114*5ϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪ"505S:
+192800_5..SV"*
+
+192800_5..S20231114*5(Ϫ:534S
+642539_5..NT
+
+642539_5..N20231114*5ϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪ"540N:
+642539_5..NV"*
+
+642539_5..N20231114*5(Ϫ:513N
+094187_5..ST
+
+094187_5..S20231114*5ϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪ"505S:
+094187_5..SV"*
+
+094187_5..S20231114*5(Ϫ:536S
+040518_5..NT
+
+040518_5..N20231114*5ϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪ"540N:
+040518_5..NV"*
+
+040518_5..N20231114*5(Ϫ:507N
+869647_5..ST
+
+869647_5..S20231114*5ϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪϪ"507SϪϪ"506SϪ"505S:
+869647_5..SV"*
+
+869647_5..S20231114*5(Ϫ:523S
+878565_5..NT
+
+878565_5..N20231114*5ϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪ"540N:
+878565_5..NV"*
+
+878565_5..N20231114*5(Ϫ:521N
+890750_6..ST
+
+890750_6..S20231114*6ϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪ"604S:
+890750_6..SV"*
+
+890750_6..S20231114*6(Ϫ:633S
+865351_6..NT
+
+865351_6..N20231114*6ϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪ"639N:
+865351_6..NV"*
+
+865351_6..N20231114*6(Ϫ:617N
+472449_6..ST
+
+472449_6..S20231114*6ϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪ"604S:
+472449_6..SV"*
+
+472449_6..S20231114*6(Ϫ:624S
+734239_6..NT
+
+734239_6..N20231114*6ϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪ"639N:
+734239_6..NV"*
+
+734239_6..N20231114*6(Ϫ:615N
+642549_6..ST
+
+642549_6..S20231114*6ϪϪ"636SϪϪ"635SϪϪ"634SϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪϪ"605SϪ"604S:
+642549_6..SV"*
+
+642549_6..S20231114*6(Ϫ:636S
+660757_6..NT
+
+660757_6..N20231114*6ϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪ"639N:
+660757_6..NV"*
+
+660757_6..N20231114*6
+(Ϫ:614N3
+alert0*)*1R"
+ 
+Trains are running with delays3
+alert1*)*2R"
+ 
+Trains are running with delays3
+alert2*)*3R"
+ 
+Trains are running with delays3
+alert3*)*4R"
+ 
+Trains are running with delays3
+alert4*)*5R"
+ 
+Trains are running with delays3
+alert5*)*6R"
+ 
+Trains are running with delays
\ No newline at end of file
@@ -0,0 +1,127 @@
+
+
+1.0Ϫ
+777820_7..ST
+
+777820_7..S20231114*7ϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+777820_7..SV"*
+
+777820_7..S20231114*7(Ϫ:729S
+775839_7..NT
+
+775839_7..N20231114*7ϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+775839_7..NV"*
+
+775839_7..N20231114*7(Ϫ:721N
+488240_7..ST
+
+488240_7..S20231114*7ϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+488240_7..SV"*
+
+488240_7..S20231114*7(Ϫ:733S
+944662_7..NT
+
+944662_7..N20231114*7ϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+944662_7..NV"*
+
+944662_7..N20231114*7(Ϫ:710N
+491854_7..ST
+
+491854_7..S20231114*7ϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+491854_7..SV"*
+
+491854_7..S20231114*7(Ϫ:733S
+106927_7..NT
+
+106927_7..N20231114*7ϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+106927_7..NV"*
+
+106927_7..N20231114*7(Ϫ:712N
+227257_7..ST
+
+227257_7..S20231114*7ϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+227257_7..SV"*
+
+227257_7..S20231114*7(Ϫ:727S
+960857_7..NT
+
+960857_7..N20231114*7ϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+960857_7..NV"*
+
+960857_7..N20231114*7(Ϫ:717N
+835869_7..ST
+
+835869_7..S20231114*7ϪϪ"738SϪϪ"737SϪϪ"736SϪϪ"735SϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+835869_7..SV"*
+
+835869_7..S20231114*7(Ϫ:738S
+647445_7..NT
+
+647445_7..N20231114*7ϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+647445_7..NV"*
+
+647445_7..N20231114*7(Ϫ:719N
+001861_7..ST
+
+001861_7..S20231114*7ϪϪ"740SϪϪ"739SϪϪ"738SϪϪ"737SϪϪ"736SϪϪ"735SϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+001861_7..SV"*
+
+001861_7..S20231114*7 (Ϫ:740S
+225948_7..NT
+
+225948_7..N20231114*7ϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+225948_7..NV"*
+
+225948_7..N20231114*7(Ϫ:710N
+328887_7..ST
+
+328887_7..S20231114*7ϪϪ"734SϪϪ"733SϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+328887_7..SV"*
+
+328887_7..S20231114*7(Ϫ:734S
+710756_7..NT
+
+710756_7..N20231114*7ϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+710756_7..NV"*
+
+710756_7..N20231114*7(Ϫ:711N
+206442_7..ST
+
+206442_7..S20231114*7ϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+206442_7..SV"*
+
+206442_7..S20231114*7(Ϫ:728S
+378735_7..NT
+
+378735_7..N20231114*7ϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+378735_7..NV"*
+
+378735_7..N20231114*7(Ϫ:718N
+152779_7..ST
+
+152779_7..S20231114*7ϪϪ"732SϪϪ"731SϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+152779_7..SV"*
+
+152779_7..S20231114*7(Ϫ:732S
+315997_7..NT
+
+315997_7..N20231114*7ϪϪ"705NϪϪ"706NϪϪ"707NϪϪ"708NϪϪ"709NϪϪ"710NϪϪ"711NϪϪ"712NϪϪ"713NϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+315997_7..NV"*
+
+315997_7..N20231114*7 (Ϫ:705N
+742052_7..ST
+
+742052_7..S20231114*7ϪϪ"730SϪϪ"729SϪϪ"728SϪϪ"727SϪϪ"726SϪϪ"725SϪϪ"724SϪϪ"723SϪϪ"722SϪϪ"721SϪϪ"720SϪϪ"719SϪϪ"718SϪϪ"717SϪϪ"716SϪϪ"715SϪϪ"714SϪϪ"713SϪϪ"712SϪϪ"711SϪϪ"710SϪϪ"709SϪϪ"708SϪϪ"707SϪϪ"706SϪ"705S:
+742052_7..SV"*
+
+742052_7..S20231114*7
+(Ϫ:730S
+372612_7..NT
+
+372612_7..N20231114*7ϪϪ"714NϪϪ"715NϪϪ"716NϪϪ"717NϪϪ"718NϪϪ"719NϪϪ"720NϪϪ"721NϪϪ"722NϪϪ"723NϪϪ"724NϪϪ"725NϪϪ"726NϪϪ"727NϪϪ"728NϪϪ"729NϪϪ"730NϪϪ"731NϪϪ"732NϪϪ"733NϪϪ"734NϪϪ"735NϪϪ"736NϪϪ"737NϪϪ"738NϪϪ"739NϪ"740N:
+372612_7..NV"*
+
+372612_7..N20231114*7	(Ϫ:714N3
+alert0*)*7R"
+ 
+Trains are running with delays
\ No newline at end of file
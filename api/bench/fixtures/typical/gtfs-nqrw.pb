@@ -0,0 +1,498 @@
+
+
+1.0Ϫ
+096033_N..ST
+
+096033_N..S20231114*NϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+096033_N..SV"*
+
+096033_N..S20231114*N(Ϫ:N34S
+177297_N..NT
+
+177297_N..N20231114*NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+177297_N..NV"*
+
+177297_N..N20231114*N	(Ϫ:N10N
+222527_N..ST
+
+222527_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+222527_N..SV"*
+
+222527_N..S20231114*N(Ϫ:N35S
+166076_N..NT
+
+166076_N..N20231114*NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+166076_N..NV"*
+
+166076_N..N20231114*N(Ϫ:N14N
+842708_N..ST
+
+842708_N..S20231114*NϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+842708_N..SV"*
+
+842708_N..S20231114*N(Ϫ:N20S
+981164_N..NT
+
+981164_N..N20231114*NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+981164_N..NV"*
+
+981164_N..N20231114*N(Ϫ:N15N
+944984_N..ST
+
+944984_N..S20231114*NϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+944984_N..SV"*
+
+944984_N..S20231114*N(Ϫ:N35S
+487476_N..NT
+
+487476_N..N20231114*NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+487476_N..NV"*
+
+487476_N..N20231114*N
+(Ϫ:N11N
+935109_N..ST
+
+935109_N..S20231114*NϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+935109_N..SV"*
+
+935109_N..S20231114*N(Ϫ:N20S
+186055_N..NT
+
+186055_N..N20231114*NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+186055_N..NV"*
+
+186055_N..N20231114*N(Ϫ:N08N
+185304_N..ST
+
+185304_N..S20231114*NϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+185304_N..SV"*
+
+185304_N..S20231114*N
+(Ϫ:N26S
+534948_N..NT
+
+534948_N..N20231114*NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+534948_N..NV"*
+
+534948_N..N20231114*N(Ϫ:N17N
+707243_N..ST
+
+707243_N..S20231114*NϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+707243_N..SV"*
+
+707243_N..S20231114*N(Ϫ:N19S
+467284_N..NT
+
+467284_N..N20231114*NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+467284_N..NV"*
+
+467284_N..N20231114*N(Ϫ:N14N
+952608_N..ST
+
+952608_N..S20231114*NϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+952608_N..SV"*
+
+952608_N..S20231114*N(Ϫ:N25S
+379465_N..NT
+
+379465_N..N20231114*NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+379465_N..NV"*
+
+379465_N..N20231114*N(Ϫ:N15N
+419287_N..ST
+
+419287_N..S20231114*NϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+419287_N..SV"*
+
+419287_N..S20231114*N(Ϫ:N22S
+262040_N..NT
+
+262040_N..N20231114*NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+262040_N..NV"*
+
+262040_N..N20231114*N(Ϫ:N16N
+522259_N..ST
+
+522259_N..S20231114*NϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+522259_N..SV"*
+
+522259_N..S20231114*N(Ϫ:N20S
+834893_N..NT
+
+834893_N..N20231114*NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+834893_N..NV"*
+
+834893_N..N20231114*N(Ϫ:N12N
+943404_Q..ST
+
+943404_Q..S20231114*QϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+943404_Q..SV"*
+
+943404_Q..S20231114*Q(Ϫ:Q29S
+761145_Q..NT
+
+761145_Q..N20231114*QϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+761145_Q..NV"*
+
+761145_Q..N20231114*Q(Ϫ:Q25N
+690891_Q..ST
+
+690891_Q..S20231114*QϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+690891_Q..SV"*
+
+690891_Q..S20231114*Q(Ϫ:Q36S
+733554_Q..NT
+
+733554_Q..N20231114*QϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+733554_Q..NV"*
+
+733554_Q..N20231114*Q(Ϫ:Q13N
+810532_Q..ST
+
+810532_Q..S20231114*QϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+810532_Q..SV"*
+
+810532_Q..S20231114*Q(Ϫ:Q28S
+838083_Q..NT
+
+838083_Q..N20231114*QϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+838083_Q..NV"*
+
+838083_Q..N20231114*Q(Ϫ:Q24N
+532002_Q..ST
+
+532002_Q..S20231114*QϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+532002_Q..SV"*
+
+532002_Q..S20231114*Q(Ϫ:Q30S
+217913_Q..NT
+
+217913_Q..N20231114*QϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+217913_Q..NV"*
+
+217913_Q..N20231114*Q(Ϫ:Q23N
+979531_Q..ST
+
+979531_Q..S20231114*QϪϪ"Q41SϪϪ"Q40SϪϪ"Q39SϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+979531_Q..SV"*
+
+979531_Q..S20231114*Q(Ϫ:Q41S
+008830_Q..NT
+
+008830_Q..N20231114*QϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+008830_Q..NV"*
+
+008830_Q..N20231114*Q(Ϫ:Q14N
+602317_Q..ST
+
+602317_Q..S20231114*QϪϪ"Q42SϪϪ"Q41SϪϪ"Q40SϪϪ"Q39SϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+602317_Q..SV"*
+
+602317_Q..S20231114*Q(Ϫ:Q42S
+237624_Q..NT
+
+237624_Q..N20231114*QϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+237624_Q..NV"*
+
+237624_Q..N20231114*Q(Ϫ:Q11N
+895424_Q..ST
+
+895424_Q..S20231114*QϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+895424_Q..SV"*
+
+895424_Q..S20231114*Q(Ϫ:Q35S
+220703_Q..NT
+
+220703_Q..N20231114*QϪϪ"Q09NϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+220703_Q..NV"*
+
+220703_Q..N20231114*Q(Ϫ:Q09N
+751788_Q..ST
+
+751788_Q..S20231114*QϪϪ"Q42SϪϪ"Q41SϪϪ"Q40SϪϪ"Q39SϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+751788_Q..SV"*
+
+751788_Q..S20231114*Q(Ϫ:Q42S
+377716_Q..NT
+
+377716_Q..N20231114*QϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+377716_Q..NV"*
+
+377716_Q..N20231114*Q(Ϫ:Q13N
+024581_Q..ST
+
+024581_Q..S20231114*QϪϪ"Q41SϪϪ"Q40SϪϪ"Q39SϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+024581_Q..SV"*
+
+024581_Q..S20231114*Q(Ϫ:Q41S
+026575_Q..NT
+
+026575_Q..N20231114*QϪϪ"Q09NϪϪ"Q10NϪϪ"Q11NϪϪ"Q12NϪϪ"Q13NϪϪ"Q14NϪϪ"Q15NϪϪ"Q16NϪϪ"Q17NϪϪ"Q18NϪϪ"Q19NϪϪ"Q20NϪϪ"Q21NϪϪ"Q22NϪϪ"Q23NϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+026575_Q..NV"*
+
+026575_Q..N20231114*Q(Ϫ:Q09N
+268110_Q..ST
+
+268110_Q..S20231114*QϪϪ"Q39SϪϪ"Q38SϪϪ"Q37SϪϪ"Q36SϪϪ"Q35SϪϪ"Q34SϪϪ"Q33SϪϪ"Q32SϪϪ"Q31SϪϪ"Q30SϪϪ"Q29SϪϪ"Q28SϪϪ"Q27SϪϪ"Q26SϪϪ"Q25SϪϪ"Q24SϪϪ"Q23SϪϪ"Q22SϪϪ"Q21SϪϪ"Q20SϪϪ"Q19SϪϪ"Q18SϪϪ"Q17SϪϪ"Q16SϪϪ"Q15SϪϪ"Q14SϪϪ"Q13SϪϪ"Q12SϪϪ"Q11SϪϪ"Q10SϪϪ"Q09SϪ"Q08S:
+268110_Q..SV"*
+
+268110_Q..S20231114*Q(Ϫ:Q39S
+192664_Q..NT
+
+192664_Q..N20231114*QϪϪ"Q24NϪϪ"Q25NϪϪ"Q26NϪϪ"Q27NϪϪ"Q28NϪϪ"Q29NϪϪ"Q30NϪϪ"Q31NϪϪ"Q32NϪϪ"Q33NϪϪ"Q34NϪϪ"Q35NϪϪ"Q36NϪϪ"Q37NϪϪ"Q38NϪϪ"Q39NϪϪ"Q40NϪϪ"Q41NϪϪ"Q42NϪ"Q43N:
+192664_Q..NV"*
+
+192664_Q..N20231114*Q(Ϫ:Q24N
+618091_R..ST
+
+618091_R..S20231114*RϪϪ"R41SϪϪ"R40SϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+618091_R..SV"*
+
+618091_R..S20231114*R(Ϫ:R41S
+038030_R..NT
+
+038030_R..N20231114*RϪϪ"R07NϪϪ"R08NϪϪ"R09NϪϪ"R10NϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+038030_R..NV"*
+
+038030_R..N20231114*R (Ϫ:R07N
+658250_R..ST
+
+658250_R..S20231114*RϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+658250_R..SV"*
+
+658250_R..S20231114*R(Ϫ:R39S
+512503_R..NT
+
+512503_R..N20231114*RϪϪ"R07NϪϪ"R08NϪϪ"R09NϪϪ"R10NϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+512503_R..NV"*
+
+512503_R..N20231114*R (Ϫ:R07N
+578293_R..ST
+
+578293_R..S20231114*RϪϪ"R41SϪϪ"R40SϪϪ"R39SϪϪ"R38SϪϪ"R37SϪϪ"R36SϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+578293_R..SV"*
+
+578293_R..S20231114*R(Ϫ:R41S
+421374_R..NT
+
+421374_R..N20231114*RϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+421374_R..NV"*
+
+421374_R..N20231114*R(Ϫ:R11N
+097993_R..ST
+
+097993_R..S20231114*RϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+097993_R..SV"*
+
+097993_R..S20231114*R
+(Ϫ:R32S
+469575_R..NT
+
+469575_R..N20231114*RϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+469575_R..NV"*
+
+469575_R..N20231114*R(Ϫ:R11N
+819000_R..ST
+
+819000_R..S20231114*RϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+819000_R..SV"*
+
+819000_R..S20231114*R(Ϫ:R30S
+343891_R..NT
+
+343891_R..N20231114*RϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+343891_R..NV"*
+
+343891_R..N20231114*R(Ϫ:R11N
+274556_R..ST
+
+274556_R..S20231114*RϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+274556_R..SV"*
+
+274556_R..S20231114*R(Ϫ:R29S
+733451_R..NT
+
+733451_R..N20231114*RϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+733451_R..NV"*
+
+733451_R..N20231114*R(Ϫ:R24N
+059539_R..ST
+
+059539_R..S20231114*RϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+059539_R..SV"*
+
+059539_R..S20231114*R(Ϫ:R34S
+168993_R..NT
+
+168993_R..N20231114*RϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+168993_R..NV"*
+
+168993_R..N20231114*R(Ϫ:R12N
+665925_R..ST
+
+665925_R..S20231114*RϪϪ"R35SϪϪ"R34SϪϪ"R33SϪϪ"R32SϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+665925_R..SV"*
+
+665925_R..S20231114*R(Ϫ:R35S
+742489_R..NT
+
+742489_R..N20231114*RϪϪ"R08NϪϪ"R09NϪϪ"R10NϪϪ"R11NϪϪ"R12NϪϪ"R13NϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+742489_R..NV"*
+
+742489_R..N20231114*R(Ϫ:R08N
+748544_R..ST
+
+748544_R..S20231114*RϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+748544_R..SV"*
+
+748544_R..S20231114*R(Ϫ:R28S
+084336_R..NT
+
+084336_R..N20231114*RϪϪ"R14NϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+084336_R..NV"*
+
+084336_R..N20231114*R(Ϫ:R14N
+839078_R..ST
+
+839078_R..S20231114*RϪϪ"R31SϪϪ"R30SϪϪ"R29SϪϪ"R28SϪϪ"R27SϪϪ"R26SϪϪ"R25SϪϪ"R24SϪϪ"R23SϪϪ"R22SϪϪ"R21SϪϪ"R20SϪϪ"R19SϪϪ"R18SϪϪ"R17SϪϪ"R16SϪϪ"R15SϪϪ"R14SϪϪ"R13SϪϪ"R12SϪϪ"R11SϪϪ"R10SϪϪ"R09SϪϪ"R08SϪ"R07S:
+839078_R..SV"*
+
+839078_R..S20231114*R(Ϫ:R31S
+443565_R..NT
+
+443565_R..N20231114*RϪϪ"R15NϪϪ"R16NϪϪ"R17NϪϪ"R18NϪϪ"R19NϪϪ"R20NϪϪ"R21NϪϪ"R22NϪϪ"R23NϪϪ"R24NϪϪ"R25NϪϪ"R26NϪϪ"R27NϪϪ"R28NϪϪ"R29NϪϪ"R30NϪϪ"R31NϪϪ"R32NϪϪ"R33NϪϪ"R34NϪϪ"R35NϪϪ"R36NϪϪ"R37NϪϪ"R38NϪϪ"R39NϪϪ"R40NϪϪ"R41NϪ"R42N:
+443565_R..NV"*
+
+443565_R..N20231114*R(Ϫ:R15N
+158456_W..ST
+
+158456_W..S20231114*WϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+158456_W..SV"*
+
+158456_W..S20231114*W(Ϫ:N35S
+168019_W..NT
+
+168019_W..N20231114*WϪϪ"N04NϪϪ"N05NϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+168019_W..NV"*
+
+168019_W..N20231114*W(Ϫ:N04N
+092087_W..ST
+
+092087_W..S20231114*WϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+092087_W..SV"*
+
+092087_W..S20231114*W(Ϫ:N29S
+020763_W..NT
+
+020763_W..N20231114*WϪϪ"N06NϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+020763_W..NV"*
+
+020763_W..N20231114*W(Ϫ:N06N
+227911_W..ST
+
+227911_W..S20231114*WϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+227911_W..SV"*
+
+227911_W..S20231114*W (Ϫ:N36S
+486961_W..NT
+
+486961_W..N20231114*WϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+486961_W..NV"*
+
+486961_W..N20231114*W(Ϫ:N15N
+672932_W..ST
+
+672932_W..S20231114*WϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+672932_W..SV"*
+
+672932_W..S20231114*W(Ϫ:N24S
+950599_W..NT
+
+950599_W..N20231114*WϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+950599_W..NV"*
+
+950599_W..N20231114*W(Ϫ:N07N
+536348_W..ST
+
+536348_W..S20231114*WϪϪ"N36SϪϪ"N35SϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+536348_W..SV"*
+
+536348_W..S20231114*W (Ϫ:N36S
+053723_W..NT
+
+053723_W..N20231114*WϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+053723_W..NV"*
+
+053723_W..N20231114*W(Ϫ:N14N
+190028_W..ST
+
+190028_W..S20231114*WϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+190028_W..SV"*
+
+190028_W..S20231114*W(Ϫ:N33S
+503109_W..NT
+
+503109_W..N20231114*WϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+503109_W..NV"*
+
+503109_W..N20231114*W(Ϫ:N12N
+966210_W..ST
+
+966210_W..S20231114*WϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+966210_W..SV"*
+
+966210_W..S20231114*W(Ϫ:N33S
+303647_W..NT
+
+303647_W..N20231114*WϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+303647_W..NV"*
+
+303647_W..N20231114*W(Ϫ:N12N
+916819_W..ST
+
+916819_W..S20231114*WϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+916819_W..SV"*
+
+916819_W..S20231114*W(Ϫ:N23S
+320782_W..NT
+
+320782_W..N20231114*WϪϪ"N07NϪϪ"N08NϪϪ"N09NϪϪ"N10NϪϪ"N11NϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+320782_W..NV"*
+
+320782_W..N20231114*W(Ϫ:N07N
+016485_W..ST
+
+016485_W..S20231114*WϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+016485_W..SV"*
+
+016485_W..S20231114*W(Ϫ:N22S
+668252_W..NT
+
+668252_W..N20231114*WϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+668252_W..NV"*
+
+668252_W..N20231114*W(Ϫ:N16N
+932752_W..ST
+
+932752_W..S20231114*WϪϪ"N34SϪϪ"N33SϪϪ"N32SϪϪ"N31SϪϪ"N30SϪϪ"N29SϪϪ"N28SϪϪ"N27SϪϪ"N26SϪϪ"N25SϪϪ"N24SϪϪ"N23SϪϪ"N22SϪϪ"N21SϪϪ"N20SϪϪ"N19SϪϪ"N18SϪϪ"N17SϪϪ"N16SϪϪ"N15SϪϪ"N14SϪϪ"N13SϪϪ"N12SϪϪ"N11SϪϪ"N10SϪϪ"N09SϪϪ"N08SϪϪ"N07SϪϪ"N06SϪϪ"N05SϪϪ"N04SϪϪ"N03SϪϪ"N02SϪ"N01S:
+932752_W..SV"*
+
+932752_W..S20231114*W(Ϫ:N34S
+025314_W..NT
+
+025314_W..N20231114*WϪϪ"N12NϪϪ"N13NϪϪ"N14NϪϪ"N15NϪϪ"N16NϪϪ"N17NϪϪ"N18NϪϪ"N19NϪϪ"N20NϪϪ"N21NϪϪ"N22NϪϪ"N23NϪϪ"N24NϪϪ"N25NϪϪ"N26NϪϪ"N27NϪϪ"N28NϪϪ"N29NϪϪ"N30NϪϪ"N31NϪϪ"N32NϪϪ"N33NϪϪ"N34NϪϪ"N35NϪ"N36N:
+025314_W..NV"*
+
+025314_W..N20231114*W(Ϫ:N12N3
+alert0*)*NR"
+ 
+Trains are running with delays3
+alert1*)*QR"
+ 
+Trains are running with delays3
+alert2*)*RR"
+ 
+Trains are running with delays3
+alert3*)*WR"
+ 
+Trains are running with delays
\ No newline at end of file
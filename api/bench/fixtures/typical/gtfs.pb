@@ -0,0 +1,752 @@
+
+
+1.0Ϫ
+794772_1..ST
+
+794772_1..S20231114*1ϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+794772_1..SV"*
+
+794772_1..S20231114*1(Ϫ:129S
+536110_1..NT
+
+536110_1..N20231114*1ϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+536110_1..NV"*
+
+536110_1..N20231114*1(Ϫ:122N
+821872_1..ST
+
+821872_1..S20231114*1ϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+821872_1..SV"*
+
+821872_1..S20231114*1	(Ϫ:133S
+611720_1..NT
+
+611720_1..N20231114*1ϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+611720_1..NV"*
+
+611720_1..N20231114*1(Ϫ:113N
+295528_1..ST
+
+295528_1..S20231114*1ϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+295528_1..SV"*
+
+295528_1..S20231114*1(Ϫ:138S
+838234_1..NT
+
+838234_1..N20231114*1ϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+838234_1..NV"*
+
+838234_1..N20231114*1(Ϫ:115N
+849574_1..ST
+
+849574_1..S20231114*1ϪϪ"138SϪϪ"137SϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+849574_1..SV"*
+
+849574_1..S20231114*1(Ϫ:138S
+765284_1..NT
+
+765284_1..N20231114*1ϪϪ"109NϪϪ"110NϪϪ"111NϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+765284_1..NV"*
+
+765284_1..N20231114*1(Ϫ:109N
+495077_1..ST
+
+495077_1..S20231114*1ϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+495077_1..SV"*
+
+495077_1..S20231114*1(Ϫ:125S
+455262_1..NT
+
+455262_1..N20231114*1ϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+455262_1..NV"*
+
+455262_1..N20231114*1
+(Ϫ:117N
+957361_1..ST
+
+957361_1..S20231114*1ϪϪ"136SϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+957361_1..SV"*
+
+957361_1..S20231114*1(Ϫ:136S
+464197_1..NT
+
+464197_1..N20231114*1ϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+464197_1..NV"*
+
+464197_1..N20231114*1(Ϫ:123N
+844132_1..ST
+
+844132_1..S20231114*1ϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+844132_1..SV"*
+
+844132_1..S20231114*1(Ϫ:125S
+754665_1..NT
+
+754665_1..N20231114*1ϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+754665_1..NV"*
+
+754665_1..N20231114*1(Ϫ:119N
+001198_1..ST
+
+001198_1..S20231114*1ϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+001198_1..SV"*
+
+001198_1..S20231114*1(Ϫ:127S
+765752_1..NT
+
+765752_1..N20231114*1ϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+765752_1..NV"*
+
+765752_1..N20231114*1
+(Ϫ:117N
+961564_1..ST
+
+961564_1..S20231114*1ϪϪ"135SϪϪ"134SϪϪ"133SϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+961564_1..SV"*
+
+961564_1..S20231114*1(Ϫ:135S
+149416_1..NT
+
+149416_1..N20231114*1ϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+149416_1..NV"*
+
+149416_1..N20231114*1(Ϫ:124N
+084353_1..ST
+
+084353_1..S20231114*1ϪϪ"132SϪϪ"131SϪϪ"130SϪϪ"129SϪϪ"128SϪϪ"127SϪϪ"126SϪϪ"125SϪϪ"124SϪϪ"123SϪϪ"122SϪϪ"121SϪϪ"120SϪϪ"119SϪϪ"118SϪϪ"117SϪϪ"116SϪϪ"115SϪϪ"114SϪϪ"113SϪϪ"112SϪϪ"111SϪϪ"110SϪϪ"109SϪϪ"108SϪ"107S:
+084353_1..SV"*
+
+084353_1..S20231114*1
+(Ϫ:132S
+513054_1..NT
+
+513054_1..N20231114*1ϪϪ"110NϪϪ"111NϪϪ"112NϪϪ"113NϪϪ"114NϪϪ"115NϪϪ"116NϪϪ"117NϪϪ"118NϪϪ"119NϪϪ"120NϪϪ"121NϪϪ"122NϪϪ"123NϪϪ"124NϪϪ"125NϪϪ"126NϪϪ"127NϪϪ"128NϪϪ"129NϪϪ"130NϪϪ"131NϪϪ"132NϪϪ"133NϪϪ"134NϪϪ"135NϪϪ"136NϪϪ"137NϪϪ"138NϪϪ"139NϪϪ"140NϪϪ"141NϪ"142N:
+513054_1..NV"*
+
+513054_1..N20231114*1(Ϫ:110N
+740883_2..ST
+
+740883_2..S20231114*2ϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+740883_2..SV"*
+
+740883_2..S20231114*2(Ϫ:237S
+854030_2..NT
+
+854030_2..N20231114*2ϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+854030_2..NV"*
+
+854030_2..N20231114*2(Ϫ:222N
+632485_2..ST
+
+632485_2..S20231114*2ϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+632485_2..SV"*
+
+632485_2..S20231114*2(Ϫ:223S
+466604_2..NT
+
+466604_2..N20231114*2ϪϪ"207NϪϪ"208NϪϪ"209NϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+466604_2..NV"*
+
+466604_2..N20231114*2(Ϫ:207N
+403598_2..ST
+
+403598_2..S20231114*2ϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+403598_2..SV"*
+
+403598_2..S20231114*2
+(Ϫ:230S
+304432_2..NT
+
+304432_2..N20231114*2ϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+304432_2..NV"*
+
+304432_2..N20231114*2(Ϫ:210N
+195800_2..ST
+
+195800_2..S20231114*2ϪϪ"239SϪϪ"238SϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+195800_2..SV"*
+
+195800_2..S20231114*2(Ϫ:239S
+272688_2..NT
+
+272688_2..N20231114*2ϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+272688_2..NV"*
+
+272688_2..N20231114*2(Ϫ:220N
+711693_2..ST
+
+711693_2..S20231114*2ϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+711693_2..SV"*
+
+711693_2..S20231114*2(Ϫ:236S
+040518_2..NT
+
+040518_2..N20231114*2ϪϪ"207NϪϪ"208NϪϪ"209NϪϪ"210NϪϪ"211NϪϪ"212NϪϪ"213NϪϪ"214NϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+040518_2..NV"*
+
+040518_2..N20231114*2(Ϫ:207N
+869647_2..ST
+
+869647_2..S20231114*2ϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+869647_2..SV"*
+
+869647_2..S20231114*2(Ϫ:223S
+878565_2..NT
+
+878565_2..N20231114*2ϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+878565_2..NV"*
+
+878565_2..N20231114*2(Ϫ:221N
+851054_2..ST
+
+851054_2..S20231114*2ϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+851054_2..SV"*
+
+851054_2..S20231114*2(Ϫ:233S
+712480_2..NT
+
+712480_2..N20231114*2ϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+712480_2..NV"*
+
+712480_2..N20231114*2(Ϫ:218N
+472449_2..ST
+
+472449_2..S20231114*2ϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+472449_2..SV"*
+
+472449_2..S20231114*2(Ϫ:225S
+734239_2..NT
+
+734239_2..N20231114*2ϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+734239_2..NV"*
+
+734239_2..N20231114*2(Ϫ:216N
+642549_2..ST
+
+642549_2..S20231114*2ϪϪ"237SϪϪ"236SϪϪ"235SϪϪ"234SϪϪ"233SϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+642549_2..SV"*
+
+642549_2..S20231114*2(Ϫ:237S
+660757_2..NT
+
+660757_2..N20231114*2ϪϪ"215NϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+660757_2..NV"*
+
+660757_2..N20231114*2
+(Ϫ:215N
+016996_2..ST
+
+016996_2..S20231114*2ϪϪ"232SϪϪ"231SϪϪ"230SϪϪ"229SϪϪ"228SϪϪ"227SϪϪ"226SϪϪ"225SϪϪ"224SϪϪ"223SϪϪ"222SϪϪ"221SϪϪ"220SϪϪ"219SϪϪ"218SϪϪ"217SϪϪ"216SϪϪ"215SϪϪ"214SϪϪ"213SϪϪ"212SϪϪ"211SϪϪ"210SϪϪ"209SϪϪ"208SϪϪ"207SϪϪ"206SϪ"205S:
+016996_2..SV"*
+
+016996_2..S20231114*2(Ϫ:232S
+231169_2..NT
+
+231169_2..N20231114*2ϪϪ"216NϪϪ"217NϪϪ"218NϪϪ"219NϪϪ"220NϪϪ"221NϪϪ"222NϪϪ"223NϪϪ"224NϪϪ"225NϪϪ"226NϪϪ"227NϪϪ"228NϪϪ"229NϪϪ"230NϪϪ"231NϪϪ"232NϪϪ"233NϪϪ"234NϪϪ"235NϪϪ"236NϪϪ"237NϪϪ"238NϪϪ"239NϪ"240N:
+231169_2..NV"*
+
+231169_2..N20231114*2(Ϫ:216N
+855546_3..ST
+
+855546_3..S20231114*3ϪϪ"341SϪϪ"340SϪϪ"339SϪϪ"338SϪϪ"337SϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+855546_3..SV"*
+
+855546_3..S20231114*3(Ϫ:341S
+153467_3..NT
+
+153467_3..N20231114*3ϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+153467_3..NV"*
+
+153467_3..N20231114*3(Ϫ:314N
+601742_3..ST
+
+601742_3..S20231114*3ϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+601742_3..SV"*
+
+601742_3..S20231114*3(Ϫ:325S
+077591_3..NT
+
+077591_3..N20231114*3ϪϪ"307NϪϪ"308NϪϪ"309NϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+077591_3..NV"*
+
+077591_3..N20231114*3 (Ϫ:307N
+197678_3..ST
+
+197678_3..S20231114*3ϪϪ"339SϪϪ"338SϪϪ"337SϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+197678_3..SV"*
+
+197678_3..S20231114*3(Ϫ:339S
+388119_3..NT
+
+388119_3..N20231114*3ϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+388119_3..NV"*
+
+388119_3..N20231114*3(Ϫ:310N
+022687_3..ST
+
+022687_3..S20231114*3ϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+022687_3..SV"*
+
+022687_3..S20231114*3(Ϫ:336S
+129913_3..NT
+
+129913_3..N20231114*3ϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+129913_3..NV"*
+
+129913_3..N20231114*3(Ϫ:322N
+839643_3..ST
+
+839643_3..S20231114*3ϪϪ"341SϪϪ"340SϪϪ"339SϪϪ"338SϪϪ"337SϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+839643_3..SV"*
+
+839643_3..S20231114*3(Ϫ:341S
+570672_3..NT
+
+570672_3..N20231114*3ϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+570672_3..NV"*
+
+570672_3..N20231114*3(Ϫ:320N
+876507_3..ST
+
+876507_3..S20231114*3ϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+876507_3..SV"*
+
+876507_3..S20231114*3(Ϫ:334S
+075467_3..NT
+
+075467_3..N20231114*3ϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+075467_3..NV"*
+
+075467_3..N20231114*3	(Ϫ:316N
+189077_3..ST
+
+189077_3..S20231114*3ϪϪ"341SϪϪ"340SϪϪ"339SϪϪ"338SϪϪ"337SϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+189077_3..SV"*
+
+189077_3..S20231114*3(Ϫ:341S
+041291_3..NT
+
+041291_3..N20231114*3ϪϪ"310NϪϪ"311NϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+041291_3..NV"*
+
+041291_3..N20231114*3(Ϫ:310N
+209039_3..ST
+
+209039_3..S20231114*3ϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+209039_3..SV"*
+
+209039_3..S20231114*3(Ϫ:334S
+767136_3..NT
+
+767136_3..N20231114*3ϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+767136_3..NV"*
+
+767136_3..N20231114*3(Ϫ:322N
+731588_3..ST
+
+731588_3..S20231114*3ϪϪ"336SϪϪ"335SϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+731588_3..SV"*
+
+731588_3..S20231114*3(Ϫ:336S
+709048_3..NT
+
+709048_3..N20231114*3ϪϪ"312NϪϪ"313NϪϪ"314NϪϪ"315NϪϪ"316NϪϪ"317NϪϪ"318NϪϪ"319NϪϪ"320NϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+709048_3..NV"*
+
+709048_3..N20231114*3(Ϫ:312N
+555193_3..ST
+
+555193_3..S20231114*3ϪϪ"334SϪϪ"333SϪϪ"332SϪϪ"331SϪϪ"330SϪϪ"329SϪϪ"328SϪϪ"327SϪϪ"326SϪϪ"325SϪϪ"324SϪϪ"323SϪϪ"322SϪϪ"321SϪϪ"320SϪϪ"319SϪϪ"318SϪϪ"317SϪϪ"316SϪϪ"315SϪϪ"314SϪϪ"313SϪϪ"312SϪϪ"311SϪϪ"310SϪϪ"309SϪϪ"308SϪ"307S:
+555193_3..SV"*
+
+555193_3..S20231114*3(Ϫ:334S
+966177_3..NT
+
+966177_3..N20231114*3ϪϪ"321NϪϪ"322NϪϪ"323NϪϪ"324NϪϪ"325NϪϪ"326NϪϪ"327NϪϪ"328NϪϪ"329NϪϪ"330NϪϪ"331NϪϪ"332NϪϪ"333NϪϪ"334NϪϪ"335NϪϪ"336NϪϪ"337NϪϪ"338NϪϪ"339NϪϪ"340NϪϪ"341NϪ"342N:
+966177_3..NV"*
+
+966177_3..N20231114*3(Ϫ:321N
+494535_4..ST
+
+494535_4..S20231114*4ϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+494535_4..SV"*
+
+494535_4..S20231114*4(Ϫ:423S
+533305_4..NT
+
+533305_4..N20231114*4ϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+533305_4..NV"*
+
+533305_4..N20231114*4	(Ϫ:410N
+407520_4..ST
+
+407520_4..S20231114*4ϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+407520_4..SV"*
+
+407520_4..S20231114*4(Ϫ:428S
+724380_4..NT
+
+724380_4..N20231114*4ϪϪ"401NϪϪ"402NϪϪ"403NϪϪ"404NϪϪ"405NϪϪ"406NϪϪ"407NϪϪ"408NϪϪ"409NϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+724380_4..NV"*
+
+724380_4..N20231114*4 (Ϫ:401N
+082914_4..ST
+
+082914_4..S20231114*4ϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+082914_4..SV"*
+
+082914_4..S20231114*4
+(Ϫ:426S
+294527_4..NT
+
+294527_4..N20231114*4ϪϪ"405NϪϪ"406NϪϪ"407NϪϪ"408NϪϪ"409NϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+294527_4..NV"*
+
+294527_4..N20231114*4(Ϫ:405N
+999428_4..ST
+
+999428_4..S20231114*4ϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+999428_4..SV"*
+
+999428_4..S20231114*4(Ϫ:421S
+301861_4..NT
+
+301861_4..N20231114*4ϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+301861_4..NV"*
+
+301861_4..N20231114*4(Ϫ:412N
+664532_4..ST
+
+664532_4..S20231114*4ϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+664532_4..SV"*
+
+664532_4..S20231114*4(Ϫ:432S
+784844_4..NT
+
+784844_4..N20231114*4ϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+784844_4..NV"*
+
+784844_4..N20231114*4(Ϫ:414N
+001598_4..ST
+
+001598_4..S20231114*4ϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+001598_4..SV"*
+
+001598_4..S20231114*4(Ϫ:430S
+167855_4..NT
+
+167855_4..N20231114*4ϪϪ"408NϪϪ"409NϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+167855_4..NV"*
+
+167855_4..N20231114*4(Ϫ:408N
+469903_4..ST
+
+469903_4..S20231114*4ϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+469903_4..SV"*
+
+469903_4..S20231114*4(Ϫ:424S
+917019_4..NT
+
+917019_4..N20231114*4ϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+917019_4..NV"*
+
+917019_4..N20231114*4(Ϫ:414N
+914031_4..ST
+
+914031_4..S20231114*4ϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+914031_4..SV"*
+
+914031_4..S20231114*4(Ϫ:423S
+049052_4..NT
+
+049052_4..N20231114*4ϪϪ"406NϪϪ"407NϪϪ"408NϪϪ"409NϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+049052_4..NV"*
+
+049052_4..N20231114*4(Ϫ:406N
+271819_4..ST
+
+271819_4..S20231114*4ϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+271819_4..SV"*
+
+271819_4..S20231114*4(Ϫ:431S
+927932_4..NT
+
+927932_4..N20231114*4ϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+927932_4..NV"*
+
+927932_4..N20231114*4(Ϫ:416N
+792183_4..ST
+
+792183_4..S20231114*4ϪϪ"436SϪϪ"435SϪϪ"434SϪϪ"433SϪϪ"432SϪϪ"431SϪϪ"430SϪϪ"429SϪϪ"428SϪϪ"427SϪϪ"426SϪϪ"425SϪϪ"424SϪϪ"423SϪϪ"422SϪϪ"421SϪϪ"420SϪϪ"419SϪϪ"418SϪϪ"417SϪϪ"416SϪϪ"415SϪϪ"414SϪϪ"413SϪϪ"412SϪϪ"411SϪϪ"410SϪϪ"409SϪϪ"408SϪϪ"407SϪϪ"406SϪϪ"405SϪϪ"404SϪϪ"403SϪϪ"402SϪ"401S:
+792183_4..SV"*
+
+792183_4..S20231114*4 (Ϫ:436S
+341776_4..NT
+
+341776_4..N20231114*4ϪϪ"410NϪϪ"411NϪϪ"412NϪϪ"413NϪϪ"414NϪϪ"415NϪϪ"416NϪϪ"417NϪϪ"418NϪϪ"419NϪϪ"420NϪϪ"421NϪϪ"422NϪϪ"423NϪϪ"424NϪϪ"425NϪϪ"426NϪϪ"427NϪϪ"428NϪϪ"429NϪϪ"430NϪϪ"431NϪϪ"432NϪϪ"433NϪϪ"434NϪϪ"435NϪ"436N:
+341776_4..NV"*
+
+341776_4..N20231114*4	(Ϫ:410N
+197133_5..ST
+
+197133_5..S20231114*5ϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+197133_5..SV"*
+
+197133_5..S20231114*5(Ϫ:525S
+878128_5..NT
+
+878128_5..N20231114*5ϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+878128_5..NV"*
+
+878128_5..N20231114*5(Ϫ:511N
+995672_5..ST
+
+995672_5..S20231114*5ϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+995672_5..SV"*
+
+995672_5..S20231114*5(Ϫ:529S
+223896_5..NT
+
+223896_5..N20231114*5ϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+223896_5..NV"*
+
+223896_5..N20231114*5 (Ϫ:507N
+708587_5..ST
+
+708587_5..S20231114*5ϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+708587_5..SV"*
+
+708587_5..S20231114*5(Ϫ:526S
+199711_5..NT
+
+199711_5..N20231114*5ϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+199711_5..NV"*
+
+199711_5..N20231114*5(Ϫ:510N
+208159_5..ST
+
+208159_5..S20231114*5ϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+208159_5..SV"*
+
+208159_5..S20231114*5	(Ϫ:533S
+191072_5..NT
+
+191072_5..N20231114*5ϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+191072_5..NV"*
+
+191072_5..N20231114*5(Ϫ:510N
+967594_5..ST
+
+967594_5..S20231114*5ϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+967594_5..SV"*
+
+967594_5..S20231114*5(Ϫ:530S
+022906_5..NT
+
+022906_5..N20231114*5ϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+022906_5..NV"*
+
+022906_5..N20231114*5(Ϫ:515N
+830830_5..ST
+
+830830_5..S20231114*5ϪϪ"539SϪϪ"538SϪϪ"537SϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+830830_5..SV"*
+
+830830_5..S20231114*5(Ϫ:539S
+685314_5..NT
+
+685314_5..N20231114*5ϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+685314_5..NV"*
+
+685314_5..N20231114*5(Ϫ:523N
+363911_5..ST
+
+363911_5..S20231114*5ϪϪ"539SϪϪ"538SϪϪ"537SϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+363911_5..SV"*
+
+363911_5..S20231114*5(Ϫ:539S
+892589_5..NT
+
+892589_5..N20231114*5ϪϪ"507NϪϪ"508NϪϪ"509NϪϪ"510NϪϪ"511NϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+892589_5..NV"*
+
+892589_5..N20231114*5 (Ϫ:507N
+215729_5..ST
+
+215729_5..S20231114*5ϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+215729_5..SV"*
+
+215729_5..S20231114*5(Ϫ:534S
+992479_5..NT
+
+992479_5..N20231114*5ϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+992479_5..NV"*
+
+992479_5..N20231114*5(Ϫ:518N
+890700_5..ST
+
+890700_5..S20231114*5ϪϪ"541SϪϪ"540SϪϪ"539SϪϪ"538SϪϪ"537SϪϪ"536SϪϪ"535SϪϪ"534SϪϪ"533SϪϪ"532SϪϪ"531SϪϪ"530SϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+890700_5..SV"*
+
+890700_5..S20231114*5(Ϫ:541S
+687196_5..NT
+
+687196_5..N20231114*5ϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+687196_5..NV"*
+
+687196_5..N20231114*5(Ϫ:522N
+480944_5..ST
+
+480944_5..S20231114*5ϪϪ"529SϪϪ"528SϪϪ"527SϪϪ"526SϪϪ"525SϪϪ"524SϪϪ"523SϪϪ"522SϪϪ"521SϪϪ"520SϪϪ"519SϪϪ"518SϪϪ"517SϪϪ"516SϪϪ"515SϪϪ"514SϪϪ"513SϪϪ"512SϪϪ"511SϪϪ"510SϪϪ"509SϪϪ"508SϪ"507S:
+480944_5..SV"*
+
+480944_5..S20231114*5(Ϫ:529S
+564059_5..NT
+
+564059_5..N20231114*5ϪϪ"512NϪϪ"513NϪϪ"514NϪϪ"515NϪϪ"516NϪϪ"517NϪϪ"518NϪϪ"519NϪϪ"520NϪϪ"521NϪϪ"522NϪϪ"523NϪϪ"524NϪϪ"525NϪϪ"526NϪϪ"527NϪϪ"528NϪϪ"529NϪϪ"530NϪϪ"531NϪϪ"532NϪϪ"533NϪϪ"534NϪϪ"535NϪϪ"536NϪϪ"537NϪϪ"538NϪϪ"539NϪϪ"540NϪϪ"541NϪ"542N:
+564059_5..NV"*
+
+564059_5..N20231114*5(Ϫ:512N
+009329_6..ST
+
+009329_6..S20231114*6ϪϪ"636SϪϪ"635SϪϪ"634SϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+009329_6..SV"*
+
+009329_6..S20231114*6(Ϫ:636S
+349604_6..NT
+
+349604_6..N20231114*6ϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+349604_6..NV"*
+
+349604_6..N20231114*6
+(Ϫ:615N
+098259_6..ST
+
+098259_6..S20231114*6ϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+098259_6..SV"*
+
+098259_6..S20231114*6
+(Ϫ:630S
+043204_6..NT
+
+043204_6..N20231114*6ϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+043204_6..NV"*
+
+043204_6..N20231114*6(Ϫ:613N
+611792_6..ST
+
+611792_6..S20231114*6ϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+611792_6..SV"*
+
+611792_6..S20231114*6	(Ϫ:631S
+575127_6..NT
+
+575127_6..N20231114*6ϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+575127_6..NV"*
+
+575127_6..N20231114*6(Ϫ:609N
+501287_6..ST
+
+501287_6..S20231114*6ϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+501287_6..SV"*
+
+501287_6..S20231114*6(Ϫ:633S
+188310_6..NT
+
+188310_6..N20231114*6ϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+188310_6..NV"*
+
+188310_6..N20231114*6(Ϫ:621N
+422753_6..ST
+
+422753_6..S20231114*6ϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+422753_6..SV"*
+
+422753_6..S20231114*6
+(Ϫ:630S
+113929_6..NT
+
+113929_6..N20231114*6ϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+113929_6..NV"*
+
+113929_6..N20231114*6(Ϫ:608N
+504545_6..ST
+
+504545_6..S20231114*6ϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+504545_6..SV"*
+
+504545_6..S20231114*6(Ϫ:625S
+836631_6..NT
+
+836631_6..N20231114*6ϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+836631_6..NV"*
+
+836631_6..N20231114*6
+(Ϫ:615N
+121643_6..ST
+
+121643_6..S20231114*6ϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+121643_6..SV"*
+
+121643_6..S20231114*6(Ϫ:625S
+316568_6..NT
+
+316568_6..N20231114*6ϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+316568_6..NV"*
+
+316568_6..N20231114*6
+(Ϫ:615N
+163225_6..ST
+
+163225_6..S20231114*6ϪϪ"635SϪϪ"634SϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+163225_6..SV"*
+
+163225_6..S20231114*6(Ϫ:635S
+393815_6..NT
+
+393815_6..N20231114*6ϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+393815_6..NV"*
+
+393815_6..N20231114*6(Ϫ:607N
+088782_6..ST
+
+088782_6..S20231114*6ϪϪ"634SϪϪ"633SϪϪ"632SϪϪ"631SϪϪ"630SϪϪ"629SϪϪ"628SϪϪ"627SϪϪ"626SϪϪ"625SϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+088782_6..SV"*
+
+088782_6..S20231114*6(Ϫ:634S
+403504_6..NT
+
+403504_6..N20231114*6ϪϪ"605NϪϪ"606NϪϪ"607NϪϪ"608NϪϪ"609NϪϪ"610NϪϪ"611NϪϪ"612NϪϪ"613NϪϪ"614NϪϪ"615NϪϪ"616NϪϪ"617NϪϪ"618NϪϪ"619NϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+403504_6..NV"*
+
+403504_6..N20231114*6 (Ϫ:605N
+583505_6..ST
+
+583505_6..S20231114*6ϪϪ"624SϪϪ"623SϪϪ"622SϪϪ"621SϪϪ"620SϪϪ"619SϪϪ"618SϪϪ"617SϪϪ"616SϪϪ"615SϪϪ"614SϪϪ"613SϪϪ"612SϪϪ"611SϪϪ"610SϪϪ"609SϪϪ"608SϪϪ"607SϪϪ"606SϪ"605S:
+583505_6..SV"*
+
+583505_6..S20231114*6(Ϫ:624S
+964850_6..NT
+
+964850_6..N20231114*6ϪϪ"620NϪϪ"621NϪϪ"622NϪϪ"623NϪϪ"624NϪϪ"625NϪϪ"626NϪϪ"627NϪϪ"628NϪϪ"629NϪϪ"630NϪϪ"631NϪϪ"632NϪϪ"633NϪϪ"634NϪϪ"635NϪϪ"636NϪϪ"637NϪϪ"638NϪϪ"639NϪ"640N:
+964850_6..NV"*
+
+964850_6..N20231114*6(Ϫ:620N3
+alert0*)*1R"
+ 
+Trains are running with delays3
+alert1*)*2R"
+ 
+Trains are running with delays3
+alert2*)*3R"
+ 
+Trains are running with delays3
+alert3*)*4R"
+ 
+Trains are running with delays3
+alert4*)*5R"
+ 
+Trains are running with delays3
+alert5*)*6R"
+ 
+Trains are running with delays
\ No newline at end of file
@@ -0,0 +1,171 @@
+# Local stand-in for an MQTT broker, enough to try publisher.py --mqtt-broker and a board's subscriber without
+# installing mosquitto: CONNECT, QoS 0 and 1 PUBLISH with retained messages, SUBSCRIBE with + and # wildcards, PINGREQ.
+#
+#   python bench/mqtt_broker.py --port 1883 [--verbose]
+#
+# or in process, e.g. from a harness:
+#   broker = mqtt_broker.start()
+#   broker.published  # every (topic, message) received, in order
+import argparse
+import logging
+import os
+import socketserver
+import struct
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mqtt  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBE = 0x80
+SUBACK = 0x90
+PINGREQ = 0xc0
+PINGRESP = 0xd0
+
+
+def _read_packet(rfile):
+    header = rfile.read(1)
+    if not header:
+        return None, None
+
+    length = 0
+    shift = 0
+    while True:
+        byte = rfile.read(1)[0]
+        length |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+
+    return header[0], rfile.read(length)
+
+
+def _read_string(body, offset):
+    length, = struct.unpack_from('!H', body, offset)
+    return body[offset + 2:offset + 2 + length].decode(), offset + 2 + length
+
+
+def topic_matches(topic_filter, topic):
+    filter_levels = topic_filter.split('/')
+    levels = topic.split('/')
+    for i, level in enumerate(filter_levels):
+        if level == '#':
+            return True
+        if i >= len(levels) or (level != '+' and level != levels[i]):
+            return False
+    return len(filter_levels) == len(levels)
+
+
+class _MQTTRequestHandler(socketserver.StreamRequestHandler):
+    def send(self, data):
+        with self.write_lock:
+            self.wfile.write(data)
+
+    def handle(self):
+        self.write_lock = threading.Lock()
+        broker = self.server
+        try:
+            while True:
+                packet_type, body = _read_packet(self.rfile)
+                if packet_type is None:
+                    break
+
+                kind = packet_type & 0xf0
+                if kind == mqtt.CONNECT:
+                    self.send(bytes([mqtt.CONNACK, 2, 0, 0]))
+                elif kind == mqtt.PUBLISH:
+                    topic, offset = _read_string(body, 0)
+                    # QoS 1 (2 is treated the same) has a packet id after the topic to acknowledge once it's handled
+                    packet_id = None
+                    if packet_type & 0x06:
+                        packet_id = body[offset:offset + 2]
+                        offset += 2
+                    broker.publish(topic, body[offset:], packet_type & 0x01)
+                    if packet_id is not None:
+                        self.send(mqtt.packet(mqtt.PUBACK, packet_id))
+                elif kind == SUBSCRIBE:
+                    packet_id = body[:2]
+                    offset = 2
+                    granted = bytearray()
+                    filters = []
+                    while offset < len(body):
+                        topic_filter, offset = _read_string(body, offset)
+                        offset += 1
+                        filters.append(topic_filter)
+                        granted.append(0)
+                    self.send(mqtt.packet(SUBACK, packet_id + bytes(granted)))
+                    broker.subscribe(self, filters)
+                elif kind == PINGREQ:
+                    self.send(bytes([PINGRESP, 0]))
+                elif kind == mqtt.DISCONNECT:
+                    break
+        except (OSError, IndexError):
+            pass
+        finally:
+            broker.unsubscribe(self)
+
+
+class Broker(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port=0):
+        super().__init__(('127.0.0.1', port), _MQTTRequestHandler)
+        self.published = []
+        self.retained = {}
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, handler, filters):
+        with self._lock:
+            self._subscriptions.setdefault(handler, []).extend(filters)
+            retained = [(topic, message) for topic, message in self.retained.items()
+                        if any(topic_matches(topic_filter, topic) for topic_filter in filters)]
+
+        for topic, message in retained:
+            handler.send(mqtt.publish_packet(topic, message, retain=True))
+
+    def unsubscribe(self, handler):
+        with self._lock:
+            self._subscriptions.pop(handler, None)
+
+    def publish(self, topic, message, retain):
+        logger.info('%s %s bytes%s', topic, len(message), ' (retained)' if retain else '')
+        with self._lock:
+            self.published.append((topic, message))
+            if retain:
+                self.retained[topic] = message
+            subscribers = [handler for handler, filters in self._subscriptions.items()
+                           if any(topic_matches(topic_filter, topic) for topic_filter in filters)]
+
+        for handler in subscribers:
+            try:
+                handler.send(mqtt.publish_packet(topic, message))
+            except OSError:
+                self.unsubscribe(handler)
+
+
+# Run a broker on a background thread
+def start(port=0):
+    broker = Broker(port)
+    threading.Thread(target=broker.serve_forever, daemon=True).start()
+    return broker
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a throwaway MQTT broker')
+    parser.add_argument('--port', type=int, default=mqtt.DEFAULT_PORT)
+    parser.add_argument('--verbose', action='store_true', help='Log every message published')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(asctime)s %(message)s')
+    broker = Broker(args.port)
+    print('MQTT broker on 127.0.0.1:{}'.format(broker.server_address[1]))
+    broker.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
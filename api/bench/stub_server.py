@@ -0,0 +1,88 @@
+# Local stand-in for api-endpoint.mta.info that serves fixture bytes from memory.
+#
+#   server, urls = stub_server.start(fixtures.load_fixtures('rush'))
+#   feeds.FEED_URLS[:] = urls
+#
+# or standalone, e.g. for server.py --feed-base-url http://127.0.0.1:8081/
+#   python bench/stub_server.py --size rush --port 8081
+import argparse
+import gzip
+import http.server
+import threading
+import time
+
+import fixtures
+from fixtures import FEED_NAMES
+
+
+class _FeedRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes, so without this keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        # Answers to both /gtfs-bdfm and the MTA's own /nyct%2Fgtfs-bdfm
+        data = self.server.fixtures.get(self.path.rsplit('/', 1)[-1].rsplit('%2F', 1)[-1])
+        if data is None:
+            self.send_error(404)
+            return
+
+        if self.server.latency:
+            threading.Event().wait(self.server.latency)
+
+        self.server.requests += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            data = self.server.compressed(data)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, fixtures, latency=0, port=0):
+        super().__init__(('127.0.0.1', port), _FeedRequestHandler)
+        self.fixtures = fixtures
+        self.latency = latency
+        self.requests = 0
+        self._compressed = {}
+
+    def compressed(self, data):
+        if data not in self._compressed:
+            self._compressed[data] = gzip.compress(data)
+        return self._compressed[data]
+
+    @property
+    def base_url(self):
+        return 'http://127.0.0.1:{}/'.format(self.server_port)
+
+
+# Serve {feed name: bytes} on a background thread. Returns the server and a stand-in for feeds.FEED_URLS pointing at it
+def start(fixtures, latency=0):
+    server = StubServer(fixtures, latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, [server.base_url + name for name in FEED_NAMES]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve fixture feeds like the MTA endpoint would')
+    parser.add_argument('--size', choices=fixtures.SIZES, default='typical')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--latency', type=float, default=0)
+    args = parser.parse_args()
+
+    fixtures.ensure_fixtures()
+    server = StubServer(fixtures.load_fixtures(args.size, int(time.time())), args.latency, args.port)
+    print('Serving {} fixtures on {}'.format(args.size, server.base_url))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# Per-key circuit breaker.
+#
+# After THRESHOLD consecutive failures a key's circuit opens and callers skip it entirely for a backoff period that
+# doubles with every further failure, up to MAX_BACKOFF. Once that passes a single trial call is let through
+# (half-open) - success closes the circuit, failure reopens it for longer. Keeps us from hammering an MTA feed that's
+# already down while still noticing quickly when it comes back.
+import threading
+import time
+
+THRESHOLD = 3
+BASE_BACKOFF = 5
+MAX_BACKOFF = 120
+
+
+class CircuitBreaker:
+    def __init__(self, threshold=THRESHOLD, base_backoff=BASE_BACKOFF, max_backoff=MAX_BACKOFF):
+        self.threshold = threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        # key -> [consecutive failures, open until, trial in flight]
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    # Whether a call for key should go ahead. While half-open only the first caller gets a yes
+    def allow(self, key, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit[0] < self.threshold:
+                return True
+            if now < circuit[1] or circuit[2]:
+                return False
+
+            circuit[2] = True
+            return True
+
+    def record_success(self, key):
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def record_failure(self, key, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            circuit = self._circuits.setdefault(key, [0, 0, False])
+            circuit[0] += 1
+            circuit[2] = False
+            if circuit[0] >= self.threshold:
+                backoff = self.base_backoff * 2 ** (circuit[0] - self.threshold)
+                circuit[1] = now + min(backoff, self.max_backoff)
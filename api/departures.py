@@ -0,0 +1,153 @@
+import array
+import bisect
+import heapq
+import itertools
+
+import gtfs_fast
+
+UPTOWN = 'N'
+DOWNTOWN = 'S'
+
+# We only care about times under an hour
+DEPARTURE_HORIZON = 3600
+
+
+# Every departure in a feed snapshot held as parallel array columns where each platform is one contiguous run sorted
+# by time. platforms maps (stop_id, direction) -> (start, end) into the columns and routes holds indexes into route_ids
+class DepartureIndex:
+    __slots__ = ('times', 'routes', 'route_ids', 'platforms')
+
+    def __init__(self, times, routes, route_ids, platforms):
+        self.times = times
+        self.routes = routes
+        self.route_ids = route_ids
+        self.platforms = platforms
+
+
+# MTA adds N or S to the stop id to signify the uptown or downtown side of the station
+def split_stop_id(stop_id):
+    if stop_id[-1:] in (UPTOWN, DOWNTOWN):
+        return stop_id[:-1], stop_id[-1]
+
+    return stop_id, ''
+
+
+# departs_at and a route number packed into one integer, so sorting plain ints orders by time with no key function
+ROUTE_BITS = 16
+ROUTE_MASK = (1 << ROUTE_BITS) - 1
+
+
+# Walk a feed once, bucketing every stop time update by platform as packed departs_at/route ints, then sort each
+# bucket and unpack it into the columns as one contiguous run. feed is a FeedMessage or a gtfs_fast.Feed
+def build_index(feed):
+    route_numbers = {}
+    buckets = {}
+    if isinstance(feed, gtfs_fast.Feed):
+        _bucket_rows(feed.rows, route_numbers, buckets)
+        return _columns(buckets, route_numbers)
+
+    for entity in feed.entity:
+        if not entity.HasField('trip_update'):
+            continue
+
+        route_id = entity.trip_update.trip.route_id
+        route = route_numbers.get(route_id)
+        if route is None:
+            route = route_numbers[route_id] = len(route_numbers)
+        for stop_time_update in entity.trip_update.stop_time_update:
+            # Terminals only have an arrival time
+            departs_at = stop_time_update.departure.time or stop_time_update.arrival.time
+            if departs_at > 0:
+                bucket = buckets.get(stop_time_update.stop_id)
+                if bucket is None:
+                    bucket = buckets[stop_time_update.stop_id] = []
+                bucket.append(departs_at << ROUTE_BITS | route)
+
+    return _columns(buckets, route_numbers)
+
+
+# gtfs_fast has already dropped updates with no usable time and fallen back to arrivals for terminals
+def _bucket_rows(rows, route_numbers, buckets):
+    for stop_id, route_id, departs_at in rows:
+        route = route_numbers.get(route_id)
+        if route is None:
+            route = route_numbers[route_id] = len(route_numbers)
+        bucket = buckets.get(stop_id)
+        if bucket is None:
+            bucket = buckets[stop_id] = []
+        bucket.append(departs_at << ROUTE_BITS | route)
+
+
+def _columns(buckets, route_numbers):
+    times = array.array('q')
+    routes = array.array('H')
+    spans = {}
+    for stop_id, bucket in buckets.items():
+        bucket.sort()
+        start = len(times)
+        times.extend([key >> ROUTE_BITS for key in bucket])
+        routes.extend([key & ROUTE_MASK for key in bucket])
+        spans[split_stop_id(stop_id)] = (start, len(times))
+
+    return DepartureIndex(times, routes, list(route_numbers), spans)
+
+
+# url -> (FeedMessage, index). The feed cache hands back the same FeedMessage until a new snapshot arrives so an
+# identity check is enough to know the index is still current
+_index_cache = {}
+
+
+def index_for_feed(url, feed):
+    cached = _index_cache.get(url)
+    if cached is not None and cached[0] is feed:
+        return cached[1]
+
+    index = build_index(feed)
+    _index_cache[url] = (feed, index)
+    return index
+
+
+# Column range of a platform's departures between now and now + horizon
+def _window(index, stop_id, direction, now, horizon):
+    span = index.platforms.get((stop_id, direction))
+    if span is None:
+        return 0, 0
+
+    start = bisect.bisect_left(index.times, now, *span)
+    return start, bisect.bisect_right(index.times, now + horizon, start, span[1])
+
+
+# (time, route_id) pairs from one window, already in time order
+def _window_departures(index, start, end, route_ids):
+    times = index.times
+    routes = index.routes
+    names = index.route_ids
+    for i in range(start, end):
+        route_id = names[routes[i]]
+        if route_ids is None or route_id in route_ids:
+            yield times[i], route_id
+
+
+# The soonest departures from a station across every feed serving it, as time ordered (times, route_ids).
+# Each feed's window is already sorted, so merging them through a heap and stopping after limit is a top-k that never
+# sorts (or even visits) anything past the last departure returned. route_ids optionally keeps only those routes
+def upcoming(indexes, stop_id, direction, now, horizon=DEPARTURE_HORIZON, route_ids=None, limit=None):
+    runs = []
+    for index in indexes:
+        start, end = _window(index, stop_id, direction, now, horizon)
+        if start < end:
+            runs.append(_window_departures(index, start, end, route_ids))
+
+    merged = runs[0] if len(runs) == 1 else heapq.merge(*runs)
+    times = array.array('q')
+    names = []
+    for departs_at, route_id in itertools.islice(merged, limit):
+        times.append(departs_at)
+        names.append(route_id)
+
+    return times, names
+
+
+# Whole minutes until each departure. upcoming never returns trains that have already left so this never goes negative
+def minutes_away(times, now):
+    return [(departs_at - now) // 60 for departs_at in times]
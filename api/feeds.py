@@ -0,0 +1,280 @@
+import collections
+import json
+import logging
+import os
+import threading
+import time
+
+import circuit_breaker
+import gtfs_fast
+import http_pool
+import metrics
+import single_flight
+
+logger = logging.getLogger(__name__)
+
+FEED_URLS = [
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs',  # 123456S
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-l',  # L
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-nqrw',  # NRQW
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-bdfm',  # BDFM
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-ace',  # ACE
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-7',  # 7
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-jz',  # JZ
+    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-g'  # G
+]
+
+# Seconds to wait on any single feed before giving up on it
+FEED_TIMEOUT = 5
+
+# The MTA publishes a new snapshot roughly every 30s, so a cached feed is good until 30s past its header timestamp...
+FEED_CACHE_TTL = 30
+# ...but never refetched more often than this, in case the MTA stops bumping the timestamp
+FEED_CACHE_MIN_TTL = 5
+# How old an expired feed can get and still be served while it's refetched in the background
+FEED_MAX_STALE = 10 * 60
+# Max parsed feeds kept in memory. Least recently used feeds are evicted first
+FEED_CACHE_SIZE = len(FEED_URLS)
+
+# Precomputed stop_id -> feed index, built offline by scripts/build_stop_index.py
+STOP_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stop_feeds.json')
+
+
+def _load_stop_index(path=STOP_INDEX_PATH):
+    try:
+        with open(path) as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        logger.warning("No stop index at %s, every request will fetch every feed", path)
+        return {'stops': {}}
+
+    return index
+
+
+_stop_index = _load_stop_index()
+
+
+# Feeds serving a station. Unknown stops (or a missing index) fall back to every feed so we never drop departures
+def feed_urls_for_stop(stop_id):
+    feed_ids = _stop_index['stops'].get(stop_id)
+    if not feed_ids:
+        return list(FEED_URLS)
+
+    return [FEED_URLS[feed_id] for feed_id in feed_ids]
+
+
+# Shared by every feed and kept at module scope so connections to the MTA survive across warm invocations
+_connection_pool = http_pool.ConnectionPool()
+
+# Stands in when the caller isn't collecting metrics
+_NO_METRICS = metrics.Metrics(None, enabled=False)
+
+
+def download_feed(url, api_key, timeout=FEED_TIMEOUT, request_metrics=_NO_METRICS):
+    def count_connection(reused):
+        request_metrics.add('ConnectionsReused' if reused else 'ConnectionsOpened', 1)
+
+    return _connection_pool.get(url, {'x-api-key': api_key}, timeout, count_connection)
+
+
+def connection_stats():
+    return _connection_pool.stats()
+
+
+# Whether to decode feeds with gtfs_fast instead of gtfs_realtime_pb2, worked out on first parse
+_use_fast_decoder = None
+
+
+# Returns a FeedMessage, or a gtfs_fast.Feed when protobuf is on its pure-Python backend. The upb and C++ backends
+# parse in native code and beat gtfs_fast, so it only ever stands in for the slow one
+def parse_feed(data):
+    global _use_fast_decoder
+
+    if _use_fast_decoder is None:
+        from google.protobuf.internal import api_implementation
+        _use_fast_decoder = api_implementation.Type() == 'python'
+    if _use_fast_decoder:
+        return gtfs_fast.decode(data)
+
+    # Imported on first use to keep it off the cold start path of requests that never parse a feed
+    import gtfs_realtime_pb2
+
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.ParseFromString(data)
+    return feed
+
+
+def entity_count(feed):
+    if isinstance(feed, gtfs_fast.Feed):
+        return feed.entity_count
+    return len(feed.entity)
+
+
+# Download and parse one feed. Raises on any network or parse error
+def fetch_feed(url, api_key, timeout=FEED_TIMEOUT, request_metrics=_NO_METRICS):
+    with request_metrics.timer('DownloadTime'):
+        data = download_feed(url, api_key, timeout, request_metrics)
+    request_metrics.add('BytesDownloaded', len(data), metrics.BYTES)
+
+    with request_metrics.timer('ParseTime'):
+        feed = parse_feed(data)
+    request_metrics.add('Entities', entity_count(feed))
+    return feed
+
+
+# Module level so warm Lambda containers keep serving parsed feeds between invocations.
+# url -> (expires_at, FeedMessage), kept in least -> most recently used order
+_feed_cache = collections.OrderedDict()
+_feed_cache_lock = threading.Lock()
+
+# Feeds something else (server.py's poller) keeps fresh. Requests serve whatever snapshot of these is in memory instead
+# of refetching expired ones themselves - every other feed still expires as usual
+polled_urls = set()
+
+# Stops us retrying a feed that keeps failing on every request
+_breaker = circuit_breaker.CircuitBreaker()
+
+# Feeds being fetched right now, so concurrent requests for one wait on that fetch instead of starting another
+_flights = single_flight.SingleFlight()
+
+# Feeds with a background revalidation already running
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+
+def _cache_entry(url):
+    with _feed_cache_lock:
+        entry = _feed_cache.get(url)
+        if entry is not None:
+            _feed_cache.move_to_end(url)
+        return entry
+
+
+def _cache_put(url, feed, now):
+    with _feed_cache_lock:
+        cached = _feed_cache.get(url)
+        # The endpoint occasionally hands back an older snapshot than one we've already seen - keep the newer one
+        if cached is not None and cached[1].header.timestamp >= feed.header.timestamp:
+            feed = cached[1]
+
+        expires_at = max(feed.header.timestamp + FEED_CACHE_TTL, now + FEED_CACHE_MIN_TTL)
+        _feed_cache[url] = (expires_at, feed)
+        _feed_cache.move_to_end(url)
+
+        while len(_feed_cache) > FEED_CACHE_SIZE:
+            _feed_cache.popitem(last=False)
+
+    return feed
+
+
+# When a cached feed is next due for a refresh, or None if it isn't cached
+def cache_expires_at(url):
+    with _feed_cache_lock:
+        entry = _feed_cache.get(url)
+        return entry[0] if entry is not None else None
+
+
+def _refresh_feed(url, api_key, timeout, request_metrics):
+    try:
+        feed = fetch_feed(url, api_key, timeout, request_metrics)
+    except Exception:
+        _breaker.record_failure(url)
+        raise
+
+    _breaker.record_success(url)
+    return _cache_put(url, feed, time.time())
+
+
+# A cache miss in fetch_feeds. By the time it gets here another request may already have fetched the feed
+def _fetch_expired(url, api_key, timeout, request_metrics):
+    entry = _cache_entry(url)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+
+    return _refresh_feed(url, api_key, timeout, request_metrics)
+
+
+# Run fetch for url unless a fetch of that feed is already in flight, in which case share its result. A burst of
+# requests, the poller and background revalidation all end up with a single download and parse per feed
+def _coalesced(fetch, url, api_key, timeout, request_metrics):
+    feed, shared = _flights.do(url, fetch, url, api_key, timeout, request_metrics)
+    if shared:
+        request_metrics.add('CoalescedFetches', 1)
+    return feed
+
+
+# Fetch one feed straight into the cache, whether or not the cached copy has expired
+def refresh_feed(url, api_key, timeout=FEED_TIMEOUT, request_metrics=_NO_METRICS):
+    return _coalesced(_refresh_feed, url, api_key, timeout, request_metrics)
+
+
+def _revalidate(url, api_key, timeout):
+    try:
+        refresh_feed(url, api_key, timeout)
+    except Exception:
+        logger.exception("Couldn't revalidate feed %s", url)
+    finally:
+        with _revalidating_lock:
+            _revalidating.discard(url)
+
+
+# Refresh a stale feed on a background thread, at most one at a time per feed. On Lambda the thread is frozen along
+# with the container once the response goes out, so it may only finish at the start of the next invocation
+def _revalidate_in_background(url, api_key, timeout, now):
+    with _revalidating_lock:
+        if url in _revalidating or not _breaker.allow(url, now):
+            return
+        _revalidating.add(url)
+
+    threading.Thread(target=_revalidate, args=(url, api_key, timeout), daemon=True).start()
+
+
+def clear_cache():
+    with _feed_cache_lock:
+        _feed_cache.clear()
+
+
+# Fetch several feeds at once so the total time tracks the slowest feed rather than the sum of all of them.
+# Feeds still fresh in the cache are served from memory without touching the network. Expired feeds up to
+# FEED_MAX_STALE old are served as they are while they're refetched in the background (stale-while-revalidate), and
+# feeds whose circuit breaker is open aren't fetched at all.
+# Returns a dict of url -> FeedMessage. Feeds that fail are logged and left out so one bad feed doesn't sink the
+# whole response. Check each feed's header timestamp to see how old it is
+def fetch_feeds(urls, api_key, timeout=FEED_TIMEOUT, request_metrics=_NO_METRICS):
+    now = time.time()
+    feeds = {}
+    missing = []
+    for url in dict.fromkeys(urls):
+        entry = _cache_entry(url)
+        if entry is not None and (entry[0] > now or url in polled_urls):
+            feeds[url] = entry[1]
+        elif entry is not None and now - entry[1].header.timestamp < FEED_MAX_STALE:
+            feeds[url] = entry[1]
+            request_metrics.add('StaleFeeds', 1)
+            _revalidate_in_background(url, api_key, timeout, now)
+        elif _breaker.allow(url, now):
+            missing.append(url)
+        else:
+            request_metrics.add('FeedsSkippedByBreaker', 1)
+
+    request_metrics.add('CacheHits', len(feeds))
+    request_metrics.add('CacheMisses', len(missing))
+    if not missing:
+        return feeds
+
+    # Only warm cache misses need threads, so the import waits until the first one
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        futures = {
+            executor.submit(_coalesced, _fetch_expired, url, api_key, timeout, request_metrics): url for url in missing
+        }
+        for future in concurrent.futures.as_completed(futures):
+            url = futures[future]
+            try:
+                feeds[url] = future.result()
+            except Exception:
+                logger.exception("Couldn't fetch feed %s", url)
+                request_metrics.add('FeedErrors', 1)
+
+    return feeds
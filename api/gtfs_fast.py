@@ -0,0 +1,223 @@
+# Fast path GTFS-RT decoder.
+#
+# gtfs_realtime_pb2 builds Python objects for every entity, vehicle, alert and extension in a feed, but departure
+# boards only ever read the trip's route_id and each stop time update's stop_id and departure time. This walks the
+# protobuf wire format directly, pulls out just those fields and steps over everything else by length.
+#
+# It only pays off on the pure-Python protobuf backend. The upb backend in protobuf 4.x parses whole feeds in C and
+# beats it, so feeds.parse_feed only uses this when protobuf is running pure Python (bench/bench_decoder.py compares
+# the two on whatever protobuf is installed). tests/test_gtfs_fast.py checks it agrees with gtfs_realtime_pb2.
+#
+# Field numbers below come from proto/gtfs-realtime.proto
+
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+_FIXED32 = 5
+
+# FeedMessage
+_FEED_HEADER = 1
+_FEED_ENTITY = 2
+# FeedHeader
+_HEADER_TIMESTAMP = 3
+# FeedEntity
+_ENTITY_TRIP_UPDATE = 3
+# TripUpdate
+_TRIP_UPDATE_TRIP = 1
+_TRIP_UPDATE_STOP_TIME_UPDATE = 2
+# TripDescriptor
+_TRIP_ROUTE_ID = 5
+# StopTimeUpdate
+_STOP_TIME_UPDATE_ARRIVAL = 2
+_STOP_TIME_UPDATE_DEPARTURE = 3
+_STOP_TIME_UPDATE_STOP_ID = 4
+# StopTimeEvent
+_STOP_TIME_EVENT_TIME = 2
+
+_INT64_SIGN = 1 << 63
+_UINT64 = 1 << 64
+
+
+class FeedHeader:
+    __slots__ = ('timestamp',)
+
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+
+
+# The parts of a FeedMessage the API reads, so a decoded feed can sit in the feed cache in place of one.
+# rows is [(stop_id, route_id, departs_at), ...] in feed order
+class Feed:
+    __slots__ = ('header', 'entity_count', 'rows')
+
+    def __init__(self, timestamp, entity_count, rows):
+        self.header = FeedHeader(timestamp)
+        self.entity_count = entity_count
+        self.rows = rows
+
+
+def _read_varint(buf, pos):
+    b = buf[pos]
+    pos += 1
+    if b < 0x80:
+        return b, pos
+
+    result = b & 0x7f
+    shift = 7
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7f) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+# Step over a field we don't care about and return the position just after it
+def _skip(buf, pos, wire_type):
+    if wire_type == _VARINT:
+        while buf[pos] & 0x80:
+            pos += 1
+        return pos + 1
+    if wire_type == _LENGTH_DELIMITED:
+        length, pos = _read_varint(buf, pos)
+        return pos + length
+    if wire_type == _FIXED64:
+        return pos + 8
+    if wire_type == _FIXED32:
+        return pos + 4
+
+    raise ValueError('Unsupported wire type {}'.format(wire_type))
+
+
+# Iterate (field_number, wire_type, value_start, value_end) over a message in buf[pos:end]. For length delimited
+# fields value_start/value_end bound the payload, for everything else value_start is where the field's value begins
+def _fields(buf, pos, end):
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field_number = key >> 3
+        wire_type = key & 0x7
+        if wire_type == _LENGTH_DELIMITED:
+            length, pos = _read_varint(buf, pos)
+            yield field_number, wire_type, pos, pos + length
+            pos += length
+        else:
+            yield field_number, wire_type, pos, pos
+            pos = _skip(buf, pos, wire_type)
+
+    if pos != end:
+        raise ValueError('Truncated message')
+
+
+def _read_int64(buf, pos):
+    value = _read_varint(buf, pos)[0]
+    if value >= _INT64_SIGN:
+        value -= _UINT64
+    return value
+
+
+def _event_time(buf, pos, end):
+    time = 0
+    for field_number, wire_type, start, _ in _fields(buf, pos, end):
+        if field_number == _STOP_TIME_EVENT_TIME and wire_type == _VARINT:
+            time = _read_int64(buf, start)
+    return time
+
+
+def _header_timestamp(buf, pos, end):
+    timestamp = 0
+    for field_number, wire_type, start, _ in _fields(buf, pos, end):
+        if field_number == _HEADER_TIMESTAMP and wire_type == _VARINT:
+            timestamp = _read_varint(buf, start)[0]
+    return timestamp
+
+
+def _route_id(buf, pos, end):
+    route_id = ''
+    for field_number, wire_type, start, stop in _fields(buf, pos, end):
+        if field_number == _TRIP_ROUTE_ID and wire_type == _LENGTH_DELIMITED:
+            route_id = bytes(buf[start:stop]).decode()
+    return route_id
+
+
+# Returns (stop_id, departs_at) or None if the update is filtered out or has no usable time.
+# Like departures.build_index, terminals that only have an arrival fall back to the arrival time
+def _stop_time_update(buf, pos, end, wanted):
+    stop_id = None
+    arrival = departure = 0
+    for field_number, wire_type, start, stop in _fields(buf, pos, end):
+        if wire_type != _LENGTH_DELIMITED:
+            continue
+        if field_number == _STOP_TIME_UPDATE_STOP_ID:
+            stop_id = bytes(buf[start:stop])
+            if wanted is not None and stop_id not in wanted:
+                return None
+        elif field_number == _STOP_TIME_UPDATE_DEPARTURE:
+            departure = _event_time(buf, start, stop)
+        elif field_number == _STOP_TIME_UPDATE_ARRIVAL:
+            arrival = _event_time(buf, start, stop)
+
+    # Like protobuf, a missing stop_id reads as empty
+    if stop_id is None:
+        if wanted is not None:
+            return None
+        stop_id = b''
+
+    departs_at = departure or arrival
+    if departs_at <= 0:
+        return None
+
+    return stop_id.decode(), departs_at
+
+
+def _trip_update(buf, pos, end, wanted, rows):
+    route_id = ''
+    stop_times = []
+    for field_number, wire_type, start, stop in _fields(buf, pos, end):
+        if wire_type != _LENGTH_DELIMITED:
+            continue
+        if field_number == _TRIP_UPDATE_STOP_TIME_UPDATE:
+            stop_time = _stop_time_update(buf, start, stop, wanted)
+            if stop_time is not None:
+                stop_times.append(stop_time)
+        elif field_number == _TRIP_UPDATE_TRIP:
+            route_id = _route_id(buf, start, stop)
+
+    # The trip descriptor isn't guaranteed to come before the stop time updates on the wire
+    for stop_id, departs_at in stop_times:
+        rows.append((stop_id, route_id, departs_at))
+
+
+# Stop ids arrive with the direction suffix, so expand each requested station to its platforms
+def _wanted_platforms(stop_ids):
+    if stop_ids is None:
+        return None
+
+    wanted = set()
+    for stop_id in stop_ids:
+        encoded = stop_id.encode()
+        wanted.update((encoded, encoded + b'N', encoded + b'S'))
+    return wanted
+
+
+# Decode a serialized FeedMessage into a Feed. stop_ids optionally limits the rows to those stations (given without the
+# N/S suffix)
+def decode(data, stop_ids=None):
+    buf = memoryview(data)
+    wanted = _wanted_platforms(stop_ids)
+
+    timestamp = 0
+    entity_count = 0
+    rows = []
+    for field_number, wire_type, start, stop in _fields(buf, 0, len(buf)):
+        if wire_type != _LENGTH_DELIMITED:
+            continue
+        if field_number == _FEED_ENTITY:
+            entity_count += 1
+            for entity_field, entity_wire_type, entity_start, entity_stop in _fields(buf, start, stop):
+                if entity_field == _ENTITY_TRIP_UPDATE and entity_wire_type == _LENGTH_DELIMITED:
+                    _trip_update(buf, entity_start, entity_stop, wanted, rows)
+        elif field_number == _FEED_HEADER:
+            timestamp = _header_timestamp(buf, start, stop)
+
+    return Feed(timestamp, entity_count, rows)
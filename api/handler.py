@@ -1,78 +1,288 @@
-import urllib.request
+import base64
+import functools
+import hashlib
 import json
-import contextlib
-import datetime
-import gtfs_realtime_pb2
 import os
+import time
 
-_FEED_URLS = [
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs',  # 123456S
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-l',  # L
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-nqrw',  # NRQW
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-bdfm',  # BDFM
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-ace',  # ACE
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-7',  # 7
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-jz',  # JZ
-    'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-g'  # G
-]
+import departures
+import feeds
+import metrics
+import payload
 
+# Most stops a single /batch request can ask for
+MAX_BATCH_STOPS = 10
 
-def get_departures(event, context):
-    # If the API ever gets to be more than one route, this should be abstracted
-    request = urllib.request.Request(_FEED_URLS[3])
 
+# Response keys for each direction
+DIRECTIONS = {
+    'uptown': departures.UPTOWN,
+    'downtown': departures.DOWNTOWN,
+}
+
+# Bounds on what ?limit= and ?horizon= can ask for
+MAX_LIMIT = 50
+MAX_HORIZON = 4 * 3600
+
+_HORIZON_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+# Departure fields that go into the ETag for each payload version (0 is JSON, which carries both times)
+ETAG_FIELDS = {
+    0: ('route_id', 'departs_in', 'departs_at'),
+    1: ('route_id', 'departs_in'),
+    2: ('route_id', 'departs_at'),
+}
+
+
+# Departures for a stop, soonest first, across every feed index given. By default that's every route in both
+# directions within the hour, _parse_selection narrows it down. departs_at is the departure's epoch time
+def build_body(indexes, stop_id, now, directions=tuple(DIRECTIONS), route_ids=None, limit=None,
+               horizon=departures.DEPARTURE_HORIZON):
+    body = {}
+    for key in directions:
+        times, route_names = departures.upcoming(indexes, stop_id, DIRECTIONS[key], now, horizon, route_ids, limit)
+        body[key] = [
+            {
+                'route_id': route_id,
+                'departs_in': departs_in,
+                'departs_at': departs_at,
+            } for route_id, departs_in, departs_at in zip(route_names, departures.minutes_away(times, now), times)
+        ]
+
+    # Lets clients with their own clock keep counting down from departs_at between refreshes
+    body['server_time'] = now
+    return body
+
+
+# 20m, 1h, 900s or plain seconds
+def _parse_horizon(value):
+    unit = _HORIZON_UNITS.get(value[-1:].lower())
+    if unit is not None:
+        value = value[:-1]
+    if not value.isdigit():
+        raise ValueError('horizon must look like 20m, 1h or 900s')
+
+    return int(value) * (unit or 1)
+
+
+# ?routes=F,M&direction=N&limit=3&horizon=20m so boards only download what they'll actually render.
+# Returns (build_body keyword arguments, None) or (None, error response)
+def _parse_selection(event):
+    params = event.get('queryStringParameters') or {}
+    selection = {}
+    try:
+        if params.get('routes'):
+            # Route ids are all upper case (F, GS, 5X), so ?routes=f means the F
+            selection['route_ids'] = {
+                route_id.strip().upper() for route_id in params['routes'].split(',') if route_id.strip()
+            }
+
+        if params.get('direction'):
+            direction = params['direction'].strip().upper()
+            selection['directions'] = [key for key, value in DIRECTIONS.items() if value == direction]
+            if not selection['directions']:
+                raise ValueError('direction must be N or S')
+
+        if params.get('limit'):
+            limit = params['limit'].strip()
+            selection['limit'] = int(limit) if limit.isdigit() else 0
+            if not 1 <= selection['limit'] <= MAX_LIMIT:
+                raise ValueError('limit must be between 1 and {}'.format(MAX_LIMIT))
+
+        if params.get('horizon'):
+            selection['horizon'] = _parse_horizon(params['horizon'].strip())
+            if not 0 < selection['horizon'] <= MAX_HORIZON:
+                raise ValueError('horizon must be between 1s and {}m'.format(MAX_HORIZON // 60))
+    except ValueError as e:
+        return None, {
+            "statusCode": 400,
+            "body": "Error {}".format(e)
+        }
+
+    return selection, None
+
+
+# API Gateway passes headers through with whatever casing the client used
+def _get_header(event, name):
+    name = name.lower()
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name:
+            return value
+
+    return None
+
+
+# Fingerprint of what the boards would show. Hashing the departures rather than the feed means a new snapshot that
+# doesn't change these stops still earns a 304 (server_time is left out for the same reason). Only the fields the
+# format actually carries are hashed, so version 2's absolute times don't change just because a minute passed. The
+# format is mixed in so JSON and packed ETags never collide
+def _etag(stop_bodies, content_type, version):
+    fields = ETAG_FIELDS[version]
+    digest = hashlib.sha1(content_type.encode())
+    for stop_id, body in stop_bodies:
+        digest.update('{}|'.format(stop_id).encode())
+        for key in DIRECTIONS:
+            digest.update(key.encode())
+            for departure in body.get(key, []):
+                digest.update(','.join(str(departure[field]) for field in fields).encode() + b';')
+
+    return '"{}"'.format(digest.hexdigest()[:20])
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.replace('W/', '', 1) == etag:
+            return True
+
+    return False
+
+
+# stop_bodies is a list of (stop_id, body). JSON unless the client asked for the compact payload (see payload.py) -
+# batches are a JSON object keyed by stop or the packed payloads back to back in request order.
+# Bodyless 304 when the client already has it. age is the data's age in seconds, sent as X-Data-Age. The standard
+# Age header would tell caches the response itself had been cached that long
+def _departures_response(event, stop_bodies, age, batch=False):
+    version = payload.accepts(_get_header(event, 'Accept'))
+    content_type = payload.content_type(version) if version else "application/json"
+    headers = {
+        "Content-Type": content_type,
+        "ETag": _etag(stop_bodies, content_type, version),
+        "Vary": "Accept",
+        "X-Data-Age": str(age),
+    }
+
+    if _etag_matches(_get_header(event, 'If-None-Match'), headers['ETag']):
+        del headers['Content-Type']
+        return {
+            "statusCode": 304,
+            "headers": headers,
+            "body": ""
+        }
+
+    if version:
+        return {
+            "statusCode": 200,
+            "headers": headers,
+            "body": base64.b64encode(b''.join(payload.encode(body, version) for _, body in stop_bodies)).decode('ascii'),
+            "isBase64Encoded": True
+        }
+
+    return {
+        "statusCode": 200,
+        "headers": headers,
+        "body": json.dumps(dict(stop_bodies) if batch else stop_bodies[0][1])
+    }
+
+
+# Departure indexes for every feed serving any of the stops, and how many seconds old the oldest of those feeds is.
+# Returns ((indexes, age), None) or (None, error response)
+def _load_snapshot(stop_ids, request_metrics):
     mta_api_key = os.getenv('MTA_API_KEY')
     if not mta_api_key:
-        return {
+        return None, {
             "statusCode": 500,
             "body": "Error couldn't get API key from env"
         }
 
+    # Only the feeds serving these stops are pulled (concurrently) - a feed that fails is simply missing from the result
+    urls = [url for stop_id in stop_ids for url in feeds.feed_urls_for_stop(stop_id)]
+    with request_metrics.timer('FetchTime'):
+        fetched = feeds.fetch_feeds(urls, mta_api_key, request_metrics=request_metrics)
+    if not fetched:
+        return None, {
+            "statusCode": 502,
+            "body": "Error couldn't fetch any MTA feeds"
+        }
+
+    with request_metrics.timer('IndexTime'):
+        indexes = [departures.index_for_feed(url, feed) for url, feed in fetched.items()]
+
+    # Feeds can be served stale while the MTA is having trouble, so tell clients how old the data is
+    age = max(0, int(time.time()) - min(feed.header.timestamp for feed in fetched.values()))
+    request_metrics.add('DataAge', age, metrics.SECONDS)
+    return (indexes, age), None
+
+
+def _build_bodies(indexes, stop_ids, selection, request_metrics):
+    now = int(time.time())
+    with request_metrics.timer('LookupTime'):
+        stop_bodies = [(stop_id, build_body(indexes, stop_id, now, **selection)) for stop_id in stop_ids]
+
+    for _, body in stop_bodies:
+        for key in DIRECTIONS:
+            request_metrics.add('MatchedDepartures', len(body.get(key, [])))
+    return stop_bodies
+
+
+# Time the whole request and emit its metrics (see metrics.py) however it ends
+def _instrumented(route):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(event, context):
+            request_metrics = metrics.Metrics(route)
+            response = None
+            try:
+                with request_metrics.timer('TotalTime'):
+                    response = function(event, context, request_metrics)
+                return response
+            finally:
+                request_metrics.set_property('StatusCode', response['statusCode'] if response else 500)
+                request_metrics.emit()
+
+        return wrapper
+
+    return decorator
+
+
+@_instrumented('/{stop_id}')
+def get_departures(event, context, request_metrics):
     stop_id = ''
     if 'stop_id' in event['resource']:
         stop_id = event['path'][1:]
+    request_metrics.set_property('StopId', stop_id)
 
-    # Load key from environment variables
-    request.add_header('x-api-key', os.getenv('MTA_API_KEY'))
+    selection, error = _parse_selection(event)
+    if error:
+        return error
 
-    with contextlib.closing(urllib.request.urlopen(request)) as r:
-        data = r.read()
-        feed = gtfs_realtime_pb2.FeedMessage()
-        feed.ParseFromString(data)
+    snapshot, error = _load_snapshot([stop_id], request_metrics)
+    if error:
+        return error
 
-    body = {
-        'uptown': [],
-        'downtown': []
-    }
-
-    for entity in feed.entity:
-        if entity.HasField('trip_update'):
-            for stopTimeUpdate in entity.trip_update.stop_time_update:
-                if stop_id in stopTimeUpdate.stop_id:
-                    time_from_now = datetime.datetime.fromtimestamp(stopTimeUpdate.departure.time) - datetime.datetime.now()
+    indexes, age = snapshot
+    stop_bodies = _build_bodies(indexes, [stop_id], selection, request_metrics)
+    with request_metrics.timer('SerializeTime'):
+        return _departures_response(event, stop_bodies, age)
 
-                    # We only care about times under an hour
-                    if time_from_now > datetime.timedelta(0, 3600, 0):
-                        continue
 
-                    departure = {
-                        'route_id': entity.trip_update.trip.route_id,
-                        'departs_in':  (time_from_now.seconds//60) % 60,
-                    }
+# /batch?stops=D19,L02 - several stops from one set of feeds in one round trip. Takes the same filters as /{stop_id}
+@_instrumented('/batch')
+def get_batch_departures(event, context, request_metrics):
+    stops = ((event.get('queryStringParameters') or {}).get('stops') or '').split(',')
+    stop_ids = list(dict.fromkeys(stop_id.strip() for stop_id in stops if stop_id.strip()))
+    if not stop_ids or len(stop_ids) > MAX_BATCH_STOPS:
+        return {
+            "statusCode": 400,
+            "body": "Error expected between 1 and {} comma separated stops".format(MAX_BATCH_STOPS)
+        }
+    request_metrics.set_property('StopIds', stop_ids)
 
-                    # MTA adds N or S to signify uptown or downtown parts of the station
-                    if 'N' in stopTimeUpdate.stop_id:
-                        body['uptown'].append(departure)
-                    else:
-                        body['downtown'].append(departure)
+    selection, error = _parse_selection(event)
+    if error:
+        return error
 
-    # Sort both uptown and downtown lists by departure time
-    body = {k: sorted(v, key=lambda departure: departure['departs_in']) for k, v in body.items()}
+    snapshot, error = _load_snapshot(stop_ids, request_metrics)
+    if error:
+        return error
 
-    return {
-        "statusCode": 200,
-        "body": json.dumps(body)
-    }
+    indexes, age = snapshot
+    stop_bodies = _build_bodies(indexes, stop_ids, selection, request_metrics)
+    with request_metrics.timer('SerializeTime'):
+        return _departures_response(event, stop_bodies, age, True)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,134 @@
+# Keep-alive HTTP connection pool.
+#
+# urllib.request opens a new TCP connection (and TLS handshake) for every request, which to the MTA often costs more
+# than parsing the feed. A pool held at module scope lets warm Lambda containers and server.py reuse connections
+# across invocations and across every feed on the same host.
+import gzip
+import http.client
+import threading
+import urllib.parse
+
+# Idle connections kept per host - enough for every feed to be fetched at once
+MAX_IDLE_PER_HOST = 8
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, url, status, reason):
+        super().__init__('{} {} from {}'.format(status, reason, url))
+        self.url = url
+        self.status = status
+
+
+class ConnectionPool:
+    def __init__(self, max_idle_per_host=MAX_IDLE_PER_HOST):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'bytes_received': 0,
+            'bytes_decoded': 0,
+        }
+
+    def _count(self, stat, amount=1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    # Reuse counters, e.g. to confirm keep-alive is actually working
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def _checkout(self, scheme, netloc, timeout):
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+
+        return self._connect(scheme, netloc, timeout), False
+
+    def _connect(self, scheme, netloc, timeout):
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(netloc, timeout=timeout)
+
+    def _checkin(self, scheme, netloc, connection):
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    # GET url and return the (decompressed) body. Raises HTTPStatusError on anything but a 200.
+    # on_connection(reused) is called once the request went out, e.g. to count reuse per request rather than per pool
+    def get(self, url, headers=None, timeout=None, on_connection=None):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        headers = dict(headers or {})
+        headers.setdefault('Accept-Encoding', 'gzip')
+
+        connection, reused = self._checkout(parts.scheme, parts.netloc, timeout)
+        try:
+            response = self._request(connection, path, headers)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection under us - retry once on a fresh one
+            connection = self._connect(parts.scheme, parts.netloc, timeout)
+            reused = False
+            try:
+                response = self._request(connection, path, headers)
+            except Exception:
+                connection.close()
+                raise
+        except Exception:
+            connection.close()
+            raise
+
+        self._count('requests')
+        self._count('connections_reused' if reused else 'connections_opened')
+        if on_connection is not None:
+            on_connection(reused)
+
+        try:
+            data = response.read()
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(parts.scheme, parts.netloc, connection)
+
+        if response.status != 200:
+            raise HTTPStatusError(url, response.status, response.reason)
+
+        self._count('bytes_received', len(data))
+        if response.getheader('Content-Encoding', '').lower() == 'gzip':
+            data = gzip.decompress(data)
+        self._count('bytes_decoded', len(data))
+        return data
+
+    def _request(self, connection, path, headers):
+        connection.request('GET', path, headers=headers)
+        return connection.getresponse()
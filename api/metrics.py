@@ -0,0 +1,97 @@
+# Per-request latency and volume metrics.
+#
+# Each request collects stage timings and counters into a Metrics object and emits them as one structured record when
+# it's done. On Lambda the default sink prints CloudWatch Embedded Metric Format JSON to stdout, which CloudWatch turns
+# into metrics with no extra API calls. server.py swaps in a plain logging sink. Set DEPARTURES_METRICS=off to skip
+# collection entirely
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE = 'MtaDepartures'
+
+MILLISECONDS = 'Milliseconds'
+SECONDS = 'Seconds'
+BYTES = 'Bytes'
+COUNT = 'Count'
+
+ENABLED = os.getenv('DEPARTURES_METRICS', 'on').lower() not in ('0', 'off', 'false')
+
+
+# CloudWatch Embedded Metric Format - one log line carries the metric definitions and their values
+def emf_sink(route, values, units, properties):
+    record = {
+        '_aws': {
+            'Timestamp': int(time.time() * 1000),
+            'CloudWatchMetrics': [{
+                'Namespace': NAMESPACE,
+                'Dimensions': [['Route']],
+                'Metrics': [{'Name': name, 'Unit': units[name]} for name in values],
+            }],
+        },
+        'Route': route,
+    }
+    record.update(properties)
+    record.update(values)
+    print(json.dumps(record), flush=True)
+
+
+def log_sink(route, values, units, properties):
+    record = {'route': route}
+    record.update(properties)
+    record.update(values)
+    logger.info(json.dumps(record))
+
+
+# Called with (route, {metric: value}, {metric: unit}, {property: value}) for every request
+sink = emf_sink
+
+
+class Metrics:
+    def __init__(self, route, enabled=None):
+        self.route = route
+        self.enabled = ENABLED if enabled is None else enabled
+        self._values = {}
+        self._units = {}
+        self._properties = {}
+        self._lock = threading.Lock()
+
+    # Accumulate into a metric. Safe to call from the feed fetch threads
+    def add(self, name, value, unit=COUNT):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + value
+            self._units[name] = unit
+
+    # Searchable context that isn't a metric itself, e.g. the stop id
+    def set_property(self, name, value):
+        if self.enabled:
+            self._properties[name] = value
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000, MILLISECONDS)
+
+    def emit(self):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            values = {name: round(value, 3) for name, value in self._values.items()}
+            units = dict(self._units)
+
+        try:
+            sink(self.route, values, units, dict(self._properties))
+        except Exception:
+            logger.exception("Couldn't emit metrics")
@@ -0,0 +1,168 @@
+# Minimal MQTT 3.1.1 publisher.
+#
+# All publisher.py needs is to connect and send PUBLISH packets, which doesn't warrant a client library in the
+# deployment. Retained messages let a board that (re)connects get the latest departures for its stop straight away.
+# Messages go out at QoS 1 and every publish waits for its PUBACK - the publisher only sends changes, so one that
+# vanished into a dead connection would never be sent again.
+import socket
+import struct
+import threading
+
+DEFAULT_PORT = 1883
+TIMEOUT = 5
+# No keepalive pings - every publish waits on its PUBACK, so a dropped (or half-open) connection is noticed there and
+# the message resent on a fresh one
+KEEPALIVE = 0
+
+CONNECT = 0x10
+CONNACK = 0x20
+PUBLISH = 0x30
+PUBACK = 0x40
+DISCONNECT = 0xe0
+
+_RETAIN = 0x01
+_QOS_1 = 0x02
+_CLEAN_SESSION = 0x02
+_PASSWORD = 0x40
+_USERNAME = 0x80
+
+
+class MQTTError(Exception):
+    pass
+
+
+def _string(value):
+    if isinstance(value, str):
+        value = value.encode()
+    return struct.pack('!H', len(value)) + value
+
+
+def _remaining_length(length):
+    encoded = bytearray()
+    while True:
+        byte, length = length % 128, length // 128
+        encoded.append(byte | 0x80 if length else byte)
+        if not length:
+            return bytes(encoded)
+
+
+def packet(packet_type, body):
+    return bytes([packet_type]) + _remaining_length(len(body)) + body
+
+
+def connect_packet(client_id, keepalive=KEEPALIVE, username=None, password=None):
+    flags = _CLEAN_SESSION
+    payload = _string(client_id)
+    if username is not None:
+        flags |= _USERNAME
+        payload += _string(username)
+        if password is not None:
+            flags |= _PASSWORD
+            payload += _string(password)
+
+    return packet(CONNECT, _string('MQTT') + struct.pack('!BBH', 4, flags, keepalive) + payload)
+
+
+# QoS 1 when given a packet_id, otherwise QoS 0
+def publish_packet(topic, message, retain=False, packet_id=None):
+    flags = _RETAIN if retain else 0
+    body = _string(topic)
+    if packet_id is not None:
+        flags |= _QOS_1
+        body += struct.pack('!H', packet_id)
+
+    return packet(PUBLISH | flags, body + message)
+
+
+def _recv_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise MQTTError('Broker closed the connection')
+        data += chunk
+    return data
+
+
+# (packet type, body) of the next packet from the broker
+def read_packet(sock):
+    packet_type = _recv_exactly(sock, 1)[0]
+    length = 0
+    shift = 0
+    while True:
+        byte = _recv_exactly(sock, 1)[0]
+        length |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+
+    return packet_type, _recv_exactly(sock, length)
+
+
+class Client:
+    def __init__(self, host, port=DEFAULT_PORT, client_id='mta-departures', username=None, password=None,
+                 timeout=TIMEOUT):
+        self.host = host
+        self.port = port
+        self.client_id = client_id
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self._sock = None
+        self._packet_id = 0
+        # Feed refreshes publish from the poller's threads
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), self.timeout)
+        try:
+            sock.sendall(connect_packet(self.client_id, username=self.username, password=self.password))
+            packet_type, body = read_packet(sock)
+            if packet_type != CONNACK or len(body) != 2 or body[1] != 0:
+                raise MQTTError('{}:{} refused the connection ({})'.format(self.host, self.port, body[-1:].hex()))
+        except Exception:
+            sock.close()
+            raise
+
+        return sock
+
+    def _send_acknowledged(self, data, packet_id):
+        self._sock.sendall(data)
+        while True:
+            packet_type, body = read_packet(self._sock)
+            if packet_type & 0xf0 == PUBACK and body == struct.pack('!H', packet_id):
+                return
+
+    # Returns once the broker acknowledged the message. Retries once on a fresh connection if the old one is dead,
+    # raises OSError or MQTTError if that fails too
+    def publish(self, topic, message, retain=False):
+        with self._lock:
+            self._packet_id = self._packet_id % 0xffff + 1
+            data = publish_packet(topic, message, retain, self._packet_id)
+            if self._sock is not None:
+                try:
+                    self._send_acknowledged(data, self._packet_id)
+                    return
+                except (OSError, MQTTError):
+                    self._close()
+
+            self._sock = self._connect()
+            try:
+                self._send_acknowledged(data, self._packet_id)
+            except Exception:
+                self._close()
+                raise
+
+    def _close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def close(self):
+        with self._lock:
+            if self._sock is not None:
+                try:
+                    self._sock.sendall(packet(DISCONNECT, b''))
+                except OSError:
+                    pass
+            self._close()
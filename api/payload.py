@@ -0,0 +1,80 @@
+# Compact binary departures payload for the Matrix Portal.
+#
+# Parsing JSON on the ESP32-S2 means allocating nested dicts and key strings on every refresh, so boards can ask for
+# this instead by sending Accept: application/vnd.mta-departures. Version 1 layout, all unsigned bytes:
+#
+#   version | uptown count | downtown count | (route, minutes) * uptown count | (route, minutes) * downtown count
+#
+# minutes is departs_in clamped to 0-255. Boards that count down on their own clock ask for
+# Accept: application/vnd.mta-departures; version=2 instead, which carries absolute times as big endian uint32 epochs:
+#
+#   version | uptown count | downtown count | server time | (route, departs_at) * uptown count | ... * downtown count
+#
+# route is an index into ROUTE_IDS (UNKNOWN_ROUTE if it isn't there).
+# display/code.py carries a copy of ROUTE_IDS, so only ever append to it
+import struct
+
+CONTENT_TYPE = 'application/vnd.mta-departures'
+VERSION = 1
+LATEST_VERSION = 2
+
+ROUTE_IDS = (
+    '1', '2', '3', '4', '5', '6', '7', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'J', 'L', 'M', 'N', 'Q', 'R', 'W', 'Z',
+    'GS', 'FS', 'H', 'SI', '5X', '6X', '7X', 'FX',
+)
+UNKNOWN_ROUTE = 0xff
+
+_ROUTE_INDEXES = {route_id: i for i, route_id in enumerate(ROUTE_IDS)}
+
+# Most departures a direction can carry given the one byte count
+MAX_DEPARTURES = 0xff
+
+
+# Bytes before the departures in each version
+HEADER_SIZES = {1: 3, 2: 7}
+
+
+def _pack_departures(departures, version):
+    packed = bytearray()
+    for departure in departures[:MAX_DEPARTURES]:
+        packed.append(_ROUTE_INDEXES.get(departure['route_id'], UNKNOWN_ROUTE))
+        if version == 1:
+            packed.append(min(max(departure['departs_in'], 0), 0xff))
+        else:
+            packed += struct.pack('>I', departure['departs_at'])
+    return packed
+
+
+# Pack a handler.build_body style dict. A direction left out by ?direction= packs as empty
+def encode(body, version=VERSION):
+    uptown = body.get('uptown', [])[:MAX_DEPARTURES]
+    downtown = body.get('downtown', [])[:MAX_DEPARTURES]
+    header = struct.pack('BBB', version, len(uptown), len(downtown))
+    if version != 1:
+        header += struct.pack('>I', body['server_time'])
+    return header + _pack_departures(uptown, version) + _pack_departures(downtown, version)
+
+
+def content_type(version):
+    return CONTENT_TYPE if version == 1 else '{}; version={}'.format(CONTENT_TYPE, version)
+
+
+# Which payload version a client's Accept header asks for, or 0 if it doesn't want the compact payload at all. JSON
+# stays the default for everyone else
+def accepts(accept_header):
+    if not accept_header:
+        return 0
+
+    for media_range in accept_header.split(','):
+        media_type, *params = media_range.split(';')
+        if media_type.strip() != CONTENT_TYPE:
+            continue
+
+        version = VERSION
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip() == 'version' and value.strip().isdigit():
+                version = int(value)
+        return min(version, LATEST_VERSION)
+
+    return 0
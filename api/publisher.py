@@ -0,0 +1,186 @@
+# Snapshot publisher.
+#
+# Instead of computing departures per request, keep every feed hot with server.py's poller and, each time a feed
+# refreshes, push pre-serialized departures for every stop it serves:
+#   MTA_API_KEY=... python publisher.py --out-dir /var/www/departures [--stops D19,L02]
+#   MTA_API_KEY=... python publisher.py --mqtt-broker localhost:1883 [--stops D19,L02]
+#
+# --out-dir writes {stop_id}.json (the same body as GET /{stop_id}) and {stop_id}.bin (the latest compact payload.py
+# encoding, with absolute times) for any static file server or CDN to serve as is. Files are replaced atomically so a
+# reader never sees half a file, and left alone when nothing changed.
+#
+# --mqtt-broker publishes the same encoding, retained, to {MQTT_TOPIC_PREFIX}/{stop_id} - only when it changed, so
+# subscribed boards hear about new departures as soon as the MTA publishes them and otherwise never wake the radio.
+# MQTT_USERNAME and MQTT_PASSWORD are read from the environment.
+#
+# departs_in is baked in at publish time, so it's only as fresh as the last refresh of its feeds. Boards reading the
+# .bin files or MQTT count down from the absolute departs_at instead
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import circuit_breaker
+import departures
+import feeds
+import handler
+import mqtt
+import payload
+import server
+
+logger = logging.getLogger(__name__)
+
+MQTT_TOPIC_PREFIX = 'mta/departures'
+# One circuit for the whole broker - when it's down it's down for every stop
+MQTT_BREAKER_KEY = 'mqtt'
+
+
+class Publisher:
+    # out_dir and mqtt_client are each optional, but there's little point without one of them
+    def __init__(self, api_key, urls, stop_ids=None, out_dir=None, mqtt_client=None):
+        self.api_key = api_key
+        self.urls = urls
+        # Only publish these stops, or every stop in the feeds when None
+        self.stop_ids = set(stop_ids) if stop_ids else None
+        self.out_dir = out_dir
+        self.mqtt_client = mqtt_client
+        # While the broker is down, skip it rather than wait on a connection for every stop
+        self._mqtt_breaker = circuit_breaker.CircuitBreaker()
+        # stop_id -> {filename or topic: bytes} as last published, so unchanged snapshots aren't sent again
+        self._published = {}
+        # Feed refreshes land on the poller's threads
+        self._lock = threading.Lock()
+
+    # Every stop with at least one platform in index
+    def _stops_in(self, index):
+        stop_ids = {stop_id for stop_id, _ in index.platforms}
+        return stop_ids if self.stop_ids is None else stop_ids & self.stop_ids
+
+    def _write(self, filename, data):
+        path = os.path.join(self.out_dir, filename)
+        fd, tmp_path = tempfile.mkstemp(dir=self.out_dir, prefix='.' + filename)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def _write_files(self, stop_id, body, packed, published):
+        sent = 0
+        for filename, data in ((stop_id + '.json', json.dumps(body).encode()), (stop_id + '.bin', packed)):
+            if published.get(filename) != data:
+                self._write(filename, data)
+                published[filename] = data
+                sent += 1
+        return sent
+
+    def _send_message(self, stop_id, packed, published):
+        topic = '{}/{}'.format(MQTT_TOPIC_PREFIX, stop_id)
+        # Boards count down from departs_at themselves, so only a change to the departures (not the server time in
+        # the header) is worth waking them for. The version and per-direction counts before it still count, or a
+        # train moving from one direction's list to the other's could look unchanged
+        contents = packed[:payload.HEADER_SIZES[1]] + packed[payload.HEADER_SIZES[payload.LATEST_VERSION]:]
+        if published.get(topic) == contents or not self._mqtt_breaker.allow(MQTT_BREAKER_KEY):
+            return 0
+
+        try:
+            self.mqtt_client.publish(topic, packed, retain=True)
+        except Exception:
+            self._mqtt_breaker.record_failure(MQTT_BREAKER_KEY)
+            raise
+
+        self._mqtt_breaker.record_success(MQTT_BREAKER_KEY)
+        published[topic] = contents
+        return 1
+
+    # Returns how many files and messages actually went out. Files and MQTT fail independently - whatever didn't go
+    # out is logged and tried again on the next refresh
+    def publish_stop(self, indexes, stop_id, now):
+        body = handler.build_body(indexes, stop_id, now)
+        packed = payload.encode(body, payload.LATEST_VERSION)
+        published = self._published.setdefault(stop_id, {})
+        sent = 0
+
+        if self.out_dir is not None:
+            try:
+                sent += self._write_files(stop_id, body, packed, published)
+            except OSError:
+                logger.exception("Couldn't write files for stop %s", stop_id)
+
+        if self.mqtt_client is not None:
+            try:
+                sent += self._send_message(stop_id, packed, published)
+            except (OSError, mqtt.MQTTError):
+                logger.exception("Couldn't publish stop %s to MQTT", stop_id)
+
+        return sent
+
+    # Rewrite the files for every stop the refreshed feed serves, plus any we published before that it no longer does
+    # so they empty out rather than going stale
+    def feed_refreshed(self, url):
+        fetched = feeds.fetch_feeds(self.urls, self.api_key)
+        indexes = [departures.index_for_feed(feed_url, feed) for feed_url, feed in fetched.items()]
+        refreshed = fetched.get(url)
+        if refreshed is None:
+            return
+
+        with self._lock:
+            start = time.perf_counter()
+            served = set().union(*(self._stops_in(index) for index in indexes))
+            stop_ids = self._stops_in(departures.index_for_feed(url, refreshed))
+            stop_ids.update(stop_id for stop_id in self._published if stop_id not in served)
+            now = int(time.time())
+            sent = sum(self.publish_stop(indexes, stop_id, now) for stop_id in stop_ids)
+
+        logger.info('Published %s stops (%s changed) for %s in %.1fms', len(stop_ids), sent, url,
+                    (time.perf_counter() - start) * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Publish per-stop departures every time a feed refreshes')
+    parser.add_argument('--out-dir', help='Write {stop_id}.json and {stop_id}.bin files here')
+    parser.add_argument('--mqtt-broker', help='host[:port] to publish changed departures to')
+    parser.add_argument('--stops', help='Comma separated stops to publish. Defaults to every stop in the feeds')
+    parser.add_argument('--feed-base-url', help='Fetch feeds from here instead of the MTA')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s %(message)s')
+
+    api_key = os.getenv('MTA_API_KEY')
+    if not api_key:
+        parser.error("Error couldn't get API key from env")
+    if not args.out_dir and not args.mqtt_broker:
+        parser.error('Nowhere to publish to, pass --out-dir and/or --mqtt-broker')
+
+    if args.feed_base_url:
+        feeds.FEED_URLS[:] = [url.replace(server.MTA_FEED_BASE_URL, args.feed_base_url) for url in feeds.FEED_URLS]
+
+    stop_ids = [stop_id.strip() for stop_id in args.stops.split(',')] if args.stops else None
+    urls = list(feeds.FEED_URLS)
+    if stop_ids:
+        urls = list(dict.fromkeys(url for stop_id in stop_ids for url in feeds.feed_urls_for_stop(stop_id)))
+
+    mqtt_client = None
+    if args.mqtt_broker:
+        host, _, port = args.mqtt_broker.partition(':')
+        mqtt_client = mqtt.Client(host, int(port or mqtt.DEFAULT_PORT), username=os.getenv('MQTT_USERNAME'),
+                                  password=os.getenv('MQTT_PASSWORD'))
+
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+    publisher = Publisher(api_key, urls, stop_ids, args.out_dir, mqtt_client)
+
+    # The poller owns freshness, publishing only ever reads what's already in memory
+    feeds.polled_urls.update(urls)
+    asyncio.run(server.poll_feeds(urls, api_key, publisher.feed_refreshed))
+
+
+if __name__ == '__main__':
+    main()
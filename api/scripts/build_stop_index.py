@@ -0,0 +1,74 @@
+# Build stop_feeds.json - the stop_id -> feed index the handler uses to only download the feeds a station
+# actually needs.
+#
+# Run against an unzipped copy of the MTA's static subway GTFS (http://web.mta.info/developers/developer-data-terms.html)
+#   python scripts/build_stop_index.py path/to/google_transit
+#
+# Feed numbers in the output are indexes into feeds.FEED_URLS
+import argparse
+import csv
+import json
+import os
+
+# Which realtime feed each route shows up in. Indexes line up with feeds.FEED_URLS
+ROUTE_FEEDS = {
+    '1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '5X': 0, '6': 0, '6X': 0, 'GS': 0,
+    'L': 1,
+    'N': 2, 'Q': 2, 'R': 2, 'W': 2,
+    'B': 3, 'D': 3, 'F': 3, 'FX': 3, 'M': 3,
+    'A': 4, 'C': 4, 'E': 4, 'H': 4, 'FS': 4,
+    '7': 5, '7X': 5,
+    'J': 6, 'Z': 6,
+    'G': 7,
+}
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'stop_feeds.json')
+
+
+def read_csv(gtfs_dir, name):
+    with open(os.path.join(gtfs_dir, name), newline='', encoding='utf-8-sig') as f:
+        yield from csv.DictReader(f)
+
+
+def build_index(gtfs_dir):
+    # Platforms (D19N, D19S) roll up to their parent station (D19) since that's what devices ask for
+    parents = {}
+    for stop in read_csv(gtfs_dir, 'stops.txt'):
+        parents[stop['stop_id']] = stop.get('parent_station') or stop['stop_id']
+
+    # stop_times.txt only knows trip ids so we need trips.txt to get back to a route
+    trip_routes = {trip['trip_id']: trip['route_id'] for trip in read_csv(gtfs_dir, 'trips.txt')}
+
+    stops = {}
+    unknown_routes = set()
+    for stop_time in read_csv(gtfs_dir, 'stop_times.txt'):
+        route_id = trip_routes.get(stop_time['trip_id'])
+        if route_id not in ROUTE_FEEDS:
+            unknown_routes.add(route_id)
+            continue
+
+        stop_id = parents.get(stop_time['stop_id'], stop_time['stop_id'])
+        stops.setdefault(stop_id, set()).add(ROUTE_FEEDS[route_id])
+
+    return {
+        'stops': {stop_id: sorted(feed_ids) for stop_id, feed_ids in sorted(stops.items())},
+    }, unknown_routes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the stop -> feed index from static GTFS')
+    parser.add_argument('gtfs_dir', help='Directory holding stops.txt, trips.txt and stop_times.txt')
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    index, unknown_routes = build_index(args.gtfs_dir)
+    with open(args.output, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+
+    print('Wrote {} stops to {}'.format(len(index['stops']), args.output))
+    if unknown_routes:
+        print('Skipped routes with no realtime feed: {}'.format(', '.join(sorted(filter(None, unknown_routes)))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# Build stop_feeds.json from stops.txt alone, for when only the station list is to hand and there's no stop_times.txt
+# to run build_stop_index.py against. This is how the checked in stop_feeds.json was made, from the copy of the MTA's
+# stops.txt bundled with nyct-gtfs 2.1.0 (nyct_gtfs/gtfs_static/stops.txt in its wheel):
+#   python scripts/build_stop_index_from_segments.py path/to/stops.txt
+#
+# Each station gets the feeds of every route that stops anywhere on its stretch of line at any time of day, so it errs
+# toward extra feeds - a missing feed would drop trains, an extra one only costs a download
+import argparse
+import csv
+import json
+
+from build_stop_index import OUTPUT_PATH, ROUTE_FEEDS
+
+# (stop_id prefix, first number, last number, routes) - stations are numbered in order along each line
+SEGMENTS = [
+    ('1', 1, 99, '1 2 3'), ('2', 1, 99, '2 5'), ('3', 1, 99, '3'), ('4', 1, 99, '4 5'), ('5', 1, 99, '5'),
+    ('6', 1, 99, '6 6X'), ('7', 1, 99, '7 7X'), ('9', 1, 99, 'GS'),
+    ('A', 2, 11, 'A C'), ('A', 12, 12, 'A B C D'), ('A', 14, 22, 'A B C'), ('A', 24, 24, 'A B C D'),
+    ('A', 25, 40, 'A C E'), ('A', 41, 41, 'A C F'), ('A', 42, 42, 'A C G'), ('A', 43, 65, 'A C'),
+    ('B', 4, 6, 'F'), ('B', 8, 8, 'F Q'), ('B', 10, 10, 'F'), ('B', 12, 23, 'D'),
+    ('D', 1, 13, 'B D'), ('D', 14, 14, 'B D E'), ('D', 15, 22, 'B D F M'), ('D', 24, 25, 'B Q'),
+    ('D', 26, 26, 'B Q FS'), ('D', 27, 40, 'B Q'), ('D', 41, 42, 'Q'), ('D', 43, 43, 'D F N Q'),
+    ('E', 1, 1, 'E'),
+    ('F', 1, 7, 'E F'), ('F', 9, 12, 'E M'), ('F', 14, 18, 'F'), ('F', 20, 27, 'F G'), ('F', 29, 39, 'F FX'),
+    ('G', 5, 6, 'E J Z'), ('G', 7, 7, 'E'), ('G', 8, 21, 'E F M R'), ('G', 22, 36, 'G'),
+    ('H', 1, 19, 'A H'),
+    ('J', 1, 99, 'J Z'),
+    ('L', 1, 99, 'L'),
+    ('M', 1, 10, 'M'), ('M', 11, 23, 'J M Z'),
+    ('N', 1, 99, 'N'),
+    ('Q', 1, 5, 'N Q'),
+    ('R', 1, 9, 'N W'), ('R', 11, 27, 'N Q R W'), ('R', 28, 29, 'N R'), ('R', 30, 30, 'B N Q R'),
+    ('R', 31, 40, 'D N R'), ('R', 41, 41, 'N R'), ('R', 42, 45, 'R'),
+    ('S', 1, 4, 'FS'),
+]
+
+
+def routes_for(stop_id):
+    prefix, number = stop_id[0], int(stop_id[1:])
+    for segment_prefix, first, last, routes in SEGMENTS:
+        if prefix == segment_prefix and first <= number <= last:
+            return routes.split()
+    return None
+
+
+def build_index(stops_path):
+    stops = {}
+    unmapped = []
+    with open(stops_path, newline='', encoding='utf-8-sig') as f:
+        for stop in csv.DictReader(f):
+            # Only parent stations - platforms roll up to them since that's what devices ask for
+            if stop['location_type'] != '1':
+                continue
+
+            routes = routes_for(stop['stop_id'])
+            if routes is None:
+                unmapped.append(stop['stop_id'])
+                continue
+            stops[stop['stop_id']] = sorted({ROUTE_FEEDS[route] for route in routes})
+
+    return {'stops': dict(sorted(stops.items()))}, unmapped
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the stop -> feed index from stops.txt and known line segments')
+    parser.add_argument('stops_path', help='The static GTFS stops.txt')
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    index, unmapped = build_index(args.stops_path)
+    with open(args.output, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+
+    print('Wrote {} stops to {}'.format(len(index['stops']), args.output))
+    if unmapped:
+        print('Skipped stations on no known segment: {}'.format(', '.join(unmapped)))
+
+
+if __name__ == '__main__':
+    main()
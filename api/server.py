@@ -0,0 +1,150 @@
+# Self-hosted alternative to the Lambda deployment.
+#
+# A background asyncio poller keeps every needed feed hot in memory, refreshing each one on its own schedule as the
+# MTA publishes, so requests are answered purely from memory by the same code handler.py runs on Lambda:
+#   MTA_API_KEY=... python server.py --port 8080 --stops D19,L02
+#
+# --feed-base-url points the poller somewhere other than the MTA, e.g. bench/stub_server.py.
+# GET /_stats reports connection reuse to the feed endpoint
+import argparse
+import asyncio
+import base64
+import http.server
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.parse
+
+import feeds
+import handler
+import metrics
+
+logger = logging.getLogger(__name__)
+
+MTA_FEED_BASE_URL = 'https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/'
+
+# Bounds on how long the poller waits between attempts at one feed
+POLL_MIN_DELAY = 2
+POLL_MAX_DELAY = 60
+# Spread out refreshes so every feed doesn't hit the MTA in the same instant
+POLL_JITTER = 1
+
+
+# Refresh one feed forever. Each feed is due FEED_CACHE_TTL after its own header timestamp, failures back off
+# exponentially up to POLL_MAX_DELAY while the last good snapshot keeps being served.
+# on_refresh(url) is called (on a worker thread) after every successful refresh, e.g. publisher.py writing files
+async def poll_feed(url, api_key, on_refresh=None):
+    failures = 0
+    while True:
+        try:
+            await asyncio.to_thread(feeds.refresh_feed, url, api_key)
+            failures = 0
+            delay = feeds.cache_expires_at(url) - time.time()
+        except Exception:
+            logger.exception("Couldn't refresh feed %s", url)
+            failures += 1
+            delay = POLL_MIN_DELAY * 2 ** failures
+        else:
+            if on_refresh is not None:
+                try:
+                    await asyncio.to_thread(on_refresh, url)
+                except Exception:
+                    logger.exception("Couldn't handle refresh of feed %s", url)
+
+        delay = min(max(delay, POLL_MIN_DELAY), POLL_MAX_DELAY)
+        await asyncio.sleep(delay + random.uniform(0, POLL_JITTER))
+
+
+async def poll_feeds(urls, api_key, on_refresh=None):
+    await asyncio.gather(*(poll_feed(url, api_key, on_refresh) for url in urls))
+
+
+# Translate a plain HTTP request into the API Gateway proxy event handler.py expects
+def _lambda_event(path, headers):
+    url = urllib.parse.urlsplit(path)
+    event = {
+        'path': url.path,
+        'headers': dict(headers),
+        'queryStringParameters': {key: values[-1] for key, values in urllib.parse.parse_qs(url.query).items()},
+    }
+    if url.path == '/batch':
+        event['resource'] = '/batch'
+        return handler.get_batch_departures, event
+
+    event['resource'] = '/{stop_id}'
+    return handler.get_departures, event
+
+
+class DeparturesRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes, so without this keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.path == '/_stats':
+            response = {
+                'statusCode': 200,
+                'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps({'connections': feeds.connection_stats()}),
+            }
+        else:
+            function, event = _lambda_event(self.path, self.headers.items())
+            response = function(event, None)
+
+        body = response.get('body') or ''
+        body = base64.b64decode(body) if response.get('isBase64Encoded') else body.encode()
+
+        self.send_response(response['statusCode'])
+        for name, value in (response.get('headers') or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def serve(host, port):
+    server = http.server.ThreadingHTTPServer((host, port), DeparturesRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info('Serving departures on http://%s:%s', *server.server_address[:2])
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve departures from feeds kept hot in memory')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--stops', help='Comma separated stops to keep hot. Defaults to every feed')
+    parser.add_argument('--feed-base-url', help='Fetch feeds from here instead of the MTA')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s %(message)s')
+
+    api_key = os.getenv('MTA_API_KEY')
+    if not api_key:
+        parser.error("Error couldn't get API key from env")
+
+    if args.feed_base_url:
+        feeds.FEED_URLS[:] = [url.replace(MTA_FEED_BASE_URL, args.feed_base_url) for url in feeds.FEED_URLS]
+
+    urls = list(feeds.FEED_URLS)
+    if args.stops:
+        urls = list(dict.fromkeys(url for stop_id in args.stops.split(',') for url in feeds.feed_urls_for_stop(stop_id)))
+
+    # CloudWatch isn't reading stdout here, so metrics go out as plain JSON log lines
+    metrics.sink = metrics.log_sink
+
+    # The poller owns freshness of these from here on - requests never wait on the MTA for a feed it's already polling
+    feeds.polled_urls.update(urls)
+    serve(args.host, args.port)
+    asyncio.run(poll_feeds(urls, api_key))
+
+
+if __name__ == '__main__':
+    main()
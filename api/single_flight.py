@@ -0,0 +1,48 @@
+# Per-key request coalescing.
+#
+# The first caller for a key runs the call, and anyone else asking for the same key while it's still running waits
+# for it and gets the same result (or exception) instead of starting their own. Boards all poll on the same cadence,
+# so without this a burst of requests for one stop would each download and parse the same feed.
+import threading
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    # Call fn(*args) unless a call for key is already in flight, in which case wait for that one.
+    # Returns (result, shared) - shared is True when the result came from someone else's call
+    def do(self, key, fn, *args):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
@@ -0,0 +1,106 @@
+# Parity between gtfs_fast and gtfs_realtime_pb2: both must build the same departure index from the same bytes.
+#   cd api && python -m unittest discover tests
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench'))
+
+import departures  # noqa: E402
+import fixtures  # noqa: E402
+import gtfs_fast  # noqa: E402
+import gtfs_realtime_pb2  # noqa: E402
+
+
+def parse_with_protobuf(data):
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.ParseFromString(data)
+    return feed
+
+
+# platform -> [(departs_at, route_id), ...]. Trains leaving the same second can come out in either order, since each
+# path numbers routes as it first meets them, so each platform's departures are compared sorted
+def flatten(index):
+    return {
+        platform: sorted((index.times[i], index.route_ids[index.routes[i]]) for i in range(start, end))
+        for platform, (start, end) in index.platforms.items()
+    }
+
+
+def add_trip(feed, route_id, stop_times):
+    trip_update = feed.entity.add(id=str(len(feed.entity))).trip_update
+    trip_update.trip.route_id = route_id
+    for stop_id, arrival, departure in stop_times:
+        stop_time_update = trip_update.stop_time_update.add()
+        if stop_id is not None:
+            stop_time_update.stop_id = stop_id
+        if arrival is not None:
+            stop_time_update.arrival.time = arrival
+        if departure is not None:
+            stop_time_update.departure.time = departure
+
+
+class ParityTest(unittest.TestCase):
+    def assertParity(self, data):
+        expected = parse_with_protobuf(data)
+        actual = gtfs_fast.decode(data)
+
+        self.assertEqual(actual.header.timestamp, expected.header.timestamp)
+        self.assertEqual(actual.entity_count, len(expected.entity))
+        self.assertEqual(flatten(departures.build_index(actual)), flatten(departures.build_index(expected)))
+
+    def test_fixtures(self):
+        fixtures.ensure_fixtures()
+        for size in fixtures.SIZES:
+            for name in fixtures.FEED_NAMES:
+                with self.subTest(size=size, feed=name):
+                    with open(fixtures.fixture_path(size, name), 'rb') as f:
+                        self.assertParity(f.read())
+
+    def test_edge_cases(self):
+        feed = gtfs_realtime_pb2.FeedMessage()
+        feed.header.gtfs_realtime_version = '1.0'
+        feed.header.timestamp = 1700000000
+        add_trip(feed, 'A', [
+            # Terminal with only an arrival
+            ('A02N', 1700000060, None),
+            ('A03N', 1700000120, 1700000150),
+            # No usable time
+            ('A04N', None, None),
+            ('A05N', -5, None),
+            # No stop_id at all
+            (None, 1700000300, 1700000300),
+            ('A06N', 1 << 40, 1 << 40),
+        ])
+        add_trip(feed, '', [('D19S', None, 1700000400)])
+        # Same second, different routes
+        add_trip(feed, 'F', [('D19S', None, 1700000400)])
+        feed.entity.add(id='vehicle').vehicle.trip.route_id = 'F'
+        feed.entity.add(id='alert').alert.header_text.translation.add(text='Delays')
+        feed.entity.add(id='empty trip').trip_update.trip.route_id = 'M'
+
+        # Unknown varint, fixed64 and fixed32 fields are stepped over
+        unknown = bytes([12 << 3 | 0, 0x96, 0x01, 13 << 3 | 1]) + bytes(8) + bytes([14 << 3 | 5]) + bytes(4)
+        self.assertParity(feed.SerializeToString() + unknown)
+
+    def test_stop_filter(self):
+        fixtures.ensure_fixtures()
+        with open(fixtures.fixture_path('rush', 'gtfs-bdfm'), 'rb') as f:
+            data = f.read()
+
+        stop_ids = {'D19', 'F14'}
+        expected = [row for row in gtfs_fast.decode(data).rows if departures.split_stop_id(row[0])[0] in stop_ids]
+        self.assertTrue(expected)
+        self.assertEqual(gtfs_fast.decode(data, stop_ids).rows, expected)
+
+    def test_truncated(self):
+        feed = gtfs_realtime_pb2.FeedMessage()
+        feed.header.gtfs_realtime_version = '1.0'
+        add_trip(feed, 'A', [('A02N', None, 1700000060)])
+        with self.assertRaises((ValueError, IndexError)):
+            gtfs_fast.decode(feed.SerializeToString()[:-3])
+
+
+if __name__ == '__main__':
+    unittest.main()
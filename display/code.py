@@ -1,5 +1,9 @@
+# Needs CircuitPython 8 or 9. lib/ has every library this imports, as .py sources built for those versions
+import asyncio
+import json
+import rtc
+import struct
 import time
-import adafruit_datetime
 
 import adafruit_display_text.label
 from adafruit_bitmap_font import bitmap_font
@@ -57,24 +61,362 @@ display = framebufferio.FramebufferDisplay(matrix)
 # ------------------------------------------------------------------------------------------------------
 
 # CONSTANTS ----------------------------------------
-# How many times to query the API (seconds)
-API_REFRESH_DELAY = 30
+# How many times to query the API (seconds). The board counts down on its own clock between refreshes, so this only
+# needs to be short enough to catch delays and new trains
+API_REFRESH_DELAY = 120
+# How long each slide stays up (seconds)
+SLIDE_DELAY = 10
+# How often the matrix is redrawn and pushed MQTT messages are checked for (seconds)
+RENDER_DELAY = 0.5
+MQTT_POLL_DELAY = 1
 # My station: 14th and 6
 STOP_ID = 'D19'
+# Where departures come from. Point it at the files api/publisher.py writes instead to skip the Lambda entirely,
+# e.g. 'https://example.com/departures/{}.bin' - static .bin files are always the compact payload
+DEPARTURES_URL = 'https://bwpddnvln1.execute-api.us-east-1.amazonaws.com/dev/{}?limit={}'
+
+
+# Compact departures payload (see api/payload.py) - far cheaper to decode on the board than JSON. Version 2 carries
+# absolute departure times, older deployments still answer with version 1
+PAYLOAD_CONTENT_TYPE = 'application/vnd.mta-departures'
+PAYLOAD_VERSION = 2
+# Copy of ROUTE_IDS in api/payload.py - routes are sent as an index into this table
+ROUTE_IDS = (
+    '1', '2', '3', '4', '5', '6', '7', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'J', 'L', 'M', 'N', 'Q', 'R', 'W', 'Z',
+    'GS', 'FS', 'H', 'SI', '5X', '6X', '7X', 'FX',
+)
+UNKNOWN_ROUTE_ID = '?'
+# The board never shows more than this many trains per direction
+MAX_DEPARTURES = 3
+# but keeps a few more so there's still something to show once those leave, with refreshes minutes apart
+DEPARTURE_BUFFER = 6
+
+# Departures are decoded into these preallocated dicts in place so a refresh doesn't allocate new ones
+departure_slots = {
+    'uptown': [{'route_id': '', 'departs_at': 0} for _ in range(DEPARTURE_BUFFER)],
+    'downtown': [{'route_id': '', 'departs_at': 0} for _ in range(DEPARTURE_BUFFER)],
+}
+departure_times = {
+    'uptown': [],
+    'downtown': [],
+}
+
+
+# departs_in is rounded down to whole minutes, so the train really leaves anywhere in the minute after it. Aim for the
+# middle of that minute, or a "0 min" train would count as gone half a second later and every other one would show
+# up to a minute early
+def minutes_to_departs_at(server_time, departs_in):
+    return server_time + departs_in * 60 + 30
+
+
+# Version 1 only has whole minutes from server_time, version 2 the departure's epoch time
+def decode_departures(data, version, offset, count, key, server_time):
+    size = 2 if version == 1 else 5
+    slots = departure_slots[key]
+    departures = departure_times[key]
+    del departures[:]
+    for i in range(min(count, DEPARTURE_BUFFER)):
+        route = data[offset + i * size]
+        slot = slots[i]
+        slot['route_id'] = ROUTE_IDS[route] if route < len(ROUTE_IDS) else UNKNOWN_ROUTE_ID
+        if version == 1:
+            slot['departs_at'] = minutes_to_departs_at(server_time, data[offset + i * size + 1])
+        else:
+            slot['departs_at'] = struct.unpack_from('>I', data, offset + i * size + 1)[0]
+        departures.append(slot)
 
+    return offset + count * size
 
-# Get departure times from my API
-def get_departure_times():
-    resp = wifi.get(
-        'https://bwpddnvln1.execute-api.us-east-1.amazonaws.com/dev/{}'.format(STOP_ID),
-        headers={"x-api-key": secrets['ryan_personal_api_key']}
-    )
-    d = resp.json()
-    resp.close()
 
+# When the API built the payload, if it says (version 1 doesn't)
+def payload_server_time(data):
+    if data[0] == 2:
+        return struct.unpack_from('>I', data, 3)[0]
+    return None
+
+
+def decode_departure_times(data):
+    version = data[0]
+    if version == 1:
+        offset = 3
+        server_time = time.time()
+    elif version == 2:
+        offset = 7
+        server_time = payload_server_time(data)
+    else:
+        raise ValueError('Unsupported departures payload version {}'.format(version))
+
+    offset = decode_departures(data, version, offset, data[1], 'uptown', server_time)
+    decode_departures(data, version, offset, data[2], 'downtown', server_time)
+    return departure_times
+
+
+# Older deployments' JSON only has departs_in, so work out departs_at from it
+def json_departure_times(d):
+    server_time = d.get('server_time') or time.time()
+
+    for key in ('uptown', 'downtown'):
+        for departure in d.get(key, []):
+            if 'departs_at' not in departure:
+                departure['departs_at'] = minutes_to_departs_at(server_time, departure['departs_in'])
     return d
 
 
+# How far the board's clock can drift from the API's before it's reset, and how often it's checked against the ESP32's
+# network time (seconds)
+CLOCK_TOLERANCE = 5
+CLOCK_SYNC_DELAY = 60 * 60
+
+
+# Countdowns are worked out on the board from departs_at, so its clock has to be right. Set it from the ESP32's network
+# time, and from the server_time of live API responses whenever that disagrees by more than CLOCK_TOLERANCE seconds.
+# The API stamps server_time somewhere during the request, so by the time the response is in the real time is between
+# server_time and server_time plus the round trip. The clock is only moved when it's outside that window, and then only
+# as far as the nearest edge
+def sync_clock(server_time=None, round_trip=0):
+    if server_time is None:
+        try:
+            server_time = esp.get_time()[0]
+        except (ValueError, OSError) as e:
+            print('Couldn\'t get the time from the ESP32:', e)
+            return
+
+    now = time.time()
+    if now < server_time - CLOCK_TOLERANCE:
+        rtc.RTC().datetime = time.localtime(server_time)
+    elif now > server_time + round_trip + CLOCK_TOLERANCE:
+        rtc.RTC().datetime = time.localtime(server_time + round_trip)
+
+
+# ETag of the last departures we got, sent back so the API can answer 304 when nothing changed
+last_etag = None
+
+# How long a request gets before it's abandoned, and how often it checks on the ESP32 in the meantime (seconds)
+HTTP_TIMEOUT = 30
+HTTP_POLL_DELAY = 0.1
+HTTP_READ_SIZE = 1024
+
+
+# GET url through the ESP32 one step at a time, yielding to the other tasks while the server works out its answer and
+# while the response trickles in. Opening the socket still blocks: the ESP32 firmware connects, and for https does the
+# whole TLS handshake, before socket_open returns. Returns (status, headers, body) with header names lower case
+async def http_get(url, headers):
+    if not esp.is_connected:
+        wifi.connect()
+
+    scheme, _, host, path = url.split('/', 3)
+    port, mode = (443, esp.TLS_MODE) if scheme == 'https:' else (80, esp.TCP_MODE)
+    request = 'GET /{} HTTP/1.1\r\nHost: {}\r\nConnection: close\r\n'.format(path, host)
+    for name, value in headers.items():
+        request += '{}: {}\r\n'.format(name, value)
+
+    socket_num = esp.get_socket()
+    deadline = time.monotonic() + HTTP_TIMEOUT
+    response = bytearray()
+    try:
+        esp.socket_open(socket_num, host, port, mode)
+        while not esp.socket_connected(socket_num):
+            if time.monotonic() > deadline:
+                raise OSError('Timed out connecting to {}'.format(host))
+            await asyncio.sleep(HTTP_POLL_DELAY)
+        esp.socket_write(socket_num, (request + '\r\n').encode())
+
+        # Connection: close, so the response is everything up to the server hanging up
+        while True:
+            available = esp.socket_available(socket_num)
+            if available:
+                response.extend(esp.socket_read(socket_num, min(available, HTTP_READ_SIZE)))
+            elif not esp.socket_connected(socket_num):
+                break
+            elif time.monotonic() > deadline:
+                raise OSError('Timed out reading from {}'.format(host))
+            await asyncio.sleep(0 if available else HTTP_POLL_DELAY)
+    finally:
+        esp.socket_close(socket_num)
+
+    head, _, body = bytes(response).partition(b'\r\n\r\n')
+    lines = str(head, 'utf-8').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    response_headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        response_headers[name.strip().lower()] = value.strip()
+
+    if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+        body = dechunk(body)
+    return status, response_headers, body
+
+
+# Join up a Transfer-Encoding: chunked body
+def dechunk(data):
+    body = bytearray()
+    offset = 0
+    while True:
+        line_end = data.index(b'\r\n', offset)
+        size = int(str(data[offset:line_end], 'utf-8').split(';')[0], 16)
+        if not size:
+            return bytes(body)
+        body.extend(data[line_end + 2:line_end + 2 + size])
+        offset = line_end + 4 + size
+
+
+# Get departure times from my API. Returns None if they haven't changed since the last call
+async def get_departure_times():
+    global last_etag
+
+    headers = {
+        "x-api-key": secrets['ryan_personal_api_key'],
+        "Accept": '{}; version={}'.format(PAYLOAD_CONTENT_TYPE, PAYLOAD_VERSION)
+    }
+    if last_etag:
+        headers["If-None-Match"] = last_etag
+
+    # Only ask for as many trains as the board will keep
+    url = DEPARTURES_URL.format(STOP_ID, DEPARTURE_BUFFER)
+    sent_at = time.monotonic()
+    status, response_headers, body = await http_get(url, headers)
+    round_trip = time.monotonic() - sent_at
+    if status == 304:
+        return None
+    if status != 200:
+        raise OSError('{} from the departures API'.format(status))
+
+    last_etag = response_headers.get('etag')
+    # Older deployments only speak JSON
+    if response_headers.get('content-type', '').startswith(PAYLOAD_CONTENT_TYPE) or url.endswith('.bin'):
+        d = decode_departure_times(body)
+        server_time = payload_server_time(body)
+    else:
+        d = json_departure_times(json.loads(body))
+        server_time = d.get('server_time')
+
+    # Static .bin files carry the server_time of whenever the publisher wrote them, so only the API's is trusted
+    if server_time and not url.endswith('.bin'):
+        sync_clock(server_time, round_trip)
+
+    return d
+
+
+# Sprite sheet from scripts/build_sprites.py with every route bullet and countdown pre-rendered, so drawing a slide
+# is just setting two TileGrid indexes. These mirror the layout constants there
+SPRITES_PATH = "/sprites.bmp"
+SPRITE_BULLET_SIZE = 12
+SPRITE_TEXT_WIDTH = 36
+SPRITE_TILE_HEIGHT = 12
+# Bullets are in ROUTE_IDS order with one for unknown routes after them. Countdown tiles (counted in
+# SPRITE_TEXT_WIDTH wide tiles) start at SPRITE_TEXT_TILE_BASE, from "Now" up to SPRITE_MAX_MINUTES
+SPRITE_TEXT_TILE_BASE = 12
+SPRITE_MAX_MINUTES = 60
+
+ROUTE_TILES = {route_id: i for i, route_id in enumerate(ROUTE_IDS)}
+UNKNOWN_ROUTE_TILE = len(ROUTE_IDS)
+
+
+# Read an uncompressed 8 bit BMP into a displayio Bitmap and Palette held in RAM. Only runs once, at boot
+def load_sprite_sheet(path):
+    with open(path, 'rb') as f:
+        header = f.read(54)
+        data_offset = struct.unpack_from('<I', header, 10)[0]
+        width, height = struct.unpack_from('<ii', header, 18)
+        colors = struct.unpack_from('<I', header, 46)[0]
+
+        palette = displayio.Palette(colors)
+        for i in range(colors):
+            blue, green, red, _ = f.read(4)
+            palette[i] = red << 16 | green << 8 | blue
+
+        bitmap = displayio.Bitmap(width, height, colors)
+        # Rows are stored bottom up, each padded to 4 bytes
+        row_size = (width + 3) & ~3
+        for y in range(height):
+            f.seek(data_offset + (height - 1 - y) * row_size)
+            row = f.read(width)
+            for x in range(width):
+                bitmap[x, y] = row[x]
+
+    return bitmap, palette
+
+
+# Have departures pushed over MQTT (see api/publisher.py --mqtt-broker) instead of polling, whenever secrets has an
+# 'mqtt_broker'. adafruit_minimqtt (7.2 or later, for binary payloads) is in lib/
+MQTT_TOPIC = 'mta/departures/{}'.format(STOP_ID)
+# How long each MQTT poll waits for a message to start arriving (seconds). minimqtt's default of 1 second would hold
+# up every other task for that long whenever nothing was pushed
+MQTT_SOCKET_TIMEOUT = 0.05
+
+# Departures from the last MQTT message, waiting for the main loop to pick them up
+pushed_departure_times = None
+
+
+# Retained messages keep the server_time they were published with, which can be hours old, so these never set the clock
+def on_departures_message(client, topic, message):
+    global pushed_departure_times
+    pushed_departure_times = decode_departure_times(message)
+
+
+# Returns a subscribed MQTT client, or None to keep polling
+def connect_mqtt():
+    if 'mqtt_broker' not in secrets:
+        return None
+
+    import adafruit_esp32spi.adafruit_esp32spi_socket as socket
+    import adafruit_minimqtt.adafruit_minimqtt as MQTT
+
+    MQTT.set_socket(socket, esp)
+    client = MQTT.MQTT(
+        broker=secrets['mqtt_broker'],
+        port=secrets.get('mqtt_port', 1883),
+        username=secrets.get('mqtt_username'),
+        password=secrets.get('mqtt_password'),
+        socket_timeout=MQTT_SOCKET_TIMEOUT,
+        use_binary_mode=True
+    )
+    client.on_message = on_departures_message
+    client.connect()
+    # Departures are retained, so the current ones arrive straight after subscribing
+    client.subscribe(MQTT_TOPIC)
+    return client
+
+
+# One half of the board. Every slide is its own displayio.Group, built once and kept in the row's group for good - only
+# the current one is visible, so advancing is flipping two hidden flags rather than rebuilding the board
+class SlideRow:
+    def __init__(self, slides, empty_slide):
+        self.slides = slides
+        self.empty_slide = empty_slide
+        # How many slides are in use and which of them is showing
+        self.count = 0
+        self.current = 0
+
+        self.group = displayio.Group()
+        for slide in slides:
+            slide.hidden = True
+            self.group.append(slide)
+        self.group.append(empty_slide)
+
+    # Show the first count slides in turn, or the empty slide if there are none. Rotation carries on where it was
+    # while the count stays the same, so countdowns ticking over don't keep jumping back to the first train
+    def show(self, count):
+        if count == self.count:
+            return
+
+        for slide in self.slides:
+            slide.hidden = True
+        self.count = count
+        self.current = 0
+        if count:
+            self.slides[0].hidden = False
+        self.empty_slide.hidden = count > 0
+
+    def advance(self):
+        if self.count < 2:
+            return
+
+        self.slides[self.current].hidden = True
+        self.current = (self.current + 1) % self.count
+        self.slides[self.current].hidden = False
+
+
 class TimeBoard:
     # X-Positions
     TRAIN_SYMBOL_X_POS = 9
@@ -85,15 +427,16 @@ class TimeBoard:
     BOTTOM_HALF_Y_POS = 24
 
     # Style
-    SYMBOL_FONT = bitmap_font.load_font("/siji_mta.bdf")
+    # Subset of siji_mta.bdf with only SYMBOL_GLYPHS in it, see scripts/subset_font.py
+    SYMBOL_FONT = bitmap_font.load_font("/siji_mta.pcf")
+    # Uptown and downtown arrows
+    SYMBOL_GLYPHS = '\uE12b\uE12c'
     TEXT_COLOR = 0x222222
-    TRAIN_COLOR_ORANGE_FM = 0xcc461b
+    SPRITES, SPRITE_PALETTE = load_sprite_sheet(SPRITES_PATH)
 
     def __init__(self, departure_times):
-        # 2D List to hold "slides" - A slide is a self-contained group of layers showing the departure time including icon, time, and arrow
-        # The first item in the array is always displayed so to rotate the display, we roatate the array
-        self.uptown_layers = []
-        self.downtown_layers = []
+        # Load every glyph up front in one go rather than from flash the first time each is drawn
+        self.SYMBOL_FONT.load_glyphs(self.SYMBOL_GLYPHS)
 
         # Static layers don't rotate - Right now just the Uptown/Downtown arrows
         arrow_x_pos = -2
@@ -114,111 +457,171 @@ class TimeBoard:
             ),
         ]
 
-        # The parent group for the actual displayio layers that make up the board
+        # Every slide the board ever shows is made once, here. Refreshes only change which tiles they show, so
+        # a refresh allocates next to nothing and doesn't fragment the heap into GC pauses that freeze the matrix
+        self.uptown = SlideRow(
+            [self.make_slide(self.TOP_HALF_Y_POS) for _ in range(MAX_DEPARTURES)],
+            self.make_empty_slide(self.TOP_HALF_Y_POS)
+        )
+        self.downtown = SlideRow(
+            [self.make_slide(self.BOTTOM_HALF_Y_POS) for _ in range(MAX_DEPARTURES)],
+            self.make_empty_slide(self.BOTTOM_HALF_Y_POS)
+        )
+
+        # The parent group for the actual displayio layers that make up the board. Nothing is added to or removed from
+        # it after this
         self.time_board_group = displayio.Group()
+        for layer in self.static_layers:
+            self.time_board_group.append(layer)
+        self.time_board_group.append(self.uptown.group)
+        self.time_board_group.append(self.downtown.group)
 
+        # What the rows were last filled from, so countdowns can tick down between refreshes
+        self.departure_times = None
         self.update_departure_times(departure_times)
 
     # Make an "empty slide" for use when there are no trains
     def make_empty_slide(self, y_val):
-        return [
-            adafruit_display_text.label.Label(
-                terminalio.FONT,
-                color=self.TEXT_COLOR,
-                text="No trains",
-                anchor_point=(1.0, 0.5),
-                anchored_position=(self.RIGHT_ALIGN_X_POS, y_val - 1)
-            )
-        ]
-
-    def make_uptown_slide(self, departure):
-        return self.make_slide(departure, self.TOP_HALF_Y_POS)
-
-    def make_downtown_slide(self, departure):
-        return self.make_slide(departure, self.BOTTOM_HALF_Y_POS)
+        slide = displayio.Group()
+        slide.append(adafruit_display_text.label.Label(
+            terminalio.FONT,
+            color=self.TEXT_COLOR,
+            text="No trains",
+            anchor_point=(1.0, 0.5),
+            anchored_position=(self.RIGHT_ALIGN_X_POS, y_val - 1)
+        ))
+        return slide
 
-    # Make a "slide" - The icon and text associated with a departure time
-    # Slide is list, not displayio.Group because displayio.Group has issues
-    def make_slide(self, departure, y_val):
-        slide = []
+    # Make a "slide" - The bullet and countdown associated with a departure time, both cut from the sprite sheet.
+    # Blank until set_slide fills it in
+    def make_slide(self, y_val):
+        slide = displayio.Group()
         # Train Symbol
-        slide.append(adafruit_display_text.label.Label(
-            self.SYMBOL_FONT,
-            color=self.TRAIN_COLOR_ORANGE_FM,
-            text=departure['route_id'],
+        slide.append(displayio.TileGrid(
+            self.SPRITES,
+            pixel_shader=self.SPRITE_PALETTE,
+            tile_width=SPRITE_BULLET_SIZE,
+            tile_height=SPRITE_TILE_HEIGHT,
             x=self.TRAIN_SYMBOL_X_POS,
-            y=y_val
+            y=y_val - SPRITE_TILE_HEIGHT // 2
+        ))
+        slide.append(displayio.TileGrid(
+            self.SPRITES,
+            pixel_shader=self.SPRITE_PALETTE,
+            tile_width=SPRITE_TEXT_WIDTH,
+            tile_height=SPRITE_TILE_HEIGHT,
+            x=self.RIGHT_ALIGN_X_POS - SPRITE_TEXT_WIDTH,
+            y=y_val - SPRITE_TILE_HEIGHT // 2 - 2
         ))
-
-        if departure['departs_in'] == 0:
-            slide.append(adafruit_display_text.label.Label(
-                terminalio.FONT,
-                color=0xaa0000,
-                text="Now",
-                anchor_point=(1.0, 0.5),
-                anchored_position=(self.RIGHT_ALIGN_X_POS, y_val - 2)
-            ))
-        else:
-            slide.append(adafruit_display_text.label.Label(
-                terminalio.FONT,
-                color=self.TEXT_COLOR,
-                text="{} Min".format(departure['departs_in']),
-                anchor_point=(1.0, 0.5),
-                anchored_position=(self.RIGHT_ALIGN_X_POS, y_val - 2)
-            ))
-
         return slide
 
-    # Re-create layer arrays with the new departure time information
-    def update_departure_times(self, departure_times):
-        # Reset
-        self.uptown_layers = []
-        self.downtown_layers = []
-
-        # Only create slides for the first 3 trains
-        for departure in departure_times['uptown'][:3]:
-            self.uptown_layers.append(self.make_uptown_slide(departure))
-        for departure in departure_times['downtown'][:3]:
-            self.downtown_layers.append(self.make_downtown_slide(departure))
-
-        if len(self.uptown_layers) == 0:
-            self.uptown_layers.append(self.make_empty_slide(self.TOP_HALF_Y_POS))
-        if len(self.downtown_layers) == 0:
-            self.downtown_layers.append(self.make_empty_slide(self.BOTTOM_HALF_Y_POS))
-
-    # Since slides are stored in array with the first slide being the one displayed, slide advancement is just an array rotation
-    def advance_slides(self):
-        self.uptown_layers = self.uptown_layers[1:] + self.uptown_layers[: 1]
-        self.downtown_layers = self.downtown_layers[1:] + self.downtown_layers[: 1]
-        self.refresh_board()
+    # Point a pooled slide at a departure, counting down from now
+    def set_slide(self, slide, departure, now):
+        slide[0][0] = ROUTE_TILES.get(departure['route_id'], UNKNOWN_ROUTE_TILE)
+        slide[1][0] = SPRITE_TEXT_TILE_BASE + min((departure['departs_at'] - now) // 60, SPRITE_MAX_MINUTES)
+
+    # Fill a row's slides in place, one per train the board can show that hasn't left yet. Setting a tile to the
+    # index it already has is a no-op, so calling this every render only redraws the countdowns that changed
+    def fill_row(self, row, departures, now):
+        count = 0
+        for departure in departures:
+            if count == len(row.slides):
+                break
+            if departure['departs_at'] < now:
+                continue
+
+            self.set_slide(row.slides[count], departure, now)
+            count += 1
+        row.show(count)
+
+    def update_countdowns(self):
+        now = time.time()
+        self.fill_row(self.uptown, self.departure_times['uptown'], now)
+        self.fill_row(self.downtown, self.departure_times['downtown'], now)
 
-    def refresh_board(self):
-        # Clear board by deleting every item in the group
-        # Incredibly hacky but CircuitPy throws a fit (ValueError: Layer already in a group) if this doesn't happen
-        for _ in range(len(self.time_board_group)):
-            del self.time_board_group[0]
+    def update_departure_times(self, departure_times):
+        self.departure_times = departure_times
+        self.update_countdowns()
 
-        for layer in self.static_layers:
-            self.time_board_group.append(layer)
-        for layer in self.uptown_layers[0]:
-            self.time_board_group.append(layer)
-        for layer in self.downtown_layers[0]:
-            self.time_board_group.append(layer)
+    def advance_slides(self):
+        self.uptown.advance()
+        self.downtown.advance()
 
     def get_board(self):
         return self.time_board_group
 
 
-time_board = TimeBoard(get_departure_times())
-last_refreshed = adafruit_datetime.datetime.now()
-while True:
-    # refresh the API every minute (or so)
-    if adafruit_datetime.datetime.now() - last_refreshed > adafruit_datetime.timedelta(0, API_REFRESH_DELAY, 0):
-        last_refreshed = adafruit_datetime.datetime.now()
-        time_board.update_departure_times(get_departure_times())
+# Each task runs on its own cadence, and a refresh yields while it waits on the network, so slides keep rotating and
+# counting down on time however long the API takes to answer
+async def poll_departures(time_board):
+    while True:
+        await asyncio.sleep(API_REFRESH_DELAY)
+        try:
+            latest_departure_times = await get_departure_times()
+        except Exception as e:
+            # Keep showing what we've got and try again next time round
+            print('Refresh failed:', e)
+            continue
+
+        # Nothing changed (304) so keep the slides we already have
+        if latest_departure_times is not None:
+            time_board.update_departure_times(latest_departure_times)
+
+
+async def receive_departures(time_board, mqtt_client):
+    global pushed_departure_times
+
+    while True:
+        # Returns within MQTT_SOCKET_TIMEOUT when nothing was pushed. Once a minute it also waits on a keep-alive ping
+        try:
+            mqtt_client.loop()
+        except Exception as e:
+            print('MQTT error, reconnecting:', e)
+            try:
+                mqtt_client.reconnect()
+            except Exception as e:
+                print('MQTT reconnect failed:', e)
+
+        if pushed_departure_times is not None:
+            time_board.update_departure_times(pushed_departure_times)
+            pushed_departure_times = None
+        await asyncio.sleep(MQTT_POLL_DELAY)
+
+
+async def rotate_slides(time_board):
+    while True:
+        await asyncio.sleep(SLIDE_DELAY)
+        time_board.advance_slides()
+
+
+# Countdowns are worked out from the board's own clock right before every frame, so they stay right however long it
+# has been since the last refresh
+async def render(time_board):
+    while True:
+        time_board.update_countdowns()
+        display.refresh(minimum_frames_per_second=0)
+        await asyncio.sleep(RENDER_DELAY)
+
+
+async def keep_clock():
+    while True:
+        await asyncio.sleep(CLOCK_SYNC_DELAY)
+        sync_clock()
+
+
+async def main():
+    # The ESP32 only knows the time once it's on the network
+    wifi.connect()
+    sync_clock()
+    mqtt_client = connect_mqtt()
+    time_board = TimeBoard(departure_times if mqtt_client else await get_departure_times())
+    display.root_group = time_board.get_board()
+    await asyncio.gather(
+        receive_departures(time_board, mqtt_client) if mqtt_client else poll_departures(time_board),
+        rotate_slides(time_board),
+        render(time_board),
+        keep_clock()
+    )
 
-    time_board.advance_slides()
-    display.show(time_board.get_board())
 
-    display.refresh(minimum_frames_per_second=0)
-    time.sleep(10)
+asyncio.run(main())
@@ -0,0 +1,177 @@
+# Build sprites.bmp - the sprite sheet TimeBoard draws every slide from.
+#
+# Route bullets and every countdown string ("Now", "1 Min" ... "60 Min") are rasterized here once, on the host, into
+# one palette-indexed BMP. The board then draws a slide by setting two TileGrid indexes instead of laying out font
+# glyphs on every refresh:
+#   python scripts/build_sprites.py
+#
+# Everything is drawn from the fonts the board used to draw with: bullets are the siji_mta.bdf glyphs recolored per
+# route (routes siji has no bullet for get their letter in the terminal font instead) and the countdowns are
+# terminalio's Terminus font, ter-u12n.bdf. Copy the resulting sprites.bmp to the root of CIRCUITPY next to code.py.
+# The layout constants below are mirrored in code.py, so rebuild and copy both whenever they (or payload.ROUTE_IDS)
+# change
+import argparse
+import os
+import struct
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DISPLAY_DIR = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(os.path.dirname(DISPLAY_DIR), 'api'))
+
+from payload import ROUTE_IDS  # noqa: E402
+from subset_font import read_bdf  # noqa: E402
+
+OUTPUT_PATH = os.path.join(DISPLAY_DIR, 'sprites.bmp')
+SYMBOL_FONT_PATH = os.path.join(DISPLAY_DIR, 'siji_mta.bdf')
+# The font CircuitPython builds terminalio.FONT from
+TEXT_FONT_PATH = os.path.join(SCRIPTS_DIR, 'ter-u12n.bdf')
+
+# Bullets are BULLET_SIZE square tiles, countdowns TEXT_WIDTH wide, both TILE_HEIGHT tall. The sheet is a whole number
+# of either across, so two TileGrids with different tile sizes can share it
+BULLET_SIZE = 12
+TEXT_WIDTH = 36
+TILE_HEIGHT = 12
+SHEET_WIDTH = 144
+# Countdowns run from 0 ("Now") to MAX_MINUTES
+MAX_MINUTES = 60
+
+BLACK = 0x000000
+TEXT_COLOR = 0x222222
+NOW_COLOR = 0xaa0000
+
+# MTA line colors. Orange is the shade code.py always drew the F and M in, which reads better on the matrix
+RED = 0xee352e
+GREEN = 0x00933c
+PURPLE = 0xb933ad
+BLUE = 0x0039a6
+ORANGE = 0xcc461b
+LIME = 0x6cbe45
+BROWN = 0x996633
+LIGHT_GRAY = 0xa7a9ac
+YELLOW = 0xfccc0a
+DARK_GRAY = 0x808183
+
+# route_id -> (character drawn, color). Express trains share their local's character and shuttles are all an S
+ROUTE_BULLETS = {
+    '1': ('1', RED), '2': ('2', RED), '3': ('3', RED),
+    '4': ('4', GREEN), '5': ('5', GREEN), '6': ('6', GREEN),
+    '7': ('7', PURPLE),
+    'A': ('A', BLUE), 'C': ('C', BLUE), 'E': ('E', BLUE),
+    'B': ('B', ORANGE), 'D': ('D', ORANGE), 'F': ('F', ORANGE), 'M': ('M', ORANGE),
+    'G': ('G', LIME),
+    'J': ('J', BROWN), 'Z': ('Z', BROWN),
+    'L': ('L', LIGHT_GRAY),
+    'N': ('N', YELLOW), 'Q': ('Q', YELLOW), 'R': ('R', YELLOW), 'W': ('W', YELLOW),
+    'GS': ('S', DARK_GRAY), 'FS': ('S', DARK_GRAY), 'H': ('S', DARK_GRAY),
+    'SI': ('S', BLUE),
+    '5X': ('5', GREEN), '6X': ('6', GREEN), '7X': ('7', PURPLE),
+    'FX': ('F', ORANGE),
+}
+# Drawn for anything not in payload.ROUTE_IDS, right after the last route
+UNKNOWN_BULLET = ('?', DARK_GRAY)
+
+
+def countdown_text(minutes):
+    return 'Now' if minutes == 0 else '{} Min'.format(minutes)
+
+
+class Font:
+    def __init__(self, path):
+        properties, glyphs = read_bdf(path)
+        self.ascent = properties['FONT_ASCENT']
+        self.glyphs = {glyph.encoding: glyph for glyph in glyphs}
+
+    def __contains__(self, char):
+        return ord(char) in self.glyphs
+
+    def width(self, text):
+        return sum(self.glyphs[ord(char)].dwidth for char in text)
+
+
+class Sheet:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.palette = [BLACK]
+        self.pixels = bytearray(width * height)
+
+    def color_index(self, color):
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+    def set(self, x, y, color):
+        self.pixels[y * self.width + x] = self.color_index(color)
+
+    # Draw text with its baseline at y, the way a font renderer would, in a single color
+    def draw_text(self, font, text, x, baseline, color):
+        for char in text:
+            glyph = font.glyphs[ord(char)]
+            width, height, x_offset, y_offset = glyph.bbx
+            top = baseline - y_offset - height
+            for row, bits in enumerate(glyph.rows):
+                for column in range(width):
+                    if bits[column // 8] >> (7 - column % 8) & 1:
+                        self.set(x + x_offset + column, top + row, color)
+            x += glyph.dwidth
+
+    # Palette indexed, uncompressed 8 bit BMP - what the board's loader expects
+    def to_bmp(self):
+        row_size = (self.width + 3) & ~3
+        palette = b''.join(struct.pack('<BBBB', color & 0xff, color >> 8 & 0xff, color >> 16, 0) for color in self.palette)
+        data_offset = 14 + 40 + len(palette)
+        rows = b''.join(
+            bytes(self.pixels[y * self.width:(y + 1) * self.width]).ljust(row_size, b'\0')
+            for y in reversed(range(self.height))
+        )
+        file_header = struct.pack('<2sIHHI', b'BM', data_offset + len(rows), 0, 0, data_offset)
+        info_header = struct.pack('<IiiHHIIiiII', 40, self.width, self.height, 1, 8, 0, len(rows), 2835, 2835,
+                                  len(self.palette), len(self.palette))
+        return file_header + info_header + palette + rows
+
+
+# Tiles are placed where code.py's labels used to put the same glyphs, so the board looks the same as it did
+def build_sheet(symbol_font, text_font):
+    bullets = [ROUTE_BULLETS[route_id] for route_id in ROUTE_IDS] + [UNKNOWN_BULLET]
+    bullets_per_row = SHEET_WIDTH // BULLET_SIZE
+    bullet_rows = -(-len(bullets) // bullets_per_row)
+    texts_per_row = SHEET_WIDTH // TEXT_WIDTH
+    text_rows = -(-(MAX_MINUTES + 1) // texts_per_row)
+
+    sheet = Sheet(SHEET_WIDTH, (bullet_rows + text_rows) * TILE_HEIGHT)
+    for i, (char, color) in enumerate(bullets):
+        x = i % bullets_per_row * BULLET_SIZE
+        y = i // bullets_per_row * TILE_HEIGHT
+        font = symbol_font if char in symbol_font else text_font
+        # Centered in the tile, rounding down to where the label used to put it
+        _, height, _, y_offset = font.glyphs[ord(char)].bbx
+        baseline = y + (TILE_HEIGHT - height + 1) // 2 + height + y_offset
+        sheet.draw_text(font, char, x + (BULLET_SIZE - font.width(char)) // 2, baseline, color)
+
+    # Countdowns start on the first row after the bullets, right aligned in their tile
+    for minutes in range(MAX_MINUTES + 1):
+        text = countdown_text(minutes)
+        tile = bullet_rows * texts_per_row + minutes
+        x = tile % texts_per_row * TEXT_WIDTH + TEXT_WIDTH - text_font.width(text)
+        y = tile // texts_per_row * TILE_HEIGHT
+        sheet.draw_text(text_font, text, x, y + text_font.ascent, NOW_COLOR if minutes == 0 else TEXT_COLOR)
+
+    return sheet, bullet_rows * texts_per_row
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rasterize route bullets and countdowns into a sprite sheet')
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    sheet, text_tile_base = build_sheet(Font(SYMBOL_FONT_PATH), Font(TEXT_FONT_PATH))
+    with open(args.output, 'wb') as f:
+        f.write(sheet.to_bmp())
+
+    print('Wrote {}x{} sheet with {} colors to {}'.format(sheet.width, sheet.height, len(sheet.palette), args.output))
+    print('Countdown tiles start at {} - code.py SPRITE_TEXT_TILE_BASE must match'.format(text_tile_base))
+
+
+if __name__ == '__main__':
+    main()
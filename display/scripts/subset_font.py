@@ -0,0 +1,245 @@
+# Build siji_mta.pcf - just the glyphs code.py draws from siji_mta.bdf, as a PCF.
+#
+# adafruit_bitmap_font has to scan a BDF line by line to find each glyph, and siji_mta.bdf carries hundreds of icons the
+# board never shows. A PCF subset is a few hundred bytes with an index the loader can seek straight into, so boot
+# reads next to nothing from flash and load_glyphs can pull in every glyph up front instead of stuttering on first use:
+#   python scripts/subset_font.py [--text CHARACTERS]
+#
+# Copy the resulting siji_mta.pcf to the root of CIRCUITPY next to code.py
+import argparse
+import os
+import struct
+
+DISPLAY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_PATH = os.path.join(DISPLAY_DIR, 'siji_mta.bdf')
+OUTPUT_PATH = os.path.join(DISPLAY_DIR, 'siji_mta.pcf')
+
+# What code.py draws with SYMBOL_FONT - the uptown and downtown arrows. Route bullets come from the sprite sheet
+# (see build_sprites.py). Keep in sync with SYMBOL_GLYPHS in code.py
+GLYPHS = '\ue12b\ue12c'
+
+PCF_PROPERTIES = 1 << 0
+PCF_ACCELERATORS = 1 << 1
+PCF_METRICS = 1 << 2
+PCF_BITMAPS = 1 << 3
+PCF_BDF_ENCODINGS = 1 << 5
+PCF_SWIDTHS = 1 << 6
+PCF_GLYPH_NAMES = 1 << 7
+PCF_BDF_ACCELERATORS = 1 << 8
+
+# Most significant byte and bit first, which is all adafruit_bitmap_font reads
+PCF_MSB_FIRST = 1 << 2 | 1 << 3
+# Bitmap rows padded to 4 bytes - the only bitmap format adafruit_bitmap_font reads
+PCF_GLYPH_PAD_4 = 2
+NO_GLYPH = 0xffff
+
+
+class Glyph:
+    def __init__(self, name):
+        self.name = name
+        self.encoding = None
+        self.swidth = 0
+        self.dwidth = 0
+        self.bbx = (0, 0, 0, 0)
+        self.rows = []
+
+    # (left side bearing, right side bearing, width, ascent, descent, attributes) as PCF stores them
+    @property
+    def metrics(self):
+        width, height, x_offset, y_offset = self.bbx
+        return x_offset, x_offset + width, self.dwidth, height + y_offset, -y_offset, 0
+
+
+def _property_value(value):
+    return value[1:-1].replace('""', '"') if value.startswith('"') else int(value)
+
+
+# Returns (properties, glyphs) from a BDF file
+def read_bdf(path):
+    properties = {}
+    glyphs = []
+    glyph = None
+    in_properties = False
+    in_bitmap = False
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            keyword, _, value = line.strip().partition(' ')
+            if keyword == 'STARTPROPERTIES':
+                in_properties = True
+            elif keyword == 'ENDPROPERTIES':
+                in_properties = False
+            elif in_properties and keyword != 'COMMENT':
+                properties[keyword] = _property_value(value)
+            elif keyword == 'STARTCHAR':
+                glyph = Glyph(value)
+            elif keyword == 'ENCODING':
+                glyph.encoding = int(value.split()[0])
+            elif keyword == 'SWIDTH':
+                glyph.swidth = int(value.split()[0])
+            elif keyword == 'DWIDTH':
+                glyph.dwidth = int(value.split()[0])
+            elif keyword == 'BBX':
+                glyph.bbx = tuple(int(number) for number in value.split())
+            elif keyword == 'BITMAP':
+                in_bitmap = True
+            elif keyword == 'ENDCHAR':
+                glyphs.append(glyph)
+                in_bitmap = False
+            elif in_bitmap:
+                glyph.rows.append(bytes.fromhex(keyword))
+
+    return properties, glyphs
+
+
+def _table(table_format, body):
+    return struct.pack('<I', table_format) + body
+
+
+def _pad4(data):
+    return data + b'\0' * (-len(data) % 4)
+
+
+def _properties_table(properties):
+    strings = bytearray()
+    offsets = {}
+
+    def string_offset(value):
+        if value not in offsets:
+            offsets[value] = len(strings)
+            strings.extend(value.encode() + b'\0')
+        return offsets[value]
+
+    entries = b''
+    for name, value in properties.items():
+        if isinstance(value, str):
+            entries += struct.pack('>IBI', string_offset(name), 1, string_offset(value))
+        else:
+            entries += struct.pack('>IBi', string_offset(name), 0, value)
+
+    # The pad is relative to the start of the table, which includes the 4 byte format
+    body = struct.pack('>I', len(properties)) + entries
+    body += b'\0' * (-(4 + len(body)) % 4)
+    return _table(PCF_MSB_FIRST, body + struct.pack('>I', len(strings)) + bytes(strings))
+
+
+def _accelerators_table(glyphs, properties):
+    all_metrics = [glyph.metrics for glyph in glyphs]
+    minbounds = [min(metrics[i] for metrics in all_metrics) for i in range(6)]
+    maxbounds = [max(metrics[i] for metrics in all_metrics) for i in range(6)]
+    constant_width = int(len({glyph.dwidth for glyph in glyphs}) == 1)
+    body = struct.pack(
+        '>BBBBBBBBiii',
+        0, 0, 0, constant_width, 0, 0, 0, 0,
+        properties.get('FONT_ASCENT', maxbounds[3]), properties.get('FONT_DESCENT', maxbounds[4]), 0
+    )
+    body += struct.pack('>5hH', *minbounds) + struct.pack('>5hH', *maxbounds)
+    return _table(PCF_MSB_FIRST, body)
+
+
+def _metrics_table(glyphs):
+    body = struct.pack('>I', len(glyphs)) + b''.join(struct.pack('>5hH', *glyph.metrics) for glyph in glyphs)
+    return _table(PCF_MSB_FIRST, body)
+
+
+def _bitmaps_table(glyphs):
+    data = b''
+    offsets = []
+    sizes = [0, 0, 0, 0]
+    for glyph in glyphs:
+        offsets.append(len(data))
+        width = glyph.bbx[0]
+        for row in glyph.rows:
+            data += row.ljust((width + 31) // 32 * 4, b'\0')[:(width + 31) // 32 * 4]
+        for pad in range(4):
+            sizes[pad] += len(glyph.rows) * -(-((width + 7) // 8) // (1 << pad)) * (1 << pad)
+
+    body = struct.pack('>I', len(glyphs)) + struct.pack('>{}I'.format(len(glyphs)), *offsets)
+    body += struct.pack('>4I', *sizes) + data
+    return _table(PCF_MSB_FIRST | PCF_GLYPH_PAD_4, body)
+
+
+def _encodings_table(glyphs, default_char):
+    indexes = {glyph.encoding: i for i, glyph in enumerate(glyphs)}
+    min_byte1 = min(encoding >> 8 for encoding in indexes)
+    max_byte1 = max(encoding >> 8 for encoding in indexes)
+    min_byte2 = min(encoding & 0xff for encoding in indexes)
+    max_byte2 = max(encoding & 0xff for encoding in indexes)
+
+    body = struct.pack('>4hH', min_byte2, max_byte2, min_byte1, max_byte1, default_char)
+    for byte1 in range(min_byte1, max_byte1 + 1):
+        for byte2 in range(min_byte2, max_byte2 + 1):
+            body += struct.pack('>H', indexes.get(byte1 << 8 | byte2, NO_GLYPH))
+    return _table(PCF_MSB_FIRST, body)
+
+
+def _swidths_table(glyphs):
+    return _table(PCF_MSB_FIRST, struct.pack('>I', len(glyphs)) + b''.join(
+        struct.pack('>i', glyph.swidth) for glyph in glyphs))
+
+
+def _glyph_names_table(glyphs):
+    offsets = []
+    strings = b''
+    for glyph in glyphs:
+        offsets.append(len(strings))
+        strings += glyph.name.encode() + b'\0'
+
+    body = struct.pack('>I', len(glyphs)) + struct.pack('>{}I'.format(len(glyphs)), *offsets)
+    return _table(PCF_MSB_FIRST, body + struct.pack('>I', len(strings)) + strings)
+
+
+def write_pcf(properties, glyphs):
+    encodings = [glyph.encoding for glyph in glyphs]
+    default_char = properties.get('DEFAULT_CHAR')
+    if default_char not in encodings:
+        default_char = encodings[0]
+    properties = dict(properties, DEFAULT_CHAR=default_char)
+
+    accelerators = _accelerators_table(glyphs, properties)
+    tables = [
+        (PCF_PROPERTIES, _properties_table(properties)),
+        (PCF_ACCELERATORS, accelerators),
+        (PCF_METRICS, _metrics_table(glyphs)),
+        (PCF_BITMAPS, _bitmaps_table(glyphs)),
+        (PCF_BDF_ENCODINGS, _encodings_table(glyphs, default_char)),
+        (PCF_SWIDTHS, _swidths_table(glyphs)),
+        (PCF_GLYPH_NAMES, _glyph_names_table(glyphs)),
+        (PCF_BDF_ACCELERATORS, accelerators),
+    ]
+
+    header = b'\x01fcp' + struct.pack('<I', len(tables))
+    offset = len(header) + 16 * len(tables)
+    toc = b''
+    body = b''
+    for table_type, table in tables:
+        table = _pad4(table)
+        toc += struct.pack('<IIII', table_type, struct.unpack_from('<I', table)[0], len(table), offset + len(body))
+        body += table
+
+    return header + toc + body
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Subset siji_mta.bdf to the glyphs the board uses and write a PCF')
+    parser.add_argument('--input', default=INPUT_PATH)
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    parser.add_argument('--text', default=GLYPHS, help='Characters to keep')
+    args = parser.parse_args()
+
+    properties, glyphs = read_bdf(args.input)
+    wanted = {ord(char) for char in args.text}
+    subset = sorted((glyph for glyph in glyphs if glyph.encoding in wanted), key=lambda glyph: glyph.encoding)
+    missing = wanted - {glyph.encoding for glyph in subset}
+    if missing:
+        parser.error('{} has no glyphs for {}'.format(args.input, ', '.join(hex(code) for code in sorted(missing))))
+
+    data = write_pcf(properties, subset)
+    with open(args.output, 'wb') as f:
+        f.write(data)
+
+    print('Kept {} of {} glyphs, {} bytes -> {} bytes in {}'.format(
+        len(subset), len(glyphs), os.path.getsize(args.input), len(data), args.output))
+
+
+if __name__ == '__main__':
+    main()